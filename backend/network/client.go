@@ -80,6 +80,10 @@ func (c *Client) readPump() {
 			c.handleListRooms()
 			continue
 		}
+		if typeCode == 1002 { // HEARTBEAT_REQ: echo the payload back so clients can measure RTT
+			c.SendJSON(map[string]interface{}{"type": 1002, "payload": req["payload"]})
+			continue
+		}
 
 		// Game Packets (Require Room)
 		if c.CurrentRoom == nil {
@@ -0,0 +1,360 @@
+"""Per-field bandwidth analyzer for server traffic, from a recording or live bots.
+
+Every frame is walked as JSON and its bytes attributed to paths (list elements fold into
+`path[]`), per packet type and direction; `key_bytes` is the part spent on repeated key
+names. For GAME_STATE_PUSH (3002) consecutive snapshots of the same connection are diffed:
+each path reports how often it actually changed, and every snapshot is re-sized under a few
+candidate encodings so the savings can be compared in bytes/s per player:
+
+    json          the frame as received
+    deflate       per-frame raw deflate (websocket permessage-deflate, no context takeover)
+    delta_json    only changed fields; lists of entities/players keyed by uid/session_id send
+                  changed fields per element plus removed ids, append-only lists send the tail
+    binary        protobuf-like: 1-byte field tags instead of key names, varints, float32
+    delta_binary  the delta in that binary form
+
+Estimates ignore keyframes / resync cost for the delta encodings.
+
+    cd frontend
+    python -m bench.bandwidth ~/echo_trace_20250101_120000.etrec
+    python -m bench.bandwidth --url ws://localhost:8080/ws --bots 8 --duration 30 --out ../bench_output/bw.json
+"""
+import argparse
+import collections
+import json
+import math
+import sys
+import threading
+import time
+import zlib
+
+from bench.common import environment_info, write_report
+from client.protocol import S2C
+
+_SAME = object()
+_ID_KEYS = ("uid", "session_id")
+ENCODINGS = ("json", "deflate", "delta_json", "binary", "delta_binary")
+
+
+def _jsize(v):
+    return len(json.dumps(v, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def walk(v, path, paths, key_bytes=0):
+    """Compact-JSON size of `v` plus its key; adds that (and the key part) per path into `paths`."""
+    if isinstance(v, dict):
+        size = 2 + max(0, len(v) - 1)
+        for k, child in v.items():
+            kb = _jsize(k) + 1
+            cp = f"{path}.{k}" if path else k
+            size += walk(child, cp, paths, kb)
+    elif isinstance(v, list):
+        size = 2 + max(0, len(v) - 1)
+        ep = path + "[]"
+        for child in v:
+            size += walk(child, ep, paths)
+    else:
+        size = _jsize(v)
+    size += key_bytes
+    p = paths[path]
+    p[0] += size
+    p[1] += key_bytes
+    return size
+
+
+def _varint(n):
+    n = (n << 1) ^ (n >> 63) if n < 0 else n << 1
+    return max(1, math.ceil(n.bit_length() / 7))
+
+
+def binary_size(v):
+    if isinstance(v, bool) or v is None:
+        return 1
+    if isinstance(v, int):
+        return _varint(v)
+    if isinstance(v, float):
+        return 4
+    if isinstance(v, str):
+        n = len(v.encode("utf-8"))
+        return _varint(n) + n
+    if isinstance(v, list):
+        body = sum(binary_size(x) for x in v)
+        return _varint(len(v)) + body
+    body = sum(1 + binary_size(x) for x in v.values())
+    return _varint(body) + body
+
+
+def _id_of(e):
+    if isinstance(e, dict):
+        for k in _ID_KEYS:
+            if k in e:
+                return e[k]
+    return None
+
+
+def _count(v, path, changes, changed=1):
+    """Count every sub-path of `v` as seen, and as changed if `changed` (it is sent whole); returns `v`."""
+    if isinstance(v, dict):
+        for k, x in v.items():
+            cp = f"{path}.{k}" if path else k
+            c = changes[cp]
+            c[0] += changed
+            c[1] += 1
+            _count(x, cp, changes, changed)
+    elif isinstance(v, list):
+        ep = path + "[]"
+        for e in v:
+            c = changes[ep]
+            c[0] += changed
+            c[1] += 1
+            _count(e, ep, changes, changed)
+    return v
+
+
+def diff(prev, cur, path, changes):
+    """Delta from `prev` to `cur` (or _SAME), counting changed / seen per path into `changes`."""
+    if isinstance(cur, dict) and isinstance(prev, dict):
+        out = {}
+        for k, v in cur.items():
+            cp = f"{path}.{k}" if path else k
+            d = diff(prev[k], v, cp, changes) if k in prev else _count(v, cp, changes)
+            c = changes[cp]
+            c[1] += 1
+            if d is not _SAME:
+                c[0] += 1
+                out[k] = d
+        for k in prev:
+            if k not in cur:
+                out[k] = None
+        return out if out else _SAME
+    if isinstance(cur, list) and isinstance(prev, list):
+        if cur == prev:
+            _count(cur, path, changes, 0)
+            return _SAME
+        if cur and all(_id_of(e) is not None for e in cur) and all(_id_of(e) is not None for e in prev):
+            # Keyed elements: per-element field deltas plus removed ids.
+            before = {_id_of(e): e for e in prev}
+            ep = path + "[]"
+            upd = []
+            for e in cur:
+                eid = _id_of(e)
+                d = diff(before.pop(eid), e, ep, changes) if eid in before else _count(e, ep, changes)
+                c = changes[ep]
+                c[1] += 1
+                if d is not _SAME:
+                    c[0] += 1
+                    if d is not e:
+                        for k in _ID_KEYS:
+                            if k in e:
+                                d[k] = e[k]
+                    upd.append(d)
+            out = {}
+            if upd:
+                out["upd"] = upd
+            if before:
+                out["del"] = list(before)
+            return out if out else _SAME
+        # Plain lists go out whole, or as the appended tail.
+        if len(cur) > len(prev) and cur[:len(prev)] == prev:
+            _count(prev, path, changes, 0)
+            return {"app": _count(cur[len(prev):], path, changes)}
+        return _count(cur, path, changes)
+    return _SAME if cur == prev else cur
+
+
+class StreamStats:
+    """Byte attribution for one connection. Doubles as a NetworkClient recorder (record_in/out)."""
+
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
+        self.types = collections.defaultdict(lambda: [0, 0])  # (dir, type) -> [frames, bytes]
+        self.paths = collections.defaultdict(lambda: collections.defaultdict(lambda: [0, 0]))
+        self.changes = collections.defaultdict(lambda: [0, 0])  # 3002 path -> [changed, seen]
+        self.enc = dict.fromkeys(ENCODINGS, 0)
+        self.snapshots = 0
+        self.t_first = None
+        self.t_last = None
+        self.prev = None
+        self.errors = 0
+        self._lock = threading.Lock()
+
+    def record_in(self, data):
+        self.feed(self.clock(), "in", data)
+
+    def record_out(self, data):
+        self.feed(self.clock(), "out", data)
+
+    def feed(self, t, direction, data):
+        raw = data.encode("utf-8") if isinstance(data, str) else bytes(data)
+        try:
+            msg = json.loads(raw)
+        except ValueError:
+            self.errors += 1
+            return
+        mt = msg.get("type") if isinstance(msg, dict) else None
+        with self._lock:
+            ty = self.types[(direction, mt)]
+            ty[0] += 1
+            ty[1] += len(raw)
+            walk(msg, "", self.paths[(direction, mt)])
+            if direction == "in" and mt == S2C.GAME_STATE_PUSH and isinstance(msg.get("payload"), dict):
+                self._snapshot(t, raw, msg["payload"])
+
+    def _snapshot(self, t, raw, payload):
+        if self.t_first is None:
+            self.t_first = t
+        self.t_last = t
+        self.snapshots += 1
+        enc = self.enc
+        enc["json"] += len(raw)
+        enc["deflate"] += len(zlib.compress(raw, 6)) - 6  # zlib header/trailer vs raw deflate
+        enc["binary"] += binary_size(payload)
+        if self.prev is None:
+            delta = payload
+        else:
+            delta = diff(self.prev, payload, "payload", self.changes)
+            if delta is _SAME:
+                delta = {}
+        enc["delta_json"] += _jsize({"type": S2C.GAME_STATE_PUSH, "payload": delta})
+        enc["delta_binary"] += binary_size(delta)
+        self.prev = payload
+
+    @property
+    def duration(self):
+        return (self.t_last - self.t_first) if self.snapshots > 1 else 0.0
+
+
+def report(streams, top=40):
+    """Merge per-connection stats into one JSON-able report."""
+    types = collections.defaultdict(lambda: [0, 0])
+    paths = collections.defaultdict(lambda: collections.defaultdict(lambda: [0, 0]))
+    changes = collections.defaultdict(lambda: [0, 0])
+    for s in streams:
+        for k, (n, b) in s.types.items():
+            types[k][0] += n
+            types[k][1] += b
+        for k, ps in s.paths.items():
+            for p, (b, kb) in ps.items():
+                paths[k][p][0] += b
+                paths[k][p][1] += kb
+        for p, (c, n) in s.changes.items():
+            changes[p][0] += c
+            changes[p][1] += n
+    timed = [s for s in streams if s.duration > 0]
+    seconds = sum(s.duration for s in timed)
+    # Per-second 3002 rates use the timed streams only, like the encodings below.
+    rate_bytes = collections.Counter()
+    for s in timed:
+        for p, (b, _) in s.paths.get(("in", S2C.GAME_STATE_PUSH), {}).items():
+            rate_bytes[p] += b
+
+    by_type = {}
+    for (direction, mt), (n, b) in sorted(types.items(), key=lambda kv: -kv[1][1]):
+        ps = paths[(direction, mt)]
+        rows = []
+        for p, (bytes_, kb) in sorted(ps.items(), key=lambda kv: -kv[1][0])[:top]:
+            if not p:
+                continue
+            row = {"path": p, "bytes": bytes_, "share": bytes_ / b if b else 0.0, "key_bytes": kb,
+                   "bytes_per_frame": bytes_ / n}
+            if direction == "in" and mt == S2C.GAME_STATE_PUSH:
+                if p in changes:
+                    c, seen = changes[p]
+                    row["change_rate"] = c / seen if seen else 0.0
+                if seconds:
+                    row["bytes_per_s_per_player"] = rate_bytes[p] / seconds
+            rows.append(row)
+        total_keys = sum(kb for _, kb in ps.values())
+        by_type[f"{direction}:{mt}"] = {"frames": n, "bytes": b, "bytes_per_frame": b / n if n else 0.0,
+                                        "key_bytes_share": total_keys / b if b else 0.0, "paths": rows}
+
+    enc = {e: sum(s.enc[e] for s in timed) for e in ENCODINGS}
+    encodings = {}
+    for e in ENCODINGS:
+        encodings[e] = {
+            "bytes": enc[e],
+            "bytes_per_s_per_player": enc[e] / seconds if seconds else 0.0,
+            "savings_vs_json": 1.0 - enc[e] / enc["json"] if enc["json"] else 0.0,
+        }
+    return {
+        "suite": "bandwidth",
+        "connections": len(streams),
+        "snapshots": sum(s.snapshots for s in streams),
+        "snapshot_seconds": seconds,
+        "parse_errors": sum(s.errors for s in streams),
+        "encodings_3002": encodings,
+        "change_rate_3002": {p: c / n for p, (c, n) in sorted(changes.items()) if n},
+        "types": by_type,
+    }
+
+
+def print_summary(rep, out=sys.stderr):
+    print(f"connections={rep['connections']} snapshots={rep['snapshots']} seconds={rep['snapshot_seconds']:.1f}", file=out)
+    for e, v in rep["encodings_3002"].items():
+        print(f"  {e:<13} {v['bytes_per_s_per_player'] / 1024.0:9.1f} KiB/s/player  savings {v['savings_vs_json'] * 100.0:5.1f}%", file=out)
+    t = rep["types"].get(f"in:{S2C.GAME_STATE_PUSH}")
+    if not t:
+        return
+    print(f"3002: {t['bytes_per_frame']:.0f} B/frame, {t['key_bytes_share'] * 100.0:.1f}% key names", file=out)
+    print(f"  {'path':<44}{'share':>7}{'B/frame':>10}{'keys':>7}{'changes':>9}", file=out)
+    for r in t["paths"]:
+        ch = r.get("change_rate")
+        print(f"  {r['path']:<44}{r['share'] * 100.0:6.1f}%{r['bytes_per_frame']:10.1f}"
+              f"{r['key_bytes'] / max(1, r['bytes']) * 100.0:6.0f}%{'' if ch is None else f'{ch * 100.0:8.1f}%':>9}", file=out)
+
+
+def analyze_recording(path):
+    from client.recording import DIR_IN, RecordingReader
+
+    stats = StreamStats()
+    with RecordingReader(path) as reader:
+        for pkt in reader:
+            stats.feed(pkt.t, "in" if pkt.direction == DIR_IN else "out", pkt.data)
+    return [stats]
+
+
+def analyze_live(args):
+    from bench.bot_fleet import Fleet
+
+    fleet = Fleet(args)
+    streams = []
+    for bot in fleet.bots:
+        bot.net.recorder = StreamStats()
+        streams.append(bot.net.recorder)
+    try:
+        fleet.run()
+    except KeyboardInterrupt:
+        for bot in fleet.bots:
+            bot.stop()
+    return streams
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("recording", nargs="?", help="session recording (.etrec); omit to run live bots against --url")
+    ap.add_argument("--url", default="ws://localhost:8080/ws")
+    ap.add_argument("--bots", type=int, default=4)
+    ap.add_argument("--rooms", type=int, default=1)
+    ap.add_argument("--join", default="", help="comma-separated existing room ids")
+    ap.add_argument("--room-prefix", default="bw")
+    ap.add_argument("--behaviors", default="wander,loot,fight,trade,extract")
+    ap.add_argument("--duration", type=float, default=30.0)
+    ap.add_argument("--ramp", type=float, default=1.0)
+    ap.add_argument("--hz", type=float, default=10.0)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--report", type=float, default=0.0, help="fleet progress interval in seconds (0 = off)")
+    ap.add_argument("--top", type=int, default=40, help="paths listed per packet type")
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    streams = analyze_recording(args.recording) if args.recording else analyze_live(args)
+    rep = report(streams, top=args.top)
+    rep["source"] = args.recording or args.url
+    rep["env"] = environment_info()
+    print_summary(rep)
+    write_report(rep, args.out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,346 @@
+"""Headless bot fleet for server load testing.
+
+Each bot is a real client.network.NetworkClient + client.gamestate.GameState (no pygame) driven
+by a scripted behavior. One driver thread steps every bot at --hz; the websocket threads only
+receive. Bots are spread over --rooms rooms (the first bot of each room creates it) or join
+the rooms given with --join.
+
+Reported from the client's point of view: snapshot rate per bot, 3002 inter-arrival time and
+jitter, heartbeat RTT (1002 echo; servers that don't answer it report n=0), error pushes
+(4001) and disconnects.
+
+    cd frontend
+    python -m bench.bot_fleet --url ws://localhost:8080/ws --bots 200 --rooms 13 --duration 60
+    python -m bench.bot_fleet --bots 32 --behaviors loot,fight --out ../bench_output/fleet.json
+"""
+import argparse
+import collections
+import math
+import queue
+import random
+import statistics
+import sys
+import time
+
+from bench.common import environment_info, summarize_ms, write_report
+from client.gamestate import GameState
+from client.network import NetworkClient
+
+BEHAVIORS = ("wander", "loot", "fight", "trade", "extract")
+HEARTBEAT_INTERVAL = 1.0
+STUCK_SECONDS = 1.0
+
+
+class _StampedQueue(queue.Queue):
+    """recv_queue that records arrival time on the network thread, before driver scheduling."""
+
+    def put(self, item, block=True, timeout=None):
+        super().put((time.perf_counter(), item), block, timeout)
+
+
+class Bot:
+    def __init__(self, idx, url, behavior, room_key, rng):
+        self.idx = idx
+        self.name = f"Bot_{idx:03d}"
+        self.behavior = behavior
+        self.room_key = room_key
+        self.rng = rng
+        self.q = _StampedQueue()
+        self.net = NetworkClient(url, self.q, player_name=self.name)
+        self.state = GameState()
+        self.room_id = ""
+        self.joined_at = None
+        self.started_at = None
+        self.requested = False
+        self.was_connected = False
+        # Metrics
+        self.snapshots = 0
+        self.first_snap = None
+        self.last_snap = None
+        self.inter_arrival = []
+        self.rtts = []
+        self.errors = collections.Counter()
+        self.disconnects = 0
+        # Behavior state
+        self.dir = (0.0, 0.0)
+        self.look = (1.0, 0.0)
+        self.next_turn = 0.0
+        self.next_heartbeat = 0.0
+        self.next_action = 0.0
+        self.last_pos = None
+        self.last_moved = 0.0
+        self.unstick_until = 0.0
+
+    def start(self, room_id=""):
+        if room_id:
+            # NetworkClient re-sends JOIN_ROOM on every (re)connect.
+            self.net.set_auto_join(room_id)
+            self.requested = True
+        self.started_at = time.perf_counter()
+        self.net.start()
+
+    def stop(self):
+        self.net.running = False
+        try:
+            if self.net.ws:
+                self.net.ws.close()
+        except Exception:
+            pass
+
+    # --- network ---
+
+    def drain(self, now):
+        while True:
+            try:
+                ts, msg = self.q.get_nowait()
+            except queue.Empty:
+                break
+            mt, pl = msg.get("type"), msg.get("payload")
+            if mt == 3002 and isinstance(pl, dict):
+                if self.last_snap is not None:
+                    self.inter_arrival.append(ts - self.last_snap)
+                else:
+                    self.first_snap = ts
+                self.last_snap = ts
+                self.snapshots += 1
+                self.state.update_from_server(pl)
+            elif mt == 3001 and isinstance(pl, dict):
+                self.state.load_map(pl)
+            elif mt == 1012 and isinstance(pl, dict):
+                self.room_id = str(pl.get("room_id") or "")
+                self.joined_at = ts
+                self.net.set_auto_join(self.room_id)
+                self.net.send({"type": 1001, "payload": {"name": self.name}})
+                self.net.send({"type": 2006, "payload": {"tactic": self.rng.choice(("RECON", "DEFENSE", "TRAP"))}})
+            elif mt == 1001 and isinstance(pl, dict):
+                sid = str(pl.get("session_id") or "")
+                if sid:
+                    self.net.set_identity(session_id=sid)
+            elif mt == 1002 and isinstance(pl, dict) and "bot_ts" in pl:
+                self.rtts.append(ts - float(pl["bot_ts"]))
+            elif mt == 4001:
+                self.errors[str(pl.get("msg") if isinstance(pl, dict) else pl)] += 1
+        connected = self.net.connected
+        if self.was_connected and not connected:
+            self.disconnects += 1
+        self.was_connected = connected
+
+    def create_room(self, name, max_players):
+        if self.net.connected and not self.requested:
+            self.requested = True
+            self.net.send({"type": 1010, "payload": {"room_name": name, "name": self.name, "max_players": max_players}})
+
+    # --- behavior ---
+
+    def _nearest(self, types):
+        mx, my = self.state.my_pos
+        best, bd = None, 1e18
+        for e in self.state.entities:
+            if e.get("type") in types:
+                d = (e["pos"]["x"] - mx) ** 2 + (e["pos"]["y"] - my) ** 2
+                if d < bd:
+                    best, bd = e, d
+        return best, math.sqrt(bd) if best else None
+
+    def _toward(self, x, y):
+        mx, my = self.state.my_pos
+        dx, dy = x - mx, y - my
+        d = math.hypot(dx, dy) or 1.0
+        return dx / d, dy / d
+
+    def _wander(self, now):
+        if now >= self.next_turn:
+            a = self.rng.uniform(0, math.tau)
+            self.dir = (math.cos(a), math.sin(a))
+            self.next_turn = now + self.rng.uniform(1.0, 3.0)
+        return self.dir
+
+    def _send_slot(self, mtype, want_type=None):
+        for i, it in enumerate(self.state.my_inventory):
+            if want_type is None or it.get("type") == want_type:
+                self.net.send({"type": mtype, "payload": {"slot_index": i}})
+                return True
+        return False
+
+    def step(self, now):
+        st = self.state
+        if now >= self.next_heartbeat and self.net.connected:
+            self.next_heartbeat = now + HEARTBEAT_INTERVAL
+            self.net.send({"type": 1002, "payload": {"bot_ts": time.perf_counter()}})
+        if not self.room_id or st.phase < 1 or st.my_hp <= 0 or st.is_extracted:
+            return
+        # No pathfinding: if a straight-line chase stops making progress, wander for a while.
+        pos = tuple(st.my_pos)
+        if self.last_pos is None or abs(pos[0] - self.last_pos[0]) + abs(pos[1] - self.last_pos[1]) > 0.1:
+            self.last_pos, self.last_moved = pos, now
+        elif now - self.last_moved > STUCK_SECONDS and now >= self.unstick_until:
+            self.unstick_until = now + self.rng.uniform(0.5, 1.5)
+            self.next_turn = 0.0
+            self.last_moved = now
+        act = now >= self.next_action
+        b = self.behavior
+        d = None
+        if now >= self.unstick_until:
+            if b == "loot":
+                e, dist = self._nearest(("ITEM_DROP", "SUPPLY_DROP"))
+                if e:
+                    d = self._toward(e["pos"]["x"], e["pos"]["y"])
+                    if dist < 1.0 and act:
+                        self.net.send({"type": 2004, "payload": {}})
+            elif b == "fight":
+                target, td = None, 1e18
+                for p in st.players.values():
+                    pd = math.hypot(p["pos"]["x"] - st.my_pos[0], p["pos"]["y"] - st.my_pos[1])
+                    if pd < td:
+                        target, td = p, pd
+                if target:
+                    d = self._toward(target["pos"]["x"], target["pos"]["y"])
+                    self.look = d
+                    if td < 5.0 and act:
+                        self._send_slot(2002, "OFFENSE")
+                elif act:
+                    self.net.send({"type": 2004, "payload": {}})
+            elif b == "trade":
+                e, dist = self._nearest(("MERCHANT",))
+                if e:
+                    d = self._toward(e["pos"]["x"], e["pos"]["y"])
+                    if dist < 3.0 and act:
+                        if len(st.my_inventory) >= st.inventory_cap:
+                            self._send_slot(2008)
+                        elif st.shop_stock:
+                            self.net.send({"type": 2007, "payload": {"item_id": self.rng.choice(st.shop_stock)}})
+            elif b == "extract" and st.phase >= 3:
+                e, dist = self._nearest(("EXIT",))
+                if e:
+                    d = self._toward(e["pos"]["x"], e["pos"]["y"])
+                    if dist < 2.0 and act:
+                        self.net.send({"type": 2003, "payload": {}})
+        if act:
+            self.next_action = now + 0.5
+        if d is None:
+            d = self._wander(now)
+        if b != "fight":
+            self.look = d
+        self.net.send({"type": 2001, "payload": {"dir": {"x": float(d[0]), "y": float(d[1])}, "look_dir": {"x": float(self.look[0]), "y": float(self.look[1])}}})
+
+
+class Fleet:
+    def __init__(self, args):
+        self.args = args
+        rng = random.Random(args.seed)
+        behaviors = [b for b in args.behaviors.split(",") if b in BEHAVIORS] or list(BEHAVIORS)
+        joins = [r for r in args.join.split(",") if r]
+        n_rooms = len(joins) or max(1, args.rooms)
+        self.create_rooms = not joins
+        self.room_ids = dict(enumerate(joins))
+        self.room_names = {k: f"{args.room_prefix}-{k + 1}" for k in range(n_rooms)}
+        self.per_room = max(1, math.ceil(args.bots / n_rooms))
+        self.bots = [Bot(i, args.url, behaviors[i % len(behaviors)], i % n_rooms, random.Random(rng.random())) for i in range(args.bots)]
+
+    def _leader(self, bot):
+        # Bot k (k < rooms) creates room k; room_key is idx % rooms.
+        return self.create_rooms and bot.idx < len(self.room_names)
+
+    def run(self):
+        a = self.args
+        t0 = time.perf_counter()
+        end = t0 + a.ramp + a.duration
+        pending = list(self.bots)
+        step_dt = 1.0 / max(1.0, a.hz)
+        last_report = t0
+        while time.perf_counter() < end:
+            now = time.perf_counter()
+            due = int(len(self.bots) * min(1.0, (now - t0) / a.ramp)) if a.ramp > 0 else len(self.bots)
+            for bot in list(pending):
+                if bot.idx >= max(due, 1):
+                    break
+                rid = self.room_ids.get(bot.room_key)
+                if rid:
+                    bot.start(rid)
+                elif self._leader(bot):
+                    bot.start()
+                else:
+                    continue
+                pending.remove(bot)
+            for bot in self.bots:
+                if bot.started_at is None:
+                    continue
+                bot.drain(now)
+                if self._leader(bot) and bot.room_key not in self.room_ids:
+                    bot.create_room(self.room_names[bot.room_key], self.per_room)
+                    if bot.room_id:
+                        self.room_ids[bot.room_key] = bot.room_id
+                bot.step(now)
+            if a.report and now - last_report >= a.report:
+                last_report = now
+                live = sum(1 for b in self.bots if b.net.connected)
+                print(f"[fleet] t={now - t0:5.1f}s started={len(self.bots) - len(pending)} connected={live} "
+                      f"in_room={sum(1 for b in self.bots if b.room_id)} snapshots={sum(b.snapshots for b in self.bots)}", file=sys.stderr)
+            time.sleep(max(0.0, step_dt - (time.perf_counter() - now)))
+        for bot in self.bots:
+            bot.stop()
+
+    def report(self):
+        rates, ia, rtts, jitter, join = [], [], [], [], []
+        errors = collections.Counter()
+        for b in self.bots:
+            if b.snapshots > 1 and b.last_snap > b.first_snap:
+                rates.append((b.snapshots - 1) / (b.last_snap - b.first_snap))
+            ia.extend(b.inter_arrival)
+            if len(b.inter_arrival) > 1:
+                jitter.append(statistics.pstdev(b.inter_arrival))
+            rtts.extend(b.rtts)
+            errors.update(b.errors)
+            if b.joined_at is not None and b.started_at is not None:
+                join.append(b.joined_at - b.started_at)
+        rates.sort()
+        return {
+            "suite": "bot_fleet",
+            "env": environment_info(),
+            "params": {k: v for k, v in vars(self.args).items()},
+            "bots": len(self.bots),
+            "joined": sum(1 for b in self.bots if b.room_id),
+            "disconnects": sum(b.disconnects for b in self.bots),
+            "snapshots": sum(b.snapshots for b in self.bots),
+            "snapshot_rate_hz": {
+                "mean": (sum(rates) / len(rates)) if rates else 0.0,
+                "min": rates[0] if rates else 0.0,
+                "p50": rates[len(rates) // 2] if rates else 0.0,
+            },
+            "inter_arrival": summarize_ms(ia),
+            "jitter_stdev": summarize_ms(jitter),
+            "rtt": summarize_ms(rtts),
+            "join_latency": summarize_ms(join),
+            "errors": {"total": sum(errors.values()), "top": errors.most_common(10)},
+            "by_behavior": {bh: sum(1 for b in self.bots if b.behavior == bh) for bh in BEHAVIORS},
+        }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--url", default="ws://localhost:8080/ws")
+    ap.add_argument("--bots", type=int, default=16)
+    ap.add_argument("--rooms", type=int, default=1, help="rooms to create (ignored with --join)")
+    ap.add_argument("--join", default="", help="comma-separated existing room ids to spread bots over")
+    ap.add_argument("--room-prefix", default="fleet")
+    ap.add_argument("--behaviors", default=",".join(BEHAVIORS), help="assigned round-robin; any of " + ",".join(BEHAVIORS))
+    ap.add_argument("--duration", type=float, default=30.0, help="seconds after ramp-up")
+    ap.add_argument("--ramp", type=float, default=5.0, help="seconds over which bots are started")
+    ap.add_argument("--hz", type=float, default=10.0, help="bot decision/move-send rate")
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--report", type=float, default=5.0, help="progress interval in seconds (0 = off)")
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    fleet = Fleet(args)
+    try:
+        fleet.run()
+    except KeyboardInterrupt:
+        for bot in fleet.bots:
+            bot.stop()
+    write_report(fleet.report(), args.out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,168 @@
+# Shared helpers for the client benchmark suites.
+# Run the suites from the frontend/ directory, e.g.  python -m bench.frame_bench --quick
+
+import json
+import math
+import os
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+
+FRONTEND_DIR = Path(__file__).resolve().parents[1]
+REPO_ROOT = FRONTEND_DIR.parent
+
+
+def setup_headless():
+    """Point SDL at the dummy drivers and make `client.*` / relative asset paths resolve."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    if str(FRONTEND_DIR) not in sys.path:
+        sys.path.insert(0, str(FRONTEND_DIR))
+    os.chdir(FRONTEND_DIR)
+
+
+def make_renderer():
+    import pygame
+    from client.config import WINDOW_WIDTH, WINDOW_HEIGHT
+    from client.renderer import Renderer
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    r = Renderer(screen)
+    # Fixtures swap maps every case; a background PVS build per map would skew the timings.
+    r.pvs_enabled = False
+    return r
+
+
+ENTITY_TYPES = ("ITEM_DROP", "ITEM_DROP", "ITEM_DROP", "MOTOR", "SUPPLY_DROP", "MERCHANT", "EXIT")
+
+
+def make_tiles(w, h, rng, wall_density=0.2):
+    tiles = [[1 if rng.random() < wall_density else 0 for _ in range(w)] for _ in range(h)]
+    for x in range(w):
+        tiles[0][x] = tiles[h - 1][x] = 1
+    for y in range(h):
+        tiles[y][0] = tiles[y][w - 1] = 1
+    return tiles
+
+
+def _free_pos(tiles, rng, near=None, radius=None):
+    h, w = len(tiles), len(tiles[0])
+    for _ in range(200):
+        if near is not None:
+            x = near[0] + rng.uniform(-radius, radius)
+            y = near[1] + rng.uniform(-radius, radius)
+        else:
+            x = rng.uniform(1, w - 1)
+            y = rng.uniform(1, h - 1)
+        gx, gy = int(x), int(y)
+        if 0 <= gx < w and 0 <= gy < h and tiles[gy][gx] == 0:
+            return x, y
+    return w / 2.0, h / 2.0
+
+
+def make_snapshot(map_size, entities, players, seed=1, tiles=None, view_radius=8.0):
+    """Synthetic 3001 + 3002 payload pair shaped like backend/logic GetSnapshot output.
+
+    Half of the entities and all other players are placed within a few tiles of `self` so
+    visibility/LOS paths are exercised, the rest are spread over the map.
+    """
+    rng = random.Random(seed)
+    tiles = tiles or make_tiles(map_size, map_size, rng)
+    me = _free_pos(tiles, rng)
+    ents = []
+    for i in range(entities):
+        near = i % 2 == 0
+        x, y = _free_pos(tiles, rng, me if near else None, view_radius)
+        t = ENTITY_TYPES[i % len(ENTITY_TYPES)]
+        e = {"uid": f"e{i}", "type": t, "pos": {"x": x, "y": y}, "state": 1}
+        if t == "MOTOR":
+            e["extra"] = {"progress": rng.uniform(0, 100), "max_progress": 100.0}
+        ents.append(e)
+    others = []
+    for i in range(max(0, players - 1)):
+        x, y = _free_pos(tiles, rng, me, view_radius)
+        others.append({
+            "session_id": f"p{i}", "name": f"Bot_{i}", "pos": {"x": x, "y": y}, "look_dir": {"x": 1.0, "y": 0.0},
+            "hp": 80.0, "max_hp": 100.0, "move_speed": 4.0, "view_radius": view_radius, "hear_radius": 12.0,
+            "is_alive": True, "tactic": "RECON", "inventory_cap": 6, "max_weight": 10.0, "weight": 2.0, "funds": 100,
+            "inventory": [], "shop_stock": [], "channeling_target": "", "is_extracting": False,
+            "extraction_timer": 0.0, "is_extracted": False,
+        })
+    start = {"map_width": map_size, "map_height": map_size, "spawn_pos": {"x": me[0], "y": me[1]}, "map_tiles": tiles, "inventory": []}
+    snap = {
+        "timestamp": 0, "phase": 2, "time_left": 120.0,
+        "events": [{"type": "PHASE_CHANGE", "msg": f"Event {i}"} for i in range(5)],
+        "self": {
+            "session_id": "self", "name": "Agent_07", "pos": {"x": me[0], "y": me[1]}, "look_dir": {"x": 1.0, "y": 0.0},
+            "hp": 100.0, "max_hp": 100.0, "move_speed": 4.0, "view_radius": view_radius, "hear_radius": 12.0,
+            "is_alive": True, "tactic": "RECON", "inventory_cap": 6, "max_weight": 10.0, "weight": 3.0, "funds": 250,
+            "inventory": [{"uid": f"i{i}", "id": "SURV_BANDAGE", "type": "SURVIVAL", "name": "Bandage", "tier": 1,
+                           "max_uses": 1, "weight": 0.5, "value": 40} for i in range(6)],
+            "shop_stock": ["WPN_SHOCK_T1", "SURV_BANDAGE", "RECON_AMP_T1", "WPN_STONE", "SURV_ENERGY_BAR", "WPN_KNIFE_T2"],
+            "channeling_target": "", "is_extracting": False, "extraction_timer": 0.0, "is_extracted": False,
+        },
+        "vision": {"players": others, "entities": ents},
+        "radar_blips": [{"type": "MOTOR", "pos": e["pos"]} for e in ents if e["type"] == "MOTOR"][:50],
+        "sound": {"events": [{"type": "FOOTSTEP", "dir": {"x": math.cos(i), "y": math.sin(i)}, "intensity": 0.5} for i in range(max(0, players - 1))]},
+    }
+    return start, snap
+
+
+def make_state(map_size, entities, players, seed=1):
+    from client.gamestate import GameState
+    start, snap = make_snapshot(map_size, entities, players, seed=seed)
+    st = GameState()
+    st.load_map(start)
+    st.update_from_server(snap)
+    return st
+
+
+def percentile(sorted_vals, q):
+    if not sorted_vals:
+        return 0.0
+    k = (len(sorted_vals) - 1) * q
+    lo = int(math.floor(k))
+    hi = min(len(sorted_vals) - 1, lo + 1)
+    return sorted_vals[lo] + (sorted_vals[hi] - sorted_vals[lo]) * (k - lo)
+
+
+def summarize_ms(samples_s):
+    v = sorted(x * 1000.0 for x in samples_s)
+    n = len(v)
+    return {
+        "n": n,
+        "mean_ms": (sum(v) / n) if n else 0.0,
+        "p50_ms": percentile(v, 0.50),
+        "p95_ms": percentile(v, 0.95),
+        "p99_ms": percentile(v, 0.99),
+        "max_ms": v[-1] if n else 0.0,
+    }
+
+
+def parse_int_list(s):
+    return [int(x) for x in str(s).split(",") if x.strip()]
+
+
+def environment_info():
+    info = {"python": sys.version.split()[0], "platform": platform.platform(), "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+    try:
+        import pygame
+        info["pygame"] = pygame.version.ver
+        info["sdl"] = ".".join(str(x) for x in pygame.get_sdl_version())
+    except Exception:
+        pass
+    return info
+
+
+def write_report(report, out_path=None):
+    text = json.dumps(report, ensure_ascii=False, indent=1)
+    if out_path:
+        Path(out_path).parent.mkdir(parents=True, exist_ok=True)
+        with open(out_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        print(f"wrote {out_path}", file=sys.stderr)
+    else:
+        print(text)
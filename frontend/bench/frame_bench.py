@@ -0,0 +1,109 @@
+"""Headless whole-frame benchmark for Renderer.draw_game.
+
+Drives draw_game under SDL's dummy video driver over a sweep of synthetic GameState
+fixtures and prints a JSON report with per-frame p50/p95/p99 and a per-stage breakdown
+(the stages marked inside draw_game via client.profiling.StageTimer).
+
+    cd frontend
+    python -m bench.frame_bench --quick
+    python -m bench.frame_bench --maps 16,48,256 --entities 0,100,1000 --players 1,16 --out ../bench_output/frame.json
+"""
+import argparse
+import itertools
+import math
+import sys
+
+from bench.common import setup_headless, make_renderer, make_state, summarize_ms, parse_int_list, environment_info, write_report
+
+DEFAULT_MAPS = "16,32,48,64,128,256"
+DEFAULT_ENTITIES = "0,10,100,1000"
+DEFAULT_PLAYERS = "1,4,16"
+# fog: FOV mask pass on/off; dev: dev_mode on/off. dev_mode itself disables fog, so fog=on,dev=on
+# can't happen in the client; fog=off,dev=off uses spectator_mode to skip the mask. dashboard is
+# the extracted-spectator follow-cam grid (one panel per player plus the overview).
+MODES = (("fog", True, False), ("nofog", False, False), ("dev", False, True), ("dashboard", False, False))
+
+
+def configure(renderer, state, mode, fog, dev):
+    renderer.state = "GAME"
+    renderer.dev_mode = dev
+    renderer.spectator_mode = (not fog) and (not dev)
+    renderer.spectator_dashboard = mode == "dashboard"
+    state.is_extracted = mode == "dashboard"
+    renderer.show_shop = False
+
+
+def run_case(renderer, state, frames, warmup, timer):
+    import pygame
+    totals = []
+    stages = {}
+    base_angle = renderer.look_angle
+    for i in range(warmup + frames):
+        # Sweep the look direction so the FOV wedge and visibility set change every frame.
+        renderer.look_angle = base_angle + (i * 2.0 * math.pi / 90.0)
+        timer.begin_frame()
+        renderer.draw_game(state)
+        pygame.display.flip()
+        timer.mark("flip")
+        res = timer.end_frame()
+        if i < warmup:
+            continue
+        totals.append(res.pop("total"))
+        for k, v in res.items():
+            stages.setdefault(k, []).append(v)
+    out = summarize_ms(totals)
+    out["stages"] = {k: summarize_ms(v) for k, v in stages.items()}
+    return out
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--maps", default=DEFAULT_MAPS)
+    ap.add_argument("--entities", default=DEFAULT_ENTITIES)
+    ap.add_argument("--players", default=DEFAULT_PLAYERS)
+    ap.add_argument("--modes", default=",".join(m[0] for m in MODES))
+    ap.add_argument("--frames", type=int, default=120)
+    ap.add_argument("--warmup", type=int, default=10)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--render-scale", type=float, default=1.0)
+    ap.add_argument("--fog-mask-scale", type=float, default=None)
+    ap.add_argument("--quick", action="store_true", help="small sweep for smoke runs")
+    ap.add_argument("--out", default=None, help="write JSON here instead of stdout")
+    args = ap.parse_args(argv)
+
+    if args.quick:
+        args.maps, args.entities, args.players, args.frames = "16,48,256", "0,100,1000", "1,16", 30
+
+    setup_headless()
+    from client.profiling import StageTimer
+    renderer = make_renderer()
+    renderer.render_scale = args.render_scale
+    if args.fog_mask_scale is not None:
+        renderer.fog_mask_scale = args.fog_mask_scale
+    timer = StageTimer()
+    renderer.stage_timer = timer
+
+    modes = [m for m in MODES if m[0] in args.modes.split(",")]
+    cases = []
+    for map_size, n_ent, n_pl, (mode, fog, dev) in itertools.product(
+            parse_int_list(args.maps), parse_int_list(args.entities), parse_int_list(args.players), modes):
+        state = make_state(map_size, n_ent, n_pl, seed=args.seed)
+        configure(renderer, state, mode, fog, dev)
+        res = run_case(renderer, state, args.frames, args.warmup, timer)
+        res.update({"map": map_size, "entities": n_ent, "players": n_pl, "mode": mode, "fog": fog, "dev": dev})
+        cases.append(res)
+        print(f"map={map_size:<4} ent={n_ent:<5} pl={n_pl:<3} {mode:<6} p50={res['p50_ms']:.2f}ms p99={res['p99_ms']:.2f}ms", file=sys.stderr)
+
+    report = {
+        "suite": "frame",
+        "env": environment_info(),
+        "params": {"frames": args.frames, "warmup": args.warmup, "seed": args.seed,
+                   "render_scale": args.render_scale, "fog_mask_scale": renderer.fog_mask_scale},
+        "cases": cases,
+    }
+    write_report(report, args.out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
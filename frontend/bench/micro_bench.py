@@ -0,0 +1,251 @@
+"""Micro-benchmarks for the client's inner loops.
+
+Each benchmark runs over a parameter sweep; per case we time `repeat` batches of `number`
+calls and report per-call median/min in microseconds. Results go to JSON so runs can be
+kept and compared:
+
+    cd frontend
+    python -m bench.micro_bench --out ../bench_output/micro_base.json
+    python -m bench.micro_bench --compare ../bench_output/micro_base.json
+    python -m bench.micro_bench --only raycast,los
+"""
+import argparse
+import json
+import math
+import random
+import sys
+import time
+
+from bench.common import REPO_ROOT, setup_headless, make_renderer, make_snapshot, make_tiles, environment_info, write_report
+
+
+def measure(fn, number, repeat):
+    per_call = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        per_call.append((time.perf_counter() - t0) / number)
+    per_call.sort()
+    return {"median_us": per_call[len(per_call) // 2] * 1e6, "min_us": per_call[0] * 1e6, "number": number, "repeat": repeat}
+
+
+def _rand_free(tiles, rng):
+    h, w = len(tiles), len(tiles[0])
+    while True:
+        x, y = rng.uniform(1, w - 1), rng.uniform(1, h - 1)
+        if tiles[int(y)][int(x)] == 0:
+            return x, y
+
+
+def _cycler(items):
+    state = {"i": 0}
+    n = len(items)
+
+    def nxt():
+        i = state["i"]
+        state["i"] = (i + 1) % n
+        return items[i]
+    return nxt
+
+
+def bench_raycast(r, scale):
+    for size in (16, 48, 256):
+        rng = random.Random(size)
+        tiles = make_tiles(size, size, rng)
+        for max_dist in (5.0, 10.0, 20.0):
+            args = []
+            for _ in range(256):
+                a = rng.uniform(0, 2 * math.pi)
+                args.append((_rand_free(tiles, rng), (math.cos(a), math.sin(a))))
+            nxt = _cycler(args)
+
+            def call():
+                o, d = nxt()
+                r._raycast_to_wall(o, d, max_dist, tiles)
+            yield {"map": size, "max_dist": max_dist}, call, 200 * scale
+
+
+def bench_los(r, scale):
+    for size in (48, 256):
+        rng = random.Random(size)
+        tiles = make_tiles(size, size, rng)
+        for dist in (2.0, 5.0, 10.0, 20.0):
+            args = []
+            for _ in range(256):
+                o = _rand_free(tiles, rng)
+                a = rng.uniform(0, 2 * math.pi)
+                args.append((o, (o[0] + math.cos(a) * dist, o[1] + math.sin(a) * dist)))
+            nxt = _cycler(args)
+
+            def call():
+                o, t = nxt()
+                r._has_line_of_sight(o, t, tiles)
+            yield {"map": size, "dist": dist}, call, 200 * scale
+
+
+def bench_visible(r, scale):
+    from bench.common import make_state
+    from client.config import PVS_MIN_RADIUS
+    from client.pvs import build_pvs
+    for view_radius in (5.0, 12.0, 20.0):
+        st = make_state(48, 0, 1, seed=3)
+        st.view_radius = view_radius
+        rng = random.Random(7)
+        pts = [(st.my_pos[0] + rng.uniform(-view_radius, view_radius), st.my_pos[1] + rng.uniform(-view_radius, view_radius)) for _ in range(256)]
+        # The renderer only consults a table from PVS_MIN_RADIUS up.
+        for pvs in ((None, build_pvs(st.map_tiles, view_radius)) if view_radius >= PVS_MIN_RADIUS else (None,)):
+            nxt = _cycler(pts)
+
+            def call(pvs=pvs):
+                r.pvs = pvs
+                x, y = nxt()
+                r._is_world_pos_visible(st, x, y)
+            yield {"view_radius": view_radius, "pvs": pvs is not None}, call, 500 * scale
+    r.pvs = None
+
+
+def bench_fov_polygon(r, scale):
+    from bench.common import make_state
+    st = make_state(48, 0, 1, seed=3)
+    for rays in (60, 120, 240):
+        for blocked in (False, True):
+            for view_radius in (5.0, 15.0):
+                st.view_radius = view_radius
+
+                def call(rays=rays, blocked=blocked):
+                    r.fov_ray_count = rays
+                    r.fov_blocked_by_walls = blocked
+                    r._compute_fov_polygon_screen(st)
+                yield {"rays": rays, "blocked": blocked, "view_radius": view_radius}, call, 20 * scale
+    r.fov_ray_count = 120
+    r.fov_blocked_by_walls = False
+
+
+def bench_update_from_server(r, scale):
+    from client.gamestate import GameState
+    for ents, players in ((0, 1), (100, 6), (1000, 16)):
+        _, snap = make_snapshot(48, ents, players)
+        # Round-trip through JSON so the payload has the same shape/objects as a decoded packet.
+        snap = json.loads(json.dumps(snap))
+        st = GameState()
+
+        def call():
+            st.update_from_server(snap)
+        yield {"entities": ents, "players": players}, call, 200 * scale
+
+
+def bench_ripples(r, scale):
+    # One rendered frame at 60 fps with a 20 Hz snapshot: every third call ingests a fresh
+    # sound list (one FOOTSTEP per other player, directions drifting) before drawing.
+    from client.ripples import RipplePool
+    for players in (2, 6, 16):
+        rng = random.Random(players)
+        ticks = []
+        for k in range(60):
+            evs = []
+            for i in range(players - 1):
+                a = i * 2.0 * math.pi / max(1, players - 1) + rng.uniform(-0.3, 0.3)
+                evs.append({"type": "FOOTSTEP", "dir": {"x": math.cos(a), "y": math.sin(a)}, "intensity": rng.uniform(0.1, 1.0)})
+            ticks.append(evs)
+        pool = RipplePool()
+        clock = {"t": 0.0, "n": 0}
+        screen = r.screen
+
+        def call(pool=pool, ticks=ticks):
+            n = clock["n"]
+            clock["n"] = n + 1
+            clock["t"] += 1.0 / 60.0
+            if n % 3 == 0:
+                pool.ingest(ticks[(n // 3) % len(ticks)], 20.0, 20.0, 12.0, clock["t"])
+            pool.draw(screen, 24, 0.0, 0.0, clock["t"])
+        yield {"players": players}, call, 300 * scale
+
+
+def bench_text(r, scale):
+    # Per-frame localized text: the in-game HUD strip and the (scrollable) item manual page.
+    from bench.common import make_state
+    state = make_state(64, 100, 6)
+    state.phase = 2
+    yield {"view": "hud"}, (lambda: r.draw_hud(state)), 2000 * scale
+    yield {"view": "item_manual"}, r.draw_item_manual_menu, 50 * scale
+
+
+def bench_config(r, scale):
+    with open(REPO_ROOT / "game_config.json", "r", encoding="utf-8") as f:
+        cfg = json.load(f)
+    yield {"op": "flatten"}, (lambda: r._flatten_config(cfg)), 200 * scale
+    rows = [row["path"] for row in r._flatten_config(cfg)]
+    nxt = _cycler(rows)
+
+    def call():
+        p = nxt()
+        r._set_by_path(cfg, p, 1)
+    yield {"op": "set_by_path", "rows": len(rows)}, call, 2000 * scale
+
+
+def bench_json_3002(r, scale):
+    for ents, players in ((100, 6), (1000, 16)):
+        _, snap = make_snapshot(256, ents, players)
+        raw = json.dumps({"type": 3002, "payload": snap})
+        yield {"entities": ents, "players": players, "bytes": len(raw)}, (lambda raw=raw: json.loads(raw)), 20 * scale
+
+
+BENCHES = {
+    "raycast": bench_raycast,
+    "los": bench_los,
+    "visible": bench_visible,
+    "fov_polygon": bench_fov_polygon,
+    "update_from_server": bench_update_from_server,
+    "ripples": bench_ripples,
+    "text": bench_text,
+    "config": bench_config,
+    "json_3002": bench_json_3002,
+}
+
+
+def _case_key(name, params):
+    return name + "|" + ",".join(f"{k}={params[k]}" for k in sorted(params) if k != "bytes")
+
+
+def compare(results, baseline_path):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        base = json.load(f)
+    base_idx = {_case_key(c["bench"], c["params"]): c for c in base.get("cases", [])}
+    for c in results:
+        b = base_idx.get(_case_key(c["bench"], c["params"]))
+        if not b:
+            continue
+        ratio = c["median_us"] / b["median_us"] if b["median_us"] else 0.0
+        c["baseline_median_us"] = b["median_us"]
+        c["speedup"] = (1.0 / ratio) if ratio else 0.0
+        print(f"{_case_key(c['bench'], c['params']):<60} {b['median_us']:10.2f}us -> {c['median_us']:10.2f}us  x{c['speedup']:.2f}", file=sys.stderr)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--only", default="", help="comma-separated subset of: " + ",".join(BENCHES))
+    ap.add_argument("--scale", type=int, default=1, help="multiply iteration counts")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--compare", default=None, help="baseline JSON from a previous run")
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    setup_headless()
+    r = make_renderer()
+    names = [n for n in args.only.split(",") if n] or list(BENCHES)
+    results = []
+    for name in names:
+        for params, fn, number in BENCHES[name](r, max(1, args.scale)):
+            res = measure(fn, max(1, number), args.repeat)
+            res.update({"bench": name, "params": params})
+            results.append(res)
+            print(f"{_case_key(name, params):<60} {res['median_us']:10.2f}us", file=sys.stderr)
+    if args.compare:
+        compare(results, args.compare)
+    write_report({"suite": "micro", "env": environment_info(), "cases": results}, args.out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""PVS regression check: the table must never cull a target the runtime LOS test can see.
+
+For random viewer/target pairs within the table's radius on synthetic maps, compares
+PvsTable against Renderer._has_line_of_sight (the 0.12-step raymarch used for entity
+visibility) and reports every miss. Exits non-zero if there is one.
+
+    cd frontend
+    python -m bench.pvs_check
+    python -m bench.pvs_check --maps 48:3,64:5 --radius 16 --viewers 300
+"""
+import argparse
+import math
+import random
+import sys
+import time
+
+from bench.common import setup_headless, make_renderer, make_state, environment_info, write_report
+
+# (viewer, target, map size, seed) pairs that slipped past earlier builds.
+KNOWN_CASES = (((5.056, 25.975), (4.461, 36.896), 48, 11),)
+
+
+def _free_point(tiles, rng):
+    h, w = len(tiles), len(tiles[0])
+    while True:
+        x, y = rng.uniform(0, w), rng.uniform(0, h)
+        if tiles[int(y)][int(x)] != 1:
+            return x, y
+
+
+def check_map(r, table, tiles, radius, viewers, targets, rng):
+    queries = 0
+    misses = []
+    h, w = len(tiles), len(tiles[0])
+    for _ in range(viewers):
+        ox, oy = _free_point(tiles, rng)
+        bits, x0, y0 = table.window(ox, oy)
+        for _ in range(targets):
+            a = rng.uniform(0.0, 2.0 * math.pi)
+            d = radius * math.sqrt(rng.random())
+            tx, ty = ox + math.cos(a) * d, oy + math.sin(a) * d
+            if not (0 <= tx < w and 0 <= ty < h):
+                continue
+            queries += 1
+            if (bits >> ((int(ty) - y0) * table.side + int(tx) - x0)) & 1:
+                continue
+            if r._has_line_of_sight((ox, oy), (tx, ty), tiles):
+                misses.append(((round(ox, 3), round(oy, 3)), (round(tx, 3), round(ty, 3))))
+    return queries, misses
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--maps", default="48:3,64:5,48:11", help="comma-separated size:seed list")
+    ap.add_argument("--radius", type=float, default=None, help="table radius (default: PVS_MIN_RADIUS)")
+    ap.add_argument("--viewers", type=int, default=200)
+    ap.add_argument("--targets", type=int, default=300)
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    setup_headless()
+    from client.config import PVS_MIN_RADIUS
+    from client.pvs import build_pvs
+    if args.radius is None:
+        args.radius = PVS_MIN_RADIUS
+    r = make_renderer()
+    cases = []
+    failed = False
+    for spec in args.maps.split(","):
+        size, seed = (int(v) for v in spec.split(":"))
+        tiles = make_state(size, 0, 1, seed=seed).map_tiles
+        t0 = time.perf_counter()
+        table = build_pvs(tiles, args.radius)
+        build_s = time.perf_counter() - t0
+        queries, misses = check_map(r, table, tiles, args.radius, args.viewers, args.targets, random.Random(seed))
+        for (v, t, ksize, kseed) in KNOWN_CASES:
+            if (ksize, kseed) == (size, seed) and math.dist(v, t) <= args.radius:
+                queries += 1
+                if not table.maybe_visible(v[0], v[1], t[0], t[1]) and r._has_line_of_sight(v, t, tiles):
+                    misses.append((v, t))
+        failed = failed or bool(misses)
+        cases.append({"map": size, "seed": seed, "radius": args.radius, "build_s": build_s, "queries": queries, "misses": misses[:20], "miss_count": len(misses)})
+        print(f"map {size}x{size} seed {seed} radius {args.radius}: {len(misses)} misses in {queries} queries (build {build_s:.1f}s)", file=sys.stderr)
+        for v, t in misses[:5]:
+            print(f"  viewer {v} target {t}", file=sys.stderr)
+    write_report({"suite": "pvs_check", "env": environment_info(), "cases": cases}, args.out)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""Replay a session recording (client/recording.py) into GameState and, optionally, the Renderer.
+
+Inbound packets are parsed and applied the way main.py applies them (3001 map, 3002
+snapshot, 1012 room joined); outbound packets are counted but not re-sent. --speed 1 replays
+in real time, N replays N times faster, 0 as fast as possible (one frame per snapshot).
+The JSON report times parse / apply / draw so a captured stutter can be reproduced and
+profiled offline.
+
+    cd frontend
+    python -m bench.replay ~/echo_trace_20250101_120000.etrec --speed 0 --render
+    python -m bench.replay capture.etrec --speed 1 --render --show     # watch it in a window
+    python -m bench.replay capture.etrec --start 95.0 --limit 200      # seek via the keyframe index
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from bench.common import FRONTEND_DIR, environment_info, setup_headless, summarize_ms, write_report
+from client.protocol import S2C
+
+FRAME_SEC = 1.0 / 60.0
+
+
+def apply_packet(msg, state, renderer=None):
+    mt, pl = msg.get("type"), msg.get("payload")
+    if mt == S2C.GAME_STATE_PUSH and isinstance(pl, dict):
+        state.update_from_server(pl)
+    elif mt == S2C.GAME_START_PUSH and isinstance(pl, dict):
+        state.load_map(pl)
+        if renderer is not None:
+            renderer.minimap.rebuild(state)
+    elif mt == S2C.ROOM_JOINED and isinstance(pl, dict):
+        state.config = pl.get("config")
+        if renderer is not None:
+            renderer.state = "GAME"
+    return mt
+
+
+def replay(path, speed=0.0, render=False, show=False, limit=0, start=None, start_packet=None):
+    from client.gamestate import GameState
+    from client.recording import DIR_IN, RecordingReader
+
+    reader = RecordingReader(path)
+    renderer = None
+    if render:
+        import pygame
+        from client.config import WINDOW_WIDTH, WINDOW_HEIGHT
+        from client.renderer import Renderer
+        pygame.display.init(); pygame.font.init()
+        screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        renderer = Renderer(screen)
+        renderer.state = "GAME"
+    state = GameState()
+    packets = iter(reader)
+    t_base = 0.0
+    if start is not None or start_packet is not None:
+        # Jump via the keyframe index: rebuild state from the nearest keyframe, then stream on.
+        for pkt in reader.restore_packets(start, start_packet):
+            apply_packet(json.loads(pkt.data), state, renderer)
+        packets = reader.packets_from(start, start_packet)
+        t_base = None
+    parse_s, apply_s, draw_s = [], [], []
+    counts = {"in": 0, "out": 0, "snapshots": 0, "bytes_in": 0}
+    rec_t = 0.0
+
+    def draw():
+        t0 = time.perf_counter()
+        renderer.draw_game(state)
+        if show:
+            pygame.display.flip()
+            pygame.event.pump()
+        draw_s.append(time.perf_counter() - t0)
+
+    wall0 = time.perf_counter()
+    next_frame = 0.0
+    for pkt in packets:
+        if t_base is None:
+            t_base = pkt.t
+        rec_t = pkt.t
+        if pkt.direction != DIR_IN:
+            counts["out"] += 1
+            continue
+        if speed > 0:
+            # Real-time / N×: render frames at 60 fps of wall time until this packet is due.
+            due = (pkt.t - t_base) / speed
+            while True:
+                now = time.perf_counter() - wall0
+                if renderer is not None and now >= next_frame:
+                    if counts["snapshots"]:
+                        draw()
+                    next_frame = now + FRAME_SEC
+                if now >= due:
+                    break
+                time.sleep(min(due - now, max(0.0, next_frame - now)) if renderer is not None else due - now)
+        t0 = time.perf_counter()
+        try:
+            msg = json.loads(pkt.data)
+        except ValueError:
+            continue
+        t1 = time.perf_counter()
+        mt = apply_packet(msg, state, renderer)
+        t2 = time.perf_counter()
+        counts["in"] += 1
+        counts["bytes_in"] += len(pkt.data)
+        parse_s.append(t1 - t0)
+        if mt == S2C.GAME_STATE_PUSH:
+            apply_s.append(t2 - t1)
+            counts["snapshots"] += 1
+            if renderer is not None and speed <= 0:
+                draw()
+            if limit and counts["snapshots"] >= limit:
+                break
+    wall = time.perf_counter() - wall0
+    reader.close()
+    return {
+        "recording": str(path),
+        "recording_seconds": rec_t - (t_base or 0.0),
+        "wall_seconds": wall,
+        "speed": speed,
+        "counts": counts,
+        "parse": summarize_ms(parse_s),
+        "apply_3002": summarize_ms(apply_s),
+        "draw": summarize_ms(draw_s),
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("recording")
+    ap.add_argument("--speed", type=float, default=0.0, help="1 = real time, N = N× faster, 0 = as fast as possible")
+    ap.add_argument("--render", action="store_true", help="also draw frames with Renderer.draw_game")
+    ap.add_argument("--show", action="store_true", help="open a real window (implies --render)")
+    ap.add_argument("--limit", type=int, default=0, help="stop after this many snapshots")
+    ap.add_argument("--start", type=float, default=None, help="start at this recording time (seconds), via the keyframe index")
+    ap.add_argument("--start-packet", type=int, default=None, help="start at this packet number, via the keyframe index")
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    path = os.path.abspath(args.recording)
+    if not args.show:
+        setup_headless()
+    else:
+        if str(FRONTEND_DIR) not in sys.path:
+            sys.path.insert(0, str(FRONTEND_DIR))
+        os.chdir(FRONTEND_DIR)
+    report = replay(path, speed=args.speed, render=args.render or args.show, show=args.show, limit=args.limit,
+                    start=args.start, start_packet=args.start_packet)
+    report["env"] = environment_info()
+    write_report(report, args.out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
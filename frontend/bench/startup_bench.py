@@ -0,0 +1,95 @@
+"""Client startup benchmark: import + first-frame latency.
+
+Each run is a fresh interpreter (imports are only cold once per process) that replays the
+start of main.main(): import main, open the window, build the Renderer, draw and flip the
+first (CONNECT) frame, then wait for the background icon decode. Times are milliseconds
+from the child's first statement; `process_ms` also includes interpreter startup.
+
+    cd frontend
+    python -m bench.startup_bench --runs 10 --out ../bench_output/startup_base.json
+    python -m bench.startup_bench --compare ../bench_output/startup_base.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+from bench.common import FRONTEND_DIR, environment_info, summarize_ms, write_report
+
+METRICS = ("import_ms", "window_ms", "renderer_ms", "first_frame_ms", "icons_ready_ms", "process_ms")
+
+_CHILD = r"""
+import time
+t0 = time.perf_counter()
+import json
+import main
+import pygame
+t_import = time.perf_counter()
+pygame.display.init()
+pygame.font.init()
+screen, _ = main._create_display(False)
+t_window = time.perf_counter()
+renderer = main.Renderer(screen)
+t_renderer = time.perf_counter()
+renderer.draw_game(main.GameState())
+pygame.display.flip()
+t_frame = time.perf_counter()
+if renderer.icon_loader is not None:
+    renderer.icon_loader.result()
+t_icons = time.perf_counter()
+ms = lambda t: (t - t0) * 1000.0
+print(json.dumps({"import_ms": ms(t_import), "window_ms": ms(t_window), "renderer_ms": ms(t_renderer),
+                  "first_frame_ms": ms(t_frame), "icons_ready_ms": ms(t_icons)}))
+"""
+
+
+def run_once():
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", "dummy")
+    env.setdefault("SDL_AUDIODRIVER", "dummy")
+    env["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"
+    t0 = time.perf_counter()
+    out = subprocess.run([sys.executable, "-c", _CHILD], cwd=str(FRONTEND_DIR), env=env, capture_output=True, text=True, check=True)
+    wall = (time.perf_counter() - t0) * 1000.0
+    res = json.loads(out.stdout.strip().splitlines()[-1])
+    res["process_ms"] = wall
+    return res
+
+
+def compare(summary, baseline_path):
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        base = json.load(f).get("metrics", {})
+    for name in METRICS:
+        b, c = base.get(name), summary.get(name)
+        if not b or not c or not b["p50_ms"]:
+            continue
+        c["baseline_p50_ms"] = b["p50_ms"]
+        print(f"{name:<16} {b['p50_ms']:9.1f}ms -> {c['p50_ms']:9.1f}ms  x{b['p50_ms'] / c['p50_ms']:.2f}", file=sys.stderr)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--runs", type=int, default=10)
+    ap.add_argument("--warmup", type=int, default=1, help="discarded runs (populate OS file cache / .pyc)")
+    ap.add_argument("--compare", default=None, help="baseline JSON from a previous run")
+    ap.add_argument("--out", default=None)
+    args = ap.parse_args(argv)
+
+    for _ in range(max(0, args.warmup)):
+        run_once()
+    runs = []
+    for i in range(max(1, args.runs)):
+        r = run_once()
+        runs.append(r)
+        print(f"run {i}: " + "  ".join(f"{k}={r[k]:.1f}" for k in METRICS), file=sys.stderr)
+    summary = {name: summarize_ms([r[name] / 1000.0 for r in runs]) for name in METRICS}
+    if args.compare:
+        compare(summary, args.compare)
+    write_report({"suite": "startup", "env": environment_info(), "metrics": summary, "runs": runs}, args.out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
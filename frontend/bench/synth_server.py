@@ -0,0 +1,477 @@
+"""Stand-in game server that streams synthetic load over the real protocol.
+
+Speaks the protocol.json handshake the client uses (1001 login resp, 1002 heartbeat echo, 1010 create,
+1011 join, 1013/1014 room list, 3001 map push, 3002 snapshots, 4001 errors) on a plain asyncio
+WebSocket endpoint, so the client, the bot fleet and the benchmarks can run against
+worst-case traffic without the Go backend. Everything is driven by --seed, so a run is
+reproducible.
+
+    cd frontend
+    python -m bench.synth_server --port 8080 --map 128 --tick-hz 20 --entities 500 --players 15
+    python main.py            # connect to ws://localhost:8080/ws
+
+Rooms synth-1..N exist from the start (plus any the client creates). Each room cycles
+phases 1-3 and regenerates its map when the match ends. --aoi 0 puts every player and
+entity in every snapshot (worst case); otherwise only those within that many tiles.
+"""
+import argparse
+import asyncio
+import base64
+import hashlib
+import itertools
+import json
+import math
+import random
+import struct
+import sys
+import time
+
+from bench.common import REPO_ROOT, make_tiles
+
+_WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+ENTITY_TYPES = ("ITEM_DROP", "ITEM_DROP", "ITEM_DROP", "MOTOR", "SUPPLY_DROP", "MERCHANT", "EXIT")
+# Output buffer above which a tick's snapshot is dropped for that client (like the backend's
+# non-blocking send channel), instead of queueing without bound.
+SEND_BUFFER_LIMIT = 1 << 20
+
+
+class WsClosed(Exception):
+    pass
+
+
+class WsConnection:
+    """Server side of RFC 6455 for text frames on asyncio streams (enough for websocket-client)."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.closed = False
+
+    async def handshake(self):
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        headers = {}
+        for ln in lines[1:]:
+            k, _, v = ln.partition(":")
+            headers[k.strip().lower()] = v.strip()
+        key = headers.get("sec-websocket-key")
+        if not key or "websocket" not in headers.get("upgrade", "").lower():
+            self.writer.write(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
+            await self.writer.drain()
+            raise WsClosed()
+        accept = base64.b64encode(hashlib.sha1((key + _WS_GUID).encode()).digest()).decode()
+        self.writer.write((
+            "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n\r\n").encode())
+        await self.writer.drain()
+
+    async def _frame(self):
+        b0, b1 = await self.reader.readexactly(2)
+        n = b1 & 0x7F
+        if n == 126:
+            n = struct.unpack("!H", await self.reader.readexactly(2))[0]
+        elif n == 127:
+            n = struct.unpack("!Q", await self.reader.readexactly(8))[0]
+        mask = await self.reader.readexactly(4) if b1 & 0x80 else None
+        data = await self.reader.readexactly(n)
+        if mask and n:
+            m = (mask * (n // 4 + 1))[:n]
+            data = (int.from_bytes(data, "big") ^ int.from_bytes(m, "big")).to_bytes(n, "big")
+        return bool(b0 & 0x80), b0 & 0x0F, data
+
+    async def recv(self):
+        """Next text/binary message as str; raises WsClosed on close or EOF."""
+        parts = []
+        try:
+            while True:
+                fin, op, data = await self._frame()
+                if op == 0x8:
+                    self._write(0x8, data[:2])
+                    raise WsClosed()
+                if op == 0x9:
+                    self._write(0xA, data)
+                    continue
+                if op == 0xA:
+                    continue
+                parts.append(data)
+                if fin:
+                    return b"".join(parts).decode("utf-8", "replace")
+        except (asyncio.IncompleteReadError, ConnectionError):
+            raise WsClosed()
+
+    def _write(self, opcode, payload):
+        if self.closed:
+            return
+        n = len(payload)
+        if n < 126:
+            head = struct.pack("!BB", 0x80 | opcode, n)
+        elif n < 65536:
+            head = struct.pack("!BBH", 0x80 | opcode, 126, n)
+        else:
+            head = struct.pack("!BBQ", 0x80 | opcode, 127, n)
+        self.writer.write(head + payload)
+
+    def backlog(self):
+        t = self.writer.transport
+        return t.get_write_buffer_size() if t is not None else 0
+
+    def send_text(self, text):
+        self._write(0x1, text.encode("utf-8"))
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            try:
+                self.writer.close()
+            except Exception:
+                pass
+
+
+class Session:
+    def __init__(self, conn, sid):
+        self.conn = conn
+        self.session_id = sid
+        self.name = ""
+        self.room = None
+        self.pos = [1.5, 1.5]
+        self.dir = (0.0, 0.0)
+        self.look = (1.0, 0.0)
+        self.hp = 100.0
+        self.funds = 250
+        self.sent = 0
+        self.dropped = 0
+        self.bytes = 0
+
+    def push(self, mtype, payload, droppable=False):
+        if droppable and self.conn.backlog() > SEND_BUFFER_LIMIT:
+            self.dropped += 1
+            return
+        text = json.dumps({"type": mtype, "payload": payload}, separators=(",", ":"))
+        self.conn.send_text(text)
+        self.sent += 1
+        self.bytes += len(text)
+
+
+class SynthRoom:
+    """One synthetic match: a maze, NPC players random-walking, churning entities and phases."""
+
+    def __init__(self, room_id, name, opts, config, seed):
+        self.room_id = room_id
+        self.name = name
+        self.opts = opts
+        self.config = config
+        self.rng = random.Random(seed)
+        self.sessions = {}
+        self.uid = itertools.count()
+        self.seq = 0
+        self.phase = 0
+        self.phase_left = float(opts.lobby)
+        self.new_map()
+
+    def new_map(self):
+        o = self.opts
+        self.tiles = make_tiles(o.map, o.map, self.rng, o.wall_density)
+        self.entities = [self._spawn_entity() for _ in range(o.entities)]
+        self.npcs = [{"session_id": f"npc_{i}", "name": f"Npc_{i}", "pos": list(self._free()), "dir": self._rand_dir(), "hp": 100.0}
+                     for i in range(o.players)]
+        for s in self.sessions.values():
+            s.pos = list(self._free())
+
+    def _free(self):
+        w = len(self.tiles[0]); h = len(self.tiles)
+        for _ in range(500):
+            x, y = self.rng.uniform(1, w - 1), self.rng.uniform(1, h - 1)
+            if self.tiles[int(y)][int(x)] == 0:
+                return x, y
+        return w / 2.0, h / 2.0
+
+    def _rand_dir(self):
+        a = self.rng.uniform(0, math.tau)
+        return math.cos(a), math.sin(a)
+
+    def _spawn_entity(self):
+        x, y = self._free()
+        t = self.rng.choice(ENTITY_TYPES)
+        e = {"uid": f"e{next(self.uid)}", "type": t, "pos": {"x": x, "y": y}, "state": 1}
+        if t == "MOTOR":
+            e["extra"] = {"progress": 0.0, "max_progress": 100.0}
+        return e
+
+    def _walkable(self, x, y):
+        gx, gy = int(x), int(y)
+        return 0 <= gy < len(self.tiles) and 0 <= gx < len(self.tiles[0]) and self.tiles[gy][gx] == 0
+
+    def _move(self, pos, d, dist):
+        nx, ny = pos[0] + d[0] * dist, pos[1] + d[1] * dist
+        if self._walkable(nx, pos[1]):
+            pos[0] = nx
+        if self._walkable(pos[0], ny):
+            pos[1] = ny
+
+    def summary(self):
+        o = self.opts
+        return {"room_id": self.room_id, "room_name": self.name, "players": len(self.sessions), "max_players": o.max_players,
+                "phase": self.phase, "map_width": o.map, "map_height": o.map}
+
+    def start_push(self, s):
+        return {"map_width": self.opts.map, "map_height": self.opts.map, "spawn_pos": {"x": s.pos[0], "y": s.pos[1]},
+                "map_tiles": self.tiles, "inventory": []}
+
+    def join(self, s):
+        s.room = self
+        s.pos = list(self._free())
+        self.sessions[s.session_id] = s
+        s.push(1001, {"success": True, "session_id": s.session_id, "config": self.config})
+        if self.phase >= 1:
+            s.push(3001, self.start_push(s))
+
+    def leave(self, s):
+        if self.sessions.get(s.session_id) is s:
+            del self.sessions[s.session_id]
+
+    def pickup(self, s):
+        for i, e in enumerate(self.entities):
+            if e["type"] in ("ITEM_DROP", "SUPPLY_DROP") and math.hypot(e["pos"]["x"] - s.pos[0], e["pos"]["y"] - s.pos[1]) < 1.5:
+                self.entities[i] = self._spawn_entity()
+                s.funds += 10
+                return
+
+    def skip_phase(self):
+        self.phase_left = 0.0
+
+    def _advance_phase(self, dt):
+        self.phase_left -= dt
+        if self.phase_left > 0:
+            return
+        if self.phase >= 3:
+            self.phase = 0
+            self.new_map()
+        self.phase += 1
+        self.phase_left = float(self.opts.phase_secs)
+        if self.phase == 1:
+            for s in self.sessions.values():
+                s.push(3001, self.start_push(s))
+
+    def tick(self, dt):
+        o = self.opts
+        self._advance_phase(dt)
+        self.seq += 1
+        if self.phase < 1:
+            for s in self.sessions.values():
+                s.push(3002, {"timestamp": int(time.time() * 1000), "seq": self.seq, "phase": 0, "time_left": self.phase_left}, droppable=True)
+            return
+        rng = self.rng
+        for n in self.npcs:
+            if rng.random() < 0.05:
+                n["dir"] = self._rand_dir()
+            self._move(n["pos"], n["dir"], o.move_speed * dt)
+        for s in self.sessions.values():
+            self._move(s.pos, s.dir, o.move_speed * dt)
+        # Entity churn: --churn of the entity list is replaced per second; motors keep progressing.
+        for _ in range(int(o.churn * len(self.entities) * dt + rng.random())):
+            if self.entities:
+                self.entities[rng.randrange(len(self.entities))] = self._spawn_entity()
+        for e in self.entities:
+            if e["type"] == "MOTOR" and e["state"] == 1:
+                ex = e["extra"]
+                ex["progress"] = ex["progress"] + 5.0 * dt
+                if ex["progress"] >= ex["max_progress"]:
+                    ex["progress"] = ex["max_progress"]; e["state"] = 2
+        events = [{"type": "MSG", "msg": f"synthetic event {self.seq}.{i}"} for i in range(o.events)]
+        blips = [{"type": "MOTOR", "pos": e["pos"]} for e in self.entities if e["type"] == "MOTOR"][:50]
+        others = [self._player_view(n["session_id"], n["name"], n["pos"], n["dir"], n["hp"]) for n in self.npcs]
+        others += [self._player_view(s.session_id, s.name, s.pos, s.look, s.hp) for s in self.sessions.values()]
+        now_ms = int(time.time() * 1000)
+        for s in self.sessions.values():
+            px, py = s.pos
+            if o.aoi > 0:
+                r2 = o.aoi * o.aoi
+                vis_p = [p for p in others if p["session_id"] != s.session_id and (p["pos"]["x"] - px) ** 2 + (p["pos"]["y"] - py) ** 2 <= r2]
+                vis_e = [e for e in self.entities if (e["pos"]["x"] - px) ** 2 + (e["pos"]["y"] - py) ** 2 <= r2]
+            else:
+                vis_p = [p for p in others if p["session_id"] != s.session_id]
+                vis_e = self.entities
+            sounds = []
+            for p in vis_p:
+                dx, dy = p["pos"]["x"] - px, p["pos"]["y"] - py
+                d = math.hypot(dx, dy)
+                if 0 < d <= 12.0:
+                    sounds.append({"type": "FOOTSTEP", "dir": {"x": dx / d, "y": dy / d}, "intensity": 1.0 - d / 12.0})
+            s.push(3002, {
+                "timestamp": now_ms, "seq": self.seq, "phase": self.phase, "time_left": max(0.0, self.phase_left),
+                "events": events,
+                "self": self._self_view(s),
+                "vision": {"players": vis_p, "entities": vis_e},
+                "radar_blips": blips,
+                "sound": {"events": sounds},
+            }, droppable=True)
+
+    @staticmethod
+    def _player_view(sid, name, pos, look, hp):
+        return {
+            "session_id": sid, "name": name, "pos": {"x": pos[0], "y": pos[1]}, "look_dir": {"x": look[0], "y": look[1]},
+            "hp": hp, "max_hp": 100.0, "move_speed": 4.0, "view_radius": 8.0, "hear_radius": 12.0, "is_alive": hp > 0,
+            "tactic": "RECON", "inventory_cap": 6, "max_weight": 10.0, "weight": 2.0, "funds": 100, "inventory": [],
+            "shop_stock": [], "channeling_target": "", "is_extracting": False, "extraction_timer": 0.0, "is_extracted": False,
+        }
+
+    def _self_view(self, s):
+        v = self._player_view(s.session_id, s.name or s.session_id, s.pos, s.look, s.hp)
+        v["funds"] = s.funds
+        v["shop_stock"] = ["WPN_SHOCK_T1", "SURV_BANDAGE", "RECON_AMP_T1", "WPN_STONE", "SURV_ENERGY_BAR", "WPN_KNIFE_T2"]
+        return v
+
+
+class SynthServer:
+    def __init__(self, opts):
+        self.opts = opts
+        try:
+            with open(REPO_ROOT / "game_config.json", "r", encoding="utf-8") as f:
+                self.config = json.load(f)
+        except Exception:
+            self.config = {}
+        self.config.setdefault("map", {}).update({"width": opts.map, "height": opts.map})
+        self.config.setdefault("server", {}).update({"tick_rate_ms": int(1000 / opts.tick_hz), "max_players_per_room": opts.max_players})
+        self.rooms = {}
+        self.room_ids = itertools.count(1)
+        self.session_ids = itertools.count(1)
+        self.sessions = set()
+        for i in range(opts.rooms):
+            self.create_room(f"synth-{i + 1}")
+
+    def create_room(self, name):
+        if any(r.name == name for r in self.rooms.values()):
+            return None
+        n = next(self.room_ids)
+        room = SynthRoom(f"room_{n}", name, self.opts, self.config, self.opts.seed * 1000 + n)
+        self.rooms[room.room_id] = room
+        return room
+
+    def _joined(self, s, room):
+        room.join(s)
+        s.push(1012, {"success": True, "room_id": room.room_id, "room_name": room.name, "config": self.config})
+
+    def handle(self, s, msg):
+        mt = msg.get("type")
+        pl = msg.get("payload") or {}
+        if mt in (1010, 1011) and isinstance(pl, dict):
+            if s.room is not None:
+                return
+            s.session_id = str(pl.get("session_id") or "").strip() or s.session_id
+            s.name = str(pl.get("name") or s.name).strip()
+            if mt == 1010:
+                name = str(pl.get("room_name") or "").strip()
+                room = self.create_room(name) if name else None
+                if room is None:
+                    s.push(4001, {"msg": "创建房间失败：房间名为空或已存在。"})
+                    return
+            else:
+                room = self.rooms.get(str(pl.get("room_id") or "").strip())
+                if room is None:
+                    s.push(4001, {"msg": "加入房间失败：房间不存在或已关闭。"})
+                    return
+            self._joined(s, room)
+        elif mt == 1013:
+            s.push(1014, {"rooms": [r.summary() for r in self.rooms.values()]})
+        elif mt == 1002:
+            s.push(1002, pl)
+        elif s.room is None:
+            return
+        elif mt == 1001 and isinstance(pl, dict):
+            s.name = str(pl.get("name") or s.name)
+        elif mt == 2001 and isinstance(pl, dict):
+            d = pl.get("dir") or {}
+            s.dir = (float(d.get("x", 0.0)), float(d.get("y", 0.0)))
+            lk = pl.get("look_dir")
+            if isinstance(lk, dict):
+                s.look = (float(lk.get("x", 1.0)), float(lk.get("y", 0.0)))
+        elif mt == 2004:
+            s.room.pickup(s)
+        elif mt == 9001:
+            s.room.skip_phase()
+
+    async def serve_client(self, reader, writer):
+        conn = WsConnection(reader, writer)
+        s = Session(conn, f"u_{next(self.session_ids)}")
+        try:
+            await conn.handshake()
+            self.sessions.add(s)
+            while True:
+                text = await conn.recv()
+                try:
+                    msg = json.loads(text)
+                except ValueError:
+                    continue
+                if isinstance(msg, dict):
+                    self.handle(s, msg)
+        except (WsClosed, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            self.sessions.discard(s)
+            if s.room is not None:
+                s.room.leave(s)
+            conn.close()
+
+    async def tick_loop(self):
+        loop = asyncio.get_running_loop()
+        dt = 1.0 / self.opts.tick_hz
+        next_t = loop.time()
+        last_report = loop.time()
+        ticks = 0
+        while True:
+            for room in list(self.rooms.values()):
+                room.tick(dt)
+            ticks += 1
+            now = loop.time()
+            if self.opts.report and now - last_report >= self.opts.report:
+                sent = sum(s.sent for s in self.sessions); dropped = sum(s.dropped for s in self.sessions)
+                mb = sum(s.bytes for s in self.sessions) / 1e6
+                print(f"[synth] clients={len(self.sessions)} rooms={len(self.rooms)} ticks/s={ticks / (now - last_report):.1f} "
+                      f"msgs={sent} dropped={dropped} out={mb:.1f}MB", file=sys.stderr)
+                last_report, ticks = now, 0
+            next_t += dt
+            if next_t < now - dt:
+                next_t = now  # Fell behind: skip ticks rather than bursting.
+            await asyncio.sleep(max(0.0, next_t - now))
+
+    async def run(self):
+        server = await asyncio.start_server(self.serve_client, self.opts.host, self.opts.port, limit=1 << 20)
+        print(f"[synth] listening on ws://{self.opts.host}:{self.opts.port}/ws", file=sys.stderr)
+        async with server:
+            await asyncio.gather(server.serve_forever(), self.tick_loop())
+
+
+def build_parser():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8080)
+    ap.add_argument("--rooms", type=int, default=1, help="rooms created at startup")
+    ap.add_argument("--map", type=int, default=64, help="map width/height in tiles")
+    ap.add_argument("--wall-density", type=float, default=0.2)
+    ap.add_argument("--tick-hz", type=float, default=20.0)
+    ap.add_argument("--entities", type=int, default=200)
+    ap.add_argument("--players", type=int, default=5, help="synthetic NPC players per room")
+    ap.add_argument("--max-players", type=int, default=16)
+    ap.add_argument("--churn", type=float, default=0.05, help="fraction of entities respawned per second")
+    ap.add_argument("--events", type=int, default=2, help="global events per snapshot")
+    ap.add_argument("--aoi", type=float, default=0.0, help="vision radius in tiles (0 = send everything)")
+    ap.add_argument("--move-speed", type=float, default=4.0)
+    ap.add_argument("--lobby", type=float, default=0.0, help="seconds in phase 0 before the match starts")
+    ap.add_argument("--phase-secs", type=float, default=120.0)
+    ap.add_argument("--seed", type=int, default=1)
+    ap.add_argument("--report", type=float, default=5.0, help="stats interval in seconds (0 = off)")
+    return ap
+
+
+def main(argv=None):
+    opts = build_parser().parse_args(argv)
+    opts.tick_hz = max(1.0, opts.tick_hz)
+    try:
+        asyncio.run(SynthServer(opts).run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
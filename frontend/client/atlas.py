@@ -0,0 +1,99 @@
+import collections
+import pygame
+from client.config import ZOOM_LEVELS, ATLAS_BUDGET_BYTES
+
+ATLAS_KEYS = ("ITEM_DROP", "SUPPLY_DROP", "MERCHANT", "MOTOR", "MOTOR_DONE", "EXIT", "ENEMY", "SELF")
+_PAD = 2
+
+
+class SpriteAtlas:
+    """World sprites packed into one atlas surface, with pre-scaled pages per zoom level.
+
+    Zoom 1.0 serves the SpriteBank sprites directly. Any other level scales the whole atlas
+    once (a single smoothscale), then hands out cached subsurfaces; pages are built lazily
+    on first use and least-recently-used pages are evicted once their total size exceeds
+    ATLAS_BUDGET_BYTES. Nothing is scaled per frame.
+    """
+
+    def __init__(self, bank, keys=ATLAS_KEYS, budget_bytes=ATLAS_BUDGET_BYTES):
+        self.bank = bank
+        self.keys = tuple(keys)
+        self.budget_bytes = int(budget_bytes)
+        self.surface = None
+        self.rects = {}
+        self.anchors = {}
+        self.pages = collections.OrderedDict()  # zoom -> (surface, {key: (subsurface, ax, ay)})
+
+    def _pack(self):
+        # Simple shelf packing; sprites are tiny so the atlas stays a few hundred px wide.
+        sprites = [(k, self.bank.get(k)) for k in self.keys]
+        sprites = [(k, s) for k, s in sprites if s is not None]
+        max_w = max([s[0].get_width() for _, s in sprites] + [1])
+        width = max(max_w + _PAD * 2, 256)
+        x = y = shelf_h = 0
+        placed = []
+        for k, (surf, ax, ay) in sorted(sprites, key=lambda it: -it[1][0].get_height()):
+            w, h = surf.get_size()
+            if x + w + _PAD * 2 > width:
+                x = 0
+                y += shelf_h
+                shelf_h = 0
+            placed.append((k, surf, pygame.Rect(x + _PAD, y + _PAD, w, h), ax, ay))
+            x += w + _PAD * 2
+            shelf_h = max(shelf_h, h + _PAD * 2)
+        atlas = pygame.Surface((width, max(1, y + shelf_h)), pygame.SRCALPHA)
+        for k, surf, r, ax, ay in placed:
+            atlas.blit(surf, r.topleft)
+            self.rects[k] = r
+            self.anchors[k] = (ax, ay)
+        self.surface = atlas
+
+    def _page_bytes(self, page):
+        w, h = page[0].get_size()
+        return w * h * 4
+
+    def _build_page(self, zoom):
+        if self.surface is None:
+            self._pack()
+        aw, ah = self.surface.get_size()
+        size = (max(1, int(round(aw * zoom))), max(1, int(round(ah * zoom))))
+        scaled = pygame.transform.smoothscale(self.surface, size)
+        sx, sy = size[0] / float(aw), size[1] / float(ah)
+        entries = {}
+        for k, r in self.rects.items():
+            sr = pygame.Rect(int(r.x * sx), int(r.y * sy), max(1, int(round(r.w * sx))), max(1, int(round(r.h * sy))))
+            sr = sr.clip(scaled.get_rect())
+            ax, ay = self.anchors[k]
+            entries[k] = (scaled.subsurface(sr), int(round(ax * sx)), int(round(ay * sy)))
+        return scaled, entries
+
+    def _evict(self, keep):
+        total = sum(self._page_bytes(p) for p in self.pages.values())
+        for z in list(self.pages):
+            if total <= self.budget_bytes:
+                break
+            if z == keep:
+                continue
+            total -= self._page_bytes(self.pages.pop(z))
+
+    def get(self, key, zoom=1.0):
+        if zoom == 1.0:
+            return self.bank.get(key)
+        page = self.pages.get(zoom)
+        if page is None:
+            page = self._build_page(zoom)
+            self.pages[zoom] = page
+            self._evict(zoom)
+        else:
+            self.pages.move_to_end(zoom)
+        return page[1].get(key)
+
+    def warm(self, levels=ZOOM_LEVELS):
+        for z in levels:
+            self.get(self.keys[0], z)
+
+    def clear(self):
+        self.surface = None
+        self.rects.clear()
+        self.anchors.clear()
+        self.pages.clear()
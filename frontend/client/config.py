@@ -3,8 +3,82 @@
 WINDOW_WIDTH = 1024
 WINDOW_HEIGHT = 768
 GRID_SIZE = 24
+# Discrete camera zoom levels (spectator/caster view). Sprites are pre-scaled per level.
+ZOOM_LEVELS = (0.25, 0.5, 0.75, 1.0, 1.5, 2.0)
+ATLAS_BUDGET_BYTES = 8 * 1024 * 1024
+
+# Internal render scale for the world/fog layers (HUD stays native). < 1.0 draws the world into
+# a smaller buffer that is upscaled to the window once per frame.
+RENDER_SCALE = 1.0
+RENDER_SCALE_CHOICES = (1.0, 0.75, 0.5)
+RENDER_SCALE_SMOOTH = True
 FONT_SIZE = 20
 
+# Fog mask resolution relative to the window. 1.0 = full resolution;
+# e.g. 0.5 builds the FOV mask at half size and smoothscales it up (cheaper, softer edge).
+FOG_MASK_SCALE = 1.0
+
+# Frame pacing. FPS_CAP 0 = uncapped (use with vsync). Idle = menus/PAUSE,
+# background = window unfocused or minimized.
+FPS_CAP = 60
+FPS_CAP_CHOICES = (30, 60, 120, 144, 0)
+IDLE_FPS = 30
+BACKGROUND_FPS = 10
+MAX_FRAME_DT = 0.25
+# Fixed-rate simulation step (input sampling/sending, network apply, look smoothing), independent of FPS.
+SIM_HZ = 60
+SIM_MAX_STEPS = 5
+
+# Debug profiler overlay (F3 in dev mode): frames kept for rolling stats / graph / CSV dump.
+PROFILER_HISTORY = 300
+PROFILER_TEXT_HZ = 4
+
+# Trace-event capture (--trace / ECHO_TRACE_TRACE): ring buffer size in events, oldest overwritten.
+TRACE_BUFFER_EVENTS = 200000
+
+# Client state file (~/.echo_trace_client.json): writes within this window are coalesced.
+STATE_SAVE_DEBOUNCE = 0.5
+
+# Session recording (--record / ECHO_TRACE_RECORD): raw bytes per zlib block, max seconds between flushes.
+RECORD_BLOCK_BYTES = 256 * 1024
+RECORD_FLUSH_SEC = 1.0
+RECORD_ZLIB_LEVEL = 6
+# Keyframe (latest full-state frames) spacing in recording seconds; bounds how much a seek decompresses.
+RECORD_KEYFRAME_SEC = 5.0
+
+# Potentially-visible sets (client/pvs.py): built per map for view radii up to PVS_MAX_RADIUS tiles;
+# PVS_RAY_SPACING is the widest gap (tiles) between neighbouring rays at the edge of that radius and
+# PVS_ORIGIN_STEPS the number of ray origins per tile side; both set how far walls are eroded.
+# Below PVS_MIN_RADIUS the plain LOS raymarch is cheaper than the table lookup, so none is built.
+# Off by default: on the backend's scattered-wall maps the conservative sets keep >90% of tiles,
+# so the lookup does not pay for itself; worth enabling for maps with long walls and closed rooms.
+PVS_ENABLED = False
+PVS_MIN_RADIUS = 12.0
+PVS_MAX_RADIUS = 16.0
+PVS_RADIUS_MARGIN = 2.0
+PVS_RAY_SPACING = 0.2
+PVS_ORIGIN_STEPS = 3
+
+# Static maze layer (client/map_cache.py): pre-rendered chunks of this many tiles per side, shared by all views.
+MAP_CHUNK_TILES = 16
+MAP_CHUNK_BUDGET_BYTES = 48 * 1024 * 1024
+# Spectator dashboard (Tab while spectating): at most this many follow-cams plus the overview.
+SPECTATOR_MAX_POVS = 16
+
+# Footstep ripples (client/ripples.py): fixed pool with a hard cap (oldest ring is recycled when full);
+# events from the same direction bin merge into one emitter that starts a ring at most every RIPPLE_EMIT_SEC.
+RIPPLE_POOL_SIZE = 48
+RIPPLE_DIR_BINS = 32
+RIPPLE_EMIT_SEC = 0.3
+RIPPLE_LIFE_SEC = 1.0
+RIPPLE_FRAMES = 8
+
+# Room browser: the list is re-requested this often while open (0 = manual refresh only).
+ROOM_LIST_REFRESH_SEC = 3.0
+
+# Radar: the maze thumbnail is cached per map; blips/self marker redraw at this rate (0 = every frame).
+MINIMAP_DYNAMIC_HZ = 15
+
 # Colors
 COLOR_BG = (10, 10, 15)
 COLOR_GRID = (30, 30, 40)
@@ -20,6 +94,7 @@ COLOR_BTN = (50, 50, 60)
 COLOR_INV_BG = (30, 30, 40, 200)
 COLOR_RADAR_BG = (0, 20, 30, 200)
 COLOR_RADAR_BORDER = (0, 200, 255)
+COLOR_RIPPLE = (120, 200, 255)
 
 COLOR_ITEM_OFFENSE = (255, 100, 100)
 COLOR_ITEM_SURVIVAL = (100, 255, 100)
@@ -0,0 +1,131 @@
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+import pygame
+
+FONT_CACHE_PATH = Path.home() / ".echo_trace_fonts.json"
+
+# Directories whose mtimes change when fonts are installed/removed or fontconfig rebuilds its cache.
+_FONT_DIRS = [
+    "/usr/share/fonts", "/usr/local/share/fonts", "/var/cache/fontconfig",
+    "~/.fonts", "~/.local/share/fonts", "~/.cache/fontconfig",
+    "/Library/Fonts", "/System/Library/Fonts", "~/Library/Fonts",
+    os.path.join(os.environ.get("WINDIR", "C:\\Windows"), "Fonts"),
+]
+
+
+def _fingerprint():
+    # Cheap: a handful of stat() calls instead of a full fontconfig enumeration.
+    parts = [sys.platform, pygame.version.ver]
+    for d in _FONT_DIRS:
+        p = os.path.expanduser(d)
+        try:
+            parts.append(f"{p}:{int(os.stat(p).st_mtime)}")
+        except OSError:
+            pass
+    return "|".join(parts)
+
+
+class FontCache:
+    """Persistent cache of pygame.font.match_font lookups.
+
+    Results (including misses) are keyed by the ordered candidate name list and stored on
+    disk together with an OS/font-directory fingerprint. A hit skips match_font entirely;
+    a background refresh re-resolves cached queries so newly installed fonts show up on
+    the next launch.
+    """
+
+    def __init__(self, path=FONT_CACHE_PATH):
+        self.path = Path(path)
+        self.fingerprint = _fingerprint()
+        self.entries = {}
+        self._lock = threading.Lock()
+        # match_font lazily builds pygame.sysfont's module-global table and isn't thread-safe;
+        # every lookup (main thread or background refresh) goes through this lock.
+        self._resolve_lock = threading.Lock()
+        self._dirty = False
+        self._loaded_from_disk = False
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get("fingerprint") == self.fingerprint:
+                self.entries = dict(data.get("fonts") or {})
+                self._loaded_from_disk = True
+        except Exception:
+            self.entries = {}
+
+    def _resolve(self, names):
+        with self._resolve_lock:
+            for name in names:
+                fp = pygame.font.match_font(name)
+                if fp:
+                    return fp
+        return None
+
+    def match(self, names):
+        """Return the first matching font file path for the candidate names, or None."""
+        key = ",".join(names)
+        with self._lock:
+            if key in self.entries:
+                fp = self.entries[key]
+                if fp is None or os.path.exists(fp):
+                    return fp
+        fp = self._resolve(names)
+        with self._lock:
+            self.entries[key] = fp
+            self._dirty = True
+        return fp
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            data = {"fingerprint": self.fingerprint, "fonts": dict(self.entries)}
+            self._dirty = False
+        try:
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except Exception:
+            pass
+
+    def refresh_in_background(self):
+        """Re-resolve cached queries off the main thread (only needed when we started from disk)."""
+        if not self._loaded_from_disk:
+            self.save()
+            return None
+
+        def run():
+            with self._lock:
+                keys = list(self.entries.keys())
+            changed = False
+            for key in keys:
+                fp = self._resolve(key.split(","))
+                with self._lock:
+                    if self.entries.get(key) != fp:
+                        self.entries[key] = fp
+                        changed = True
+            if changed:
+                with self._lock:
+                    self._dirty = True
+                self.save()
+
+        t = threading.Thread(target=run, daemon=True)
+        t.start()
+        return t
+
+
+font_cache = None
+
+
+def get_font_cache():
+    global font_cache
+    if font_cache is None:
+        font_cache = FontCache()
+    return font_cache
@@ -0,0 +1,107 @@
+import collections
+import pygame
+from client.config import FPS_CAP, IDLE_FPS, BACKGROUND_FPS, MAX_FRAME_DT, FPS_CAP_CHOICES, SIM_HZ, SIM_MAX_STEPS
+
+
+class FramePacer:
+    """Frame limiter + measured dt.
+
+    tick() sleeps to the current target rate and returns the real elapsed time of
+    the frame in seconds (clamped to MAX_FRAME_DT so a stalled frame can't
+    teleport the camera). The target rate drops automatically when the window is
+    unfocused/minimized (BACKGROUND_FPS) or the client is idle in menus/PAUSE
+    (IDLE_FPS).
+    """
+
+    def __init__(self, fps_cap=FPS_CAP, vsync=False, history=240):
+        self.clock = pygame.time.Clock()
+        self.fps_cap = int(fps_cap or 0)
+        self.vsync = bool(vsync)
+        self.focused = True
+        self.minimized = False
+        self.idle = False
+        self.dt = 1.0 / float(self.fps_cap or 60)
+        self.frame_times_ms = collections.deque(maxlen=history)
+
+    def handle_event(self, event):
+        et = event.type
+        if et == getattr(pygame, "WINDOWFOCUSLOST", None):
+            self.focused = False
+        elif et == getattr(pygame, "WINDOWFOCUSGAINED", None):
+            self.focused = True
+        elif et in (getattr(pygame, "WINDOWMINIMIZED", None), getattr(pygame, "WINDOWHIDDEN", None)):
+            self.minimized = True
+        elif et in (getattr(pygame, "WINDOWRESTORED", None), getattr(pygame, "WINDOWSHOWN", None), getattr(pygame, "WINDOWMAXIMIZED", None)):
+            self.minimized = False
+
+    def set_fps_cap(self, fps_cap):
+        self.fps_cap = max(0, int(fps_cap or 0))
+
+    def cycle_fps_cap(self):
+        choices = list(FPS_CAP_CHOICES)
+        try:
+            i = choices.index(self.fps_cap)
+        except ValueError:
+            i = -1
+        self.set_fps_cap(choices[(i + 1) % len(choices)])
+        return self.fps_cap
+
+    def target_fps(self):
+        if self.minimized or not self.focused:
+            return BACKGROUND_FPS
+        if self.idle:
+            return min(IDLE_FPS, self.fps_cap) if self.fps_cap else IDLE_FPS
+        # 0 = uncapped (with vsync the display flip does the pacing).
+        return self.fps_cap
+
+    def is_throttled(self):
+        return self.target_fps() != self.fps_cap
+
+    def tick(self, idle=False):
+        self.idle = bool(idle)
+        ms = self.clock.tick(self.target_fps())
+        self.frame_times_ms.append(float(ms))
+        self.dt = min(MAX_FRAME_DT, max(0.0, ms / 1000.0))
+        return self.dt
+
+    def stats(self):
+        ft = sorted(self.frame_times_ms)
+        if not ft:
+            return {"fps": 0.0, "avg_ms": 0.0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0, "target_fps": self.target_fps()}
+        n = len(ft)
+        avg = sum(ft) / n
+        return {
+            "fps": self.clock.get_fps(),
+            "avg_ms": avg,
+            "p50_ms": ft[n // 2],
+            "p99_ms": ft[min(n - 1, int(n * 0.99))],
+            "max_ms": ft[-1],
+            "target_fps": self.target_fps(),
+        }
+
+
+class FixedTimestep:
+    """Accumulator for a fixed-rate update decoupled from the render rate.
+
+    advance(frame_dt) returns how many fixed steps to run this frame; at most max_steps, the
+    rest of a long stall is dropped instead of spiralling. `alpha` is the leftover fraction
+    of a step, used by the renderer to interpolate between the last two update states.
+    """
+
+    def __init__(self, hz=SIM_HZ, max_steps=SIM_MAX_STEPS):
+        self.step = 1.0 / float(hz)
+        self.max_steps = int(max_steps)
+        self.acc = 0.0
+        self.alpha = 1.0
+        self.dropped = 0.0
+
+    def advance(self, frame_dt):
+        self.acc += max(0.0, float(frame_dt))
+        n = int(self.acc / self.step)
+        if n > self.max_steps:
+            self.dropped += (n - self.max_steps) * self.step
+            self.acc -= (n - self.max_steps) * self.step
+            n = self.max_steps
+        self.acc -= n * self.step
+        self.alpha = self.acc / self.step
+        return n
@@ -11,6 +11,7 @@ class GameState:
         self.my_pos = [0, 0]
         self.my_hp = 100
         self.view_radius = 5.0
+        self.hear_radius = 12.0
         self.my_inventory = []
         self.inventory_cap = 6
         self.funds = 0
@@ -30,6 +31,38 @@ class GameState:
         self.config = {}
         self.tactic_chosen = False
 
+        # Positions at the start of the current fixed update (for render interpolation)
+        self.prev_my_pos = (0, 0)
+        self.prev_player_pos = {}
+
+    def begin_tick(self):
+        self.prev_my_pos = (self.my_pos[0], self.my_pos[1])
+        self.prev_player_pos = {pid: (p["pos"]["x"], p["pos"]["y"]) for pid, p in self.players.items()}
+
+    def lerp_my_pos(self, alpha):
+        x, y = self.my_pos[0], self.my_pos[1]
+        if alpha >= 1.0:
+            return x, y
+        px, py = self.prev_my_pos
+        return px + (x - px) * alpha, py + (y - py) * alpha
+
+    def lerp_player_pos(self, pid, p, alpha):
+        x, y = p["pos"]["x"], p["pos"]["y"]
+        prev = self.prev_player_pos.get(pid)
+        if prev is None or alpha >= 1.0:
+            return x, y
+        return prev[0] + (x - prev[0]) * alpha, prev[1] + (y - prev[1]) * alpha
+
+    def load_map(self, payload):
+        # GAME_START_PUSH (3001): static maze for the whole match.
+        self.map_tiles = payload["map_tiles"]
+        self.map_height = int(payload.get("map_height") or len(self.map_tiles))
+        self.map_width = int(payload.get("map_width") or (len(self.map_tiles[0]) if self.map_tiles else 0))
+        sp = payload.get("spawn_pos")
+        if sp:
+            self.my_pos = [sp["x"], sp["y"]]
+            self.prev_my_pos = (sp["x"], sp["y"])
+
     def update_from_server(self, payload):
         # Global
         self.phase = payload.get("phase", 0)
@@ -52,6 +85,7 @@ class GameState:
             self.my_pos = [s["pos"]["x"], s["pos"]["y"]]
             self.my_hp = s["hp"]
             self.view_radius = s["view_radius"]
+            self.hear_radius = s.get("hear_radius", self.hear_radius)
             self.funds = s.get("funds", 0)
             self.is_extracted = s.get("is_extracted", False)
             inv = s.get("inventory")
@@ -1,5 +1,31 @@
 import json
 import os
+import weakref
+
+# Resolved once, relative to this module (frontend/assets/locales), instead of probing the cwd.
+LOCALE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "assets", "locales")
+
+# Every key seen in any locale file gets a stable integer id; catalogs are tuples indexed by it.
+_KEY_IDS = {}
+
+
+def key_id(key):
+    i = _KEY_IDS.get(key)
+    if i is None:
+        i = _KEY_IDS[key] = len(_KEY_IDS)
+    return i
+
+
+# Ids for labels drawn every frame; t() accepts these as well as key strings.
+K_PHASE_INIT = key_id("PHASE_INIT")
+K_PHASE_SEARCH = key_id("PHASE_SEARCH")
+K_PHASE_CONFLICT = key_id("PHASE_CONFLICT")
+K_PHASE_ESCAPE = key_id("PHASE_ESCAPE")
+K_PHASE_ENDED = key_id("PHASE_ENDED")
+K_HUD_CONTROLS = key_id("HUD_CONTROLS")
+# Indexed by phase (0..4).
+PHASE_KEYS = (K_PHASE_INIT, K_PHASE_SEARCH, K_PHASE_CONFLICT, K_PHASE_ESCAPE, K_PHASE_ENDED)
+
 
 class I18n:
     _instance = None
@@ -9,40 +35,76 @@ class I18n:
             cls._instance = super(I18n, cls).__new__(cls)
             cls._instance.lang = "zh"
             cls._instance.data = {}
+            cls._instance._catalogs = {}
+            cls._instance._listeners = []
+            # Bumped on every language switch; caches of rendered text can key on it.
+            cls._instance.version = 0
             cls._instance.load_locales()
         return cls._instance
 
+    LANGS = ("en", "zh")
+
     def load_locales(self):
-        # Assumes running from 'frontend/' directory or project root
-        base_path = os.path.join("assets", "locales")
-        # Try finding assets folder
-        if not os.path.exists(base_path):
-             # Try going up one level if we are in frontend/client/
-             base_path = os.path.join("..", "assets", "locales")
-        
-        # Fallback to absolute relative to this file
-        if not os.path.exists(base_path):
-             base_path = os.path.join(os.path.dirname(__file__), "..", "..", "assets", "locales")
-
-        for lang in ["en", "zh"]:
-            path = os.path.join(base_path, f"{lang}.json")
-            try:
-                with open(path, "r", encoding="utf-8") as f:
-                    self.data[lang] = json.load(f)
-            except Exception as e:
-                print(f"Error loading locale {lang}: {e}")
-                self.data[lang] = {}
+        # Only the active language is read at startup; others load on first set_lang().
+        self.data = {}
+        self._catalogs = {}
+        self._load(self.lang)
+        self.catalog = self._compile(self.lang)
 
-    def set_lang(self, lang):
+    def _load(self, lang):
         if lang in self.data:
-            self.lang = lang
+            return
+        path = os.path.join(LOCALE_DIR, f"{lang}.json")
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                self.data[lang] = json.load(f)
+        except Exception as e:
+            print(f"Error loading locale {lang}: {e}")
+            self.data[lang] = {}
+        for key in self.data[lang]:
+            key_id(key)
+
+    def _compile(self, lang):
+        # Missing keys resolve to the key itself. A catalog compiled before another language
+        # registered new keys is shorter than the id table and gets rebuilt.
+        cat = self._catalogs.get(lang)
+        if cat is None or len(cat) != len(_KEY_IDS):
+            data = self.data.get(lang, {})
+            cat = self._catalogs[lang] = tuple(data.get(k, k) for k in _KEY_IDS)
+        return cat
+
+    def set_lang(self, lang):
+        if lang not in self.LANGS:
+            return
+        self._load(lang)
+        changed = lang != self.lang
+        self.lang = lang
+        self.catalog = self._compile(lang)
+        if changed:
+            self.version += 1
+            for ref in list(self._listeners):
+                fn = ref()
+                if fn is None:
+                    self._listeners.remove(ref)
+                else:
+                    fn(lang)
+
+    def subscribe(self, callback):
+        """Call `callback(lang)` after each language switch. Bound methods are held weakly."""
+        ref = weakref.WeakMethod(callback) if hasattr(callback, "__self__") else (lambda cb=callback: cb)
+        self._listeners.append(ref)
 
     def t(self, key):
-        return self.data.get(self.lang, {}).get(key, key)
+        if key.__class__ is int:
+            return self.catalog[key]
+        i = _KEY_IDS.get(key)
+        if i is None or i >= len(self.catalog):
+            return key
+        return self.catalog[i]
 
     def get_list(self, key):
         # For manual lines etc.
-        val = self.data.get(self.lang, {}).get(key, [])
+        val = self.t(key)
         if isinstance(val, list):
             return val
         return []
@@ -0,0 +1,79 @@
+import collections
+import pygame
+from client.config import COLOR_BG, COLOR_GRID, COLOR_WALL, COLOR_WALL_EDGE, MAP_CHUNK_TILES, MAP_CHUNK_BUDGET_BYTES
+
+
+class MapChunkCache:
+    """The static maze pre-rendered in MAP_CHUNK_TILES x MAP_CHUNK_TILES tile blocks.
+
+    Chunks are rasterized on first use per on-screen tile size (cell) and then only blitted;
+    every view (the player camera, spectator follow-cams, the overview) draws from the same
+    cache. Least-recently-used chunks are dropped once their total size exceeds
+    MAP_CHUNK_BUDGET_BYTES. A new map (a different map_tiles list) clears everything.
+    """
+
+    def __init__(self, chunk=MAP_CHUNK_TILES, budget_bytes=MAP_CHUNK_BUDGET_BYTES):
+        self.chunk = int(chunk)
+        self.budget_bytes = int(budget_bytes)
+        self.tiles = None
+        self.chunks = collections.OrderedDict()  # (cell, cx, cy) -> Surface
+        self.bytes = 0
+
+    def _build(self, cell, cx, cy):
+        tiles = self.tiles
+        n = self.chunk
+        x0, y0 = cx * n, cy * n
+        x1, y1 = min(len(tiles[0]), x0 + n), min(len(tiles), y0 + n)
+        s = pygame.Surface(((x1 - x0) * cell, (y1 - y0) * cell))
+        if pygame.display.get_surface() is not None:
+            s = s.convert()
+        s.fill(COLOR_BG)
+        for y in range(y0, y1):
+            row = tiles[y]
+            for x in range(x0, x1):
+                rect = ((x - x0) * cell, (y - y0) * cell, cell, cell)
+                pygame.draw.rect(s, COLOR_GRID, rect, 1)
+                if row[x] == 1:
+                    pygame.draw.rect(s, COLOR_WALL, rect); pygame.draw.rect(s, COLOR_WALL_EDGE, rect, 1)
+        return s
+
+    def get(self, cell, cx, cy):
+        key = (cell, cx, cy)
+        s = self.chunks.get(key)
+        if s is None:
+            s = self.chunks[key] = self._build(cell, cx, cy)
+            w, h = s.get_size()
+            self.bytes += w * h * 4
+            while self.bytes > self.budget_bytes and len(self.chunks) > 1:
+                _, old = self.chunks.popitem(last=False)
+                ow, oh = old.get_size()
+                self.bytes -= ow * oh * 4
+        else:
+            self.chunks.move_to_end(key)
+        return s
+
+    def draw(self, target, tiles, cell, ox, oy, clip=None):
+        """Blit the chunks overlapping `clip` (default: the whole target). Tile (x, y) lands at
+        (int(x * cell + ox), int(y * cell + oy)), matching Renderer.world_to_screen."""
+        if not tiles:
+            return
+        if tiles is not self.tiles:
+            self.clear()
+            self.tiles = tiles
+        clip = pygame.Rect(clip) if clip is not None else target.get_rect()
+        span = self.chunk * cell
+        nx = (len(tiles[0]) + self.chunk - 1) // self.chunk
+        ny = (len(tiles) + self.chunk - 1) // self.chunk
+        c0 = max(0, int((clip.left - ox) // span)); c1 = min(nx, int((clip.right - ox) // span) + 1)
+        r0 = max(0, int((clip.top - oy) // span)); r1 = min(ny, int((clip.bottom - oy) // span) + 1)
+        items = []
+        for cy in range(r0, r1):
+            for cx in range(c0, c1):
+                items.append((self.get(cell, cx, cy), (int(cx * span + ox), int(cy * span + oy))))
+        if items:
+            target.blits(items, doreturn=False)
+
+    def clear(self):
+        self.tiles = None
+        self.chunks.clear()
+        self.bytes = 0
@@ -0,0 +1,101 @@
+import time
+import pygame
+from client.config import COLOR_RADAR_BG, COLOR_RADAR_BORDER, COLOR_WALL, COLOR_SELF, MINIMAP_DYNAMIC_HZ
+
+# Colorkey for the cached layers (keeps the radar background opaque like a direct draw,
+# while letting the rounded corners / empty dynamic layer pass through).
+_KEY = (1, 2, 3)
+
+
+class Minimap:
+    """Radar with a static layer and a throttled dynamic layer.
+
+    The static layer (background, border, maze thumbnail) is rasterized once per map at
+    the real map_width/map_height. The dynamic layer (self marker + blips) is redrawn at
+    MINIMAP_DYNAMIC_HZ; both are just blitted on the other frames.
+    """
+
+    def __init__(self, rect, pad=5):
+        self.rect = pygame.Rect(rect)
+        self.pad = pad
+        self.inner = pygame.Rect(0, 0, self.rect.w - pad * 2, self.rect.h - pad * 2)
+        self.scale = 1.0
+        self.origin = (pad, pad)
+        self.map_key = None
+        self.base = None
+        self.dynamic = pygame.Surface(self.rect.size)
+        self.dynamic.set_colorkey(_KEY)
+        self.dynamic.fill(_KEY)
+        self.interval = 1.0 / float(MINIMAP_DYNAMIC_HZ) if MINIMAP_DYNAMIC_HZ else 0.0
+        self.last_dynamic = 0.0
+        self._build_base(None, 0, 0)
+
+    def _build_base(self, tiles, w, h):
+        base = pygame.Surface(self.rect.size)
+        base.set_colorkey(_KEY)
+        base.fill(_KEY)
+        local = pygame.Rect(0, 0, self.rect.w, self.rect.h)
+        pygame.draw.rect(base, COLOR_RADAR_BG[:3], local, border_radius=10)
+        if tiles and w > 0 and h > 0:
+            self.scale = min(self.inner.w / float(w), self.inner.h / float(h))
+            tw, th = max(1, int(w * self.scale)), max(1, int(h * self.scale))
+            self.origin = (self.pad + (self.inner.w - tw) // 2, self.pad + (self.inner.h - th) // 2)
+            # One pixel per tile, then a single nearest-neighbour scale to the radar size.
+            thumb = pygame.Surface((w, h))
+            thumb.fill(COLOR_RADAR_BG[:3])
+            px = pygame.PixelArray(thumb)
+            wall = thumb.map_rgb(COLOR_WALL)
+            for y, row in enumerate(tiles[:h]):
+                for x, v in enumerate(row[:w]):
+                    if v == 1:
+                        px[x, y] = wall
+            del px
+            base.blit(pygame.transform.scale(thumb, (tw, th)), self.origin)
+        else:
+            self.scale = self.inner.w / 32.0
+            self.origin = (self.pad, self.pad)
+        pygame.draw.rect(base, COLOR_RADAR_BORDER, local, 2, border_radius=10)
+        self.base = base
+
+    def rebuild(self, state):
+        tiles = state.map_tiles
+        h = int(getattr(state, "map_height", 0) or len(tiles))
+        w = int(getattr(state, "map_width", 0) or (len(tiles[0]) if tiles else 0))
+        self._build_base(tiles, w, h)
+        self.map_key = self._map_key(state)
+        self.last_dynamic = 0.0
+
+    def _map_key(self, state):
+        return (id(state.map_tiles), getattr(state, "map_width", 0), getattr(state, "map_height", 0))
+
+    def invalidate(self):
+        self.last_dynamic = 0.0
+
+    def to_local(self, wx, wy):
+        return int(self.origin[0] + wx * self.scale), int(self.origin[1] + wy * self.scale)
+
+    def _draw_dynamic(self, state, is_visible, show_blips):
+        d = self.dynamic
+        d.fill(_KEY)
+        if show_blips:
+            for blip in state.radar_blips:
+                bxw, byw = blip["pos"]["x"], blip["pos"]["y"]
+                if not is_visible(state, bxw, byw):
+                    continue
+                bx, by = self.to_local(bxw, byw)
+                bt = blip["type"]
+                if bt == "MOTOR": pygame.draw.circle(d, (255,255,0), (bx, by), 3)
+                elif bt == "EXIT": pygame.draw.circle(d, (0,255,0), (bx, by), 4)
+                elif bt == "SUPPLY_DROP": pygame.draw.rect(d, (255,0,255), (bx-3, by-3, 6, 6))
+                elif bt == "MERCHANT": pygame.draw.rect(d, (255,215,0), (bx-3, by-3, 6, 6))
+        pygame.draw.circle(d, COLOR_SELF, self.to_local(state.my_pos[0], state.my_pos[1]), 3)
+
+    def draw(self, screen, state, is_visible, show_blips=True, now=None):
+        if state.map_tiles and self._map_key(state) != self.map_key:
+            self.rebuild(state)
+        now = time.perf_counter() if now is None else now
+        if now - self.last_dynamic >= self.interval:
+            self._draw_dynamic(state, is_visible, show_blips)
+            self.last_dynamic = now
+        screen.blit(self.base, self.rect.topleft)
+        screen.blit(self.dynamic, self.rect.topleft)
@@ -1,16 +1,18 @@
 import threading
-import websocket
 import json
 import time
+from client import protocol, tracing
 
 
 class NetworkClient:
-    def __init__(self, url, recv_queue, session_id=None, player_name=None):
+    def __init__(self, url, recv_queue, session_id=None, player_name=None, recorder=None):
         self.url = url
         self.recv_queue = recv_queue
+        # Optional client.recording.SessionRecorder: raw frames in both directions.
+        self.recorder = recorder
         self.ws = None
         self.running = True
-        self.thread = threading.Thread(target=self._run)
+        self.thread = threading.Thread(target=self._run, name="network")
         self.thread.daemon = True
         self.connected = False
 
@@ -23,6 +25,8 @@ class NetworkClient:
         self.thread.start()
 
     def _run(self):
+        # Imported here so websocket-client's import cost lands on the network thread, not startup.
+        import websocket
         while self.running:
             try:
                 print(f"Connecting to {self.url}...")
@@ -50,19 +54,17 @@ class NetworkClient:
             nm = self.player_name
 
         if room_id:
-            payload = {"room_id": room_id}
-            if sid:
-                payload["session_id"] = sid
-            if nm:
-                payload["name"] = nm
-            self.send({"type": 1011, "payload": payload})
+            self.send(protocol.JoinRoom(room_id=room_id, session_id=sid or None, name=nm or None))
 
     def _on_message(self, ws, message):
-        try:
-            data = json.loads(message)
-            self.recv_queue.put(data)
-        except Exception as e:
-            print(f"JSON Parse Error: {e}")
+        with tracing.span("net.on_message", "net"):
+            if self.recorder is not None:
+                self.recorder.record_in(message)
+            try:
+                data = json.loads(message)
+                self.recv_queue.put(data)
+            except Exception as e:
+                print(f"JSON Parse Error: {e}")
 
     def _on_error(self, ws, error):
         print(f"WS Error: {error}")
@@ -73,10 +75,14 @@ class NetworkClient:
 
     def send(self, data):
         if self.ws and self.connected:
-            try:
-                self.ws.send(json.dumps(data))
-            except Exception as e:
-                print(f"Send Error: {e}")
+            with tracing.span("net.send", "net"):
+                try:
+                    text = json.dumps(data.to_msg() if hasattr(data, "to_msg") else data)
+                    self.ws.send(text)
+                    if self.recorder is not None:
+                        self.recorder.record_out(text)
+                except Exception as e:
+                    print(f"Send Error: {e}")
 
     def set_identity(self, session_id=None, player_name=None):
         with self._lock:
@@ -0,0 +1,90 @@
+import json
+import os
+import threading
+import time
+
+from client.config import STATE_SAVE_DEBOUNCE
+
+
+class JsonStateWriter:
+    """Debounced, atomic JSON writer running on a background thread.
+
+    save(data) snapshots the dict and returns immediately; the writer thread waits
+    `debounce` seconds for further saves, then writes only the latest snapshot to a temp
+    file and os.replace()s it over the target, so a crash never leaves a truncated file
+    and a slow disk never stalls a frame. flush() blocks until pending data is on disk;
+    close() flushes and stops the thread.
+    """
+
+    def __init__(self, path, debounce=STATE_SAVE_DEBOUNCE):
+        self.path = str(path)
+        self.debounce = max(0.0, float(debounce))
+        self._cond = threading.Condition()
+        self._pending = None
+        self._due = 0.0
+        self._writing = False
+        self._closed = False
+        self._thread = None
+
+    def save(self, data):
+        snap = dict(data)
+        with self._cond:
+            if self._closed:
+                self._write(snap)
+                return
+            if self._pending is None:
+                self._due = time.monotonic() + self.debounce
+            self._pending = snap
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="state-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self, timeout=5.0):
+        end = time.monotonic() + timeout
+        with self._cond:
+            self._due = 0.0
+            self._cond.notify_all()
+            while (self._pending is not None or self._writing) and self._thread is not None:
+                left = end - time.monotonic()
+                if left <= 0:
+                    return False
+                self._cond.wait(left)
+        return True
+
+    def close(self, timeout=5.0):
+        ok = self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        return ok
+
+    def _run(self):
+        with self._cond:
+            while True:
+                while self._pending is None and not self._closed:
+                    self._cond.wait()
+                if self._pending is None:
+                    return
+                left = self._due - time.monotonic()
+                if left > 0 and not self._closed:
+                    self._cond.wait(left)
+                    continue
+                snap, self._pending = self._pending, None
+                self._writing = True
+                self._cond.release()
+                try:
+                    self._write(snap)
+                finally:
+                    self._cond.acquire()
+                    self._writing = False
+                    self._cond.notify_all()
+
+    def _write(self, snap):
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(snap, f, ensure_ascii=False, indent=2)
+            os.replace(tmp, self.path)
+        except Exception as e:
+            print(f"State save failed: {e}")
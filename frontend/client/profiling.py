@@ -0,0 +1,165 @@
+import collections
+import csv
+import time
+from pathlib import Path
+
+import pygame
+from client.config import PROFILER_HISTORY, PROFILER_TEXT_HZ
+
+
+class StageTimer:
+    """Splits a frame into named stages with perf_counter marks.
+
+    begin_frame() starts the clock; each mark(name) attributes the time since the previous
+    mark to `name` (repeated names accumulate); end_frame() returns {stage: seconds} plus
+    "total". Consumers (benchmarks, the debug overlay) attach one to the Renderer /
+    main loop; when none is attached the call sites cost a single None check. With a
+    client.tracing.Tracer set as `tracer`, every mark is also emitted as a trace span.
+    """
+
+    def __init__(self, clock=time.perf_counter, tracer=None):
+        self.clock = clock
+        self.tracer = tracer
+        self.stages = {}
+        self._start = 0.0
+        self._last = 0.0
+
+    def begin_frame(self):
+        self.stages = {}
+        self._start = self._last = self.clock()
+
+    def mark(self, name):
+        now = self.clock()
+        self.stages[name] = self.stages.get(name, 0.0) + (now - self._last)
+        if self.tracer is not None:
+            self.tracer.complete(name, self._last, now, "stage")
+        self._last = now
+
+    def end_frame(self):
+        out = self.stages
+        out["total"] = self._last - self._start
+        self.stages = {}
+        return out
+
+
+class ProfilerOverlay:
+    """In-game frame profiler (F3 in dev mode).
+
+    Wraps a StageTimer for the main loop + Renderer.draw_game and keeps the last `history`
+    frames. draw() shows per-stage rolling avg/p99 and a graph of frame work time (the
+    pacer's sleep is excluded); dump_csv() writes the raw per-frame rows for bug reports.
+    Recording calls are no-ops unless the overlay is shown or a tracer is attached to the timer.
+    """
+
+    GRAPH_H = 60
+    WIDTH = 340
+
+    def __init__(self, history=PROFILER_HISTORY):
+        self.timer = StageTimer()
+        self.frames = collections.deque(maxlen=history)
+        self.order = []
+        self.visible = False
+        self.message = ""
+        self._message_until = 0.0
+        self._lines = []
+        self._lines_at = 0.0
+        self._panel = None
+
+    @property
+    def recording(self):
+        return self.visible or self.timer.tracer is not None
+
+    def set_visible(self, visible):
+        self.visible = bool(visible)
+        if self.visible:
+            self.timer.begin_frame()
+        return self.visible
+
+    def begin_frame(self):
+        if self.recording:
+            self.timer.begin_frame()
+
+    def mark(self, name):
+        if self.recording:
+            self.timer.mark(name)
+
+    def end_frame(self):
+        if not self.recording:
+            return
+        stages = self.timer.end_frame()
+        for name in stages:
+            if name != "total" and name not in self.order:
+                self.order.append(name)
+        self.frames.append(stages)
+
+    def summary(self):
+        """[(stage, avg_ms, p99_ms)] over the kept frames, stages in first-seen order, "total" last."""
+        out = []
+        n = len(self.frames)
+        if not n:
+            return out
+        for name in self.order + ["total"]:
+            v = sorted(f.get(name, 0.0) * 1000.0 for f in self.frames)
+            out.append((name, sum(v) / n, v[min(n - 1, int(n * 0.99))]))
+        return out
+
+    def dump_csv(self, path=None):
+        if path is None:
+            path = Path.home() / f"echo_trace_profile_{time.strftime('%Y%m%d_%H%M%S')}.csv"
+        cols = self.order + ["total"]
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            w = csv.writer(f)
+            w.writerow(["frame"] + [f"{c}_ms" for c in cols])
+            for i, fr in enumerate(self.frames):
+                w.writerow([i] + [f"{fr.get(c, 0.0) * 1000.0:.3f}" for c in cols])
+        return str(path)
+
+    def notify(self, text, seconds=4.0):
+        self.message = text
+        self._message_until = time.monotonic() + seconds
+
+    def draw(self, screen, font, pacer=None):
+        if not self.visible:
+            return
+        now = time.monotonic()
+        # Re-rendering a dozen text lines every frame would itself show up in the profile.
+        if now - self._lines_at >= 1.0 / PROFILER_TEXT_HZ:
+            self._lines_at = now
+            rows = []
+            if pacer is not None:
+                fs = pacer.stats()
+                rows.append((f"FPS {fs['fps']:.0f}/{fs['target_fps'] or '-'}  frame p99 {fs['p99_ms']:.1f}ms", (255, 255, 0)))
+            rows.append((f"{'stage':<12}{'avg':>8}{'p99':>8}  (ms, {len(self.frames)} frames)", (150, 150, 150)))
+            for name, avg, p99 in self.summary():
+                rows.append((f"{name:<12}{avg:>8.2f}{p99:>8.2f}", (255, 255, 255) if name == "total" else (150, 255, 150)))
+            rows.append(("F3 hide | F4 dump CSV", (150, 150, 150)))
+            self._lines = [font.render(t, True, c) for t, c in rows]
+        lh = font.get_linesize()
+        x, y = screen.get_width() - self.WIDTH - 10, 60
+        h = lh * len(self._lines) + self.GRAPH_H + 20
+        if self._panel is None or self._panel.get_height() != h:
+            self._panel = pygame.Surface((self.WIDTH, h), pygame.SRCALPHA)
+            self._panel.fill((0, 0, 0, 180))
+        screen.blit(self._panel, (x, y))
+        screen.blits([(s, (x + 8, y + 5 + i * lh)) for i, s in enumerate(self._lines)], doreturn=False)
+        self._draw_graph(screen, pygame.Rect(x + 8, y + h - self.GRAPH_H - 8, self.WIDTH - 16, self.GRAPH_H), pacer)
+        if self.message and now < self._message_until:
+            screen.blit(font.render(self.message, True, (255, 255, 0)), (x, y + h + 4))
+
+    def _draw_graph(self, screen, rect, pacer):
+        pygame.draw.rect(screen, (60, 60, 70), rect, 1)
+        if not self.frames:
+            return
+        # Scale so the frame budget sits at half height; spikes above 2x budget clip to the top.
+        target = pacer.target_fps() if pacer is not None else 60
+        budget_ms = 1000.0 / (target or 60)
+        px_per_ms = rect.height / (2.0 * budget_ms)
+        by = rect.bottom - int(budget_ms * px_per_ms)
+        pygame.draw.line(screen, (0, 120, 160), (rect.left, by), (rect.right - 1, by))
+        step = rect.width / float(self.frames.maxlen or len(self.frames))
+        pts = []
+        for i, fr in enumerate(self.frames):
+            ms = fr.get("total", 0.0) * 1000.0
+            pts.append((rect.left + int(i * step), max(rect.top, rect.bottom - 1 - int(ms * px_per_ms))))
+        if len(pts) > 1:
+            pygame.draw.lines(screen, (0, 255, 128), False, pts)
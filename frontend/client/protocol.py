@@ -0,0 +1,960 @@
+# Generated by tools/gen_protocol.py from protocol.json; do not edit by hand.
+# Regenerate with:  cd frontend && python -m tools.gen_protocol
+# Protocol version 1.0.0
+
+
+class C2S:
+    LOGIN_REQ = 1001
+    CREATE_ROOM = 1010
+    JOIN_ROOM = 1011
+    LIST_ROOMS = 1013
+    HEARTBEAT_REQ = 1002
+    MOVE_REQ = 2001
+    USE_ITEM_REQ = 2002
+    INTERACT_REQ = 2003
+    PICKUP_REQ = 2004
+    DROP_REQ = 2005
+    CHOOSE_TACTIC_REQ = 2006
+    BUY_REQ = 2007
+    SELL_REQ = 2008
+    SHOP_REFRESH_REQ = 2009
+    DEV_SKIP_PHASE_REQ = 9001
+
+
+class S2C:
+    LOGIN_RESP = 1001
+    ROOM_JOINED = 1012
+    ROOMS_LIST = 1014
+    HEARTBEAT_RESP = 1002
+    GAME_START_PUSH = 3001
+    GAME_STATE_PUSH = 3002
+    GAME_OVER_PUSH = 3003
+    ERROR_PUSH = 4001
+    MSG_PUSH = 4002
+
+
+MODELS = {
+    "Vector2": (("x", "float64"), ("y", "float64")),
+    "Item": (("uid", "string"), ("id", "string"), ("type", "string"), ("tier", "int")),
+    "PlayerState": (("session_id", "string"), ("pos", "Vector2"), ("hp", "float64"), ("max_hp", "float64"), ("move_speed", "float64"), ("view_radius", "float64"), ("is_alive", "bool"), ("tactic", "string")),
+    "Entity": (("uid", "string"), ("type", "string"), ("pos", "Vector2"), ("state", "int")),
+}
+
+class ProtocolError(ValueError):
+    pass
+
+
+_SCALARS = {"string": str, "int": int, "int64": int, "float64": (int, float), "bool": bool, "object": dict}
+
+
+def _vec2(v):
+    if isinstance(v, dict):
+        return {"x": float(v["x"]), "y": float(v["y"])}
+    return {"x": float(v[0]), "y": float(v[1])}
+
+
+def _check(errors, path, value, ftype):
+    if ftype.endswith("[]"):
+        if not isinstance(value, list):
+            errors.append(f"{path}: expected {ftype}, got {type(value).__name__}")
+            return
+        inner = ftype[:-2]
+        for i, v in enumerate(value):
+            _check(errors, f"{path}[{i}]", v, inner)
+        return
+    model = MODELS.get(ftype)
+    if model is not None:
+        if isinstance(value, (tuple, list)) and ftype == "Vector2" and len(value) == 2:
+            value = {"x": value[0], "y": value[1]}
+        if not isinstance(value, dict):
+            errors.append(f"{path}: expected {ftype}, got {type(value).__name__}")
+            return
+        for key, sub in model:
+            if key in value:
+                _check(errors, f"{path}.{key}", value[key], sub)
+        return
+    py = _SCALARS.get(ftype)
+    if py is None:
+        return
+    if not isinstance(value, py) or (isinstance(value, bool) and ftype != "bool"):
+        errors.append(f"{path}: expected {ftype}, got {type(value).__name__}")
+
+
+def _raw(p):
+    return p
+
+
+def _validate(pkt):
+    errors = []
+    for attr, key, ftype, required in pkt.FIELDS:
+        value = getattr(pkt, attr)
+        if value is None:
+            if required:
+                errors.append(f"{key}: required")
+        else:
+            _check(errors, key, value, ftype)
+    return errors
+
+
+class LoginReq:
+    """C2S_LOGIN_REQ (1001)."""
+    __slots__ = ("name",)
+    TYPE = 1001
+    DIRECTION = "C2S"
+    FIELDS = (
+        ("name", "name", "string", False),
+    )
+
+    def __init__(self, name=None):
+        self.name = name
+
+    def to_payload(self):
+        p = {}
+        if self.name is not None:
+            p["name"] = self.name
+        return p
+
+    def to_msg(self):
+        return {"type": 1001, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls(p.get("name"))
+
+    def validate(self):
+        return _validate(self)
+
+    def __repr__(self):
+        return f"LoginReq(name={self.name!r})"
+
+
+class CreateRoom:
+    """C2S_CREATE_ROOM (1010)."""
+    __slots__ = ("room_name", "config", "session_id", "name", "max_players", "phase1_dur", "phase2_dur", "motors")
+    TYPE = 1010
+    DIRECTION = "C2S"
+    FIELDS = (
+        ("room_name", "room_name", "string", True),
+        ("config", "config", "object", False),
+        ("session_id", "session_id", "string", False),
+        ("name", "name", "string", False),
+        ("max_players", "max_players", "int", False),
+        ("phase1_dur", "phase1_dur", "int", False),
+        ("phase2_dur", "phase2_dur", "int", False),
+        ("motors", "motors", "int", False),
+    )
+
+    def __init__(self, room_name=None, config=None, session_id=None, name=None, max_players=None, phase1_dur=None, phase2_dur=None, motors=None):
+        self.room_name = room_name
+        self.config = config
+        self.session_id = session_id
+        self.name = name
+        self.max_players = max_players
+        self.phase1_dur = phase1_dur
+        self.phase2_dur = phase2_dur
+        self.motors = motors
+
+    def to_payload(self):
+        p = {}
+        if self.room_name is not None:
+            p["room_name"] = self.room_name
+        if self.config is not None:
+            p["config"] = self.config
+        if self.session_id is not None:
+            p["session_id"] = self.session_id
+        if self.name is not None:
+            p["name"] = self.name
+        if self.max_players is not None:
+            p["max_players"] = self.max_players
+        if self.phase1_dur is not None:
+            p["phase1_dur"] = self.phase1_dur
+        if self.phase2_dur is not None:
+            p["phase2_dur"] = self.phase2_dur
+        if self.motors is not None:
+            p["motors"] = self.motors
+        return p
+
+    def to_msg(self):
+        return {"type": 1010, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls(p.get("room_name"), p.get("config"), p.get("session_id"), p.get("name"), p.get("max_players"), p.get("phase1_dur"), p.get("phase2_dur"), p.get("motors"))
+
+    def validate(self):
+        return _validate(self)
+
+    def __repr__(self):
+        return f"CreateRoom(room_name={self.room_name!r}, config={self.config!r}, session_id={self.session_id!r}, name={self.name!r}, max_players={self.max_players!r}, phase1_dur={self.phase1_dur!r}, phase2_dur={self.phase2_dur!r}, motors={self.motors!r})"
+
+
+class ListRooms:
+    """C2S_LIST_ROOMS (1013)."""
+    __slots__ = ()
+    TYPE = 1013
+    DIRECTION = "C2S"
+    FIELDS = ()
+
+    def __init__(self):
+        pass
+
+    def to_payload(self):
+        return {}
+
+    def to_msg(self):
+        return {"type": 1013, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls()
+
+    def validate(self):
+        return []
+
+    def __repr__(self):
+        return "ListRooms()"
+
+
+class HeartbeatReq:
+    """C2S_HEARTBEAT_REQ (1002)."""
+    __slots__ = ("payload",)
+    TYPE = 1002
+    DIRECTION = "C2S"
+    FIELDS = ()
+
+    def __init__(self, payload=None):
+        self.payload = payload
+
+    def to_payload(self):
+        return self.payload if self.payload is not None else {}
+
+    def to_msg(self):
+        return {"type": 1002, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls(p)
+
+    def validate(self):
+        return []
+
+    def __repr__(self):
+        return f"HeartbeatReq({self.payload!r})"
+
+
+class HeartbeatResp:
+    """S2C_HEARTBEAT_RESP (1002)."""
+    __slots__ = ("payload",)
+    TYPE = 1002
+    DIRECTION = "S2C"
+    FIELDS = ()
+
+    def __init__(self, payload=None):
+        self.payload = payload
+
+    def to_payload(self):
+        return self.payload if self.payload is not None else {}
+
+    def to_msg(self):
+        return {"type": 1002, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls(p)
+
+    def validate(self):
+        return []
+
+    def __repr__(self):
+        return f"HeartbeatResp({self.payload!r})"
+
+
+class RoomsList:
+    """S2C_ROOMS_LIST (1014)."""
+    __slots__ = ("rooms",)
+    TYPE = 1014
+    DIRECTION = "S2C"
+    FIELDS = (
+        ("rooms", "rooms", "object[]", False),
+    )
+
+    def __init__(self, rooms=None):
+        self.rooms = rooms
+
+    def to_payload(self):
+        p = {}
+        if self.rooms is not None:
+            p["rooms"] = self.rooms
+        return p
+
+    def to_msg(self):
+        return {"type": 1014, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls(p.get("rooms"))
+
+    def validate(self):
+        return _validate(self)
+
+    def __repr__(self):
+        return f"RoomsList(rooms={self.rooms!r})"
+
+
+class JoinRoom:
+    """C2S_JOIN_ROOM (1011)."""
+    __slots__ = ("room_id", "session_id", "name")
+    TYPE = 1011
+    DIRECTION = "C2S"
+    FIELDS = (
+        ("room_id", "room_id", "string", True),
+        ("session_id", "session_id", "string", False),
+        ("name", "name", "string", False),
+    )
+
+    def __init__(self, room_id=None, session_id=None, name=None):
+        self.room_id = room_id
+        self.session_id = session_id
+        self.name = name
+
+    def to_payload(self):
+        p = {}
+        if self.room_id is not None:
+            p["room_id"] = self.room_id
+        if self.session_id is not None:
+            p["session_id"] = self.session_id
+        if self.name is not None:
+            p["name"] = self.name
+        return p
+
+    def to_msg(self):
+        return {"type": 1011, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls(p.get("room_id"), p.get("session_id"), p.get("name"))
+
+    def validate(self):
+        return _validate(self)
+
+    def __repr__(self):
+        return f"JoinRoom(room_id={self.room_id!r}, session_id={self.session_id!r}, name={self.name!r})"
+
+
+class RoomJoined:
+    """S2C_ROOM_JOINED (1012)."""
+    __slots__ = ("success", "room_id", "room_name", "config")
+    TYPE = 1012
+    DIRECTION = "S2C"
+    FIELDS = (
+        ("success", "success", "bool", False),
+        ("room_id", "room_id", "string", False),
+        ("room_name", "room_name", "string", False),
+        ("config", "config", "object", False),
+    )
+
+    def __init__(self, success=None, room_id=None, room_name=None, config=None):
+        self.success = success
+        self.room_id = room_id
+        self.room_name = room_name
+        self.config = config
+
+    def to_payload(self):
+        p = {}
+        if self.success is not None:
+            p["success"] = self.success
+        if self.room_id is not None:
+            p["room_id"] = self.room_id
+        if self.room_name is not None:
+            p["room_name"] = self.room_name
+        if self.config is not None:
+            p["config"] = self.config
+        return p
+
+    def to_msg(self):
+        return {"type": 1012, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls(p.get("success"), p.get("room_id"), p.get("room_name"), p.get("config"))
+
+    def validate(self):
+        return _validate(self)
+
+    def __repr__(self):
+        return f"RoomJoined(success={self.success!r}, room_id={self.room_id!r}, room_name={self.room_name!r}, config={self.config!r})"
+
+
+class LoginResp:
+    """S2C_LOGIN_RESP (1001)."""
+    __slots__ = ("success", "session_id", "config")
+    TYPE = 1001
+    DIRECTION = "S2C"
+    FIELDS = (
+        ("success", "success", "bool", False),
+        ("session_id", "session_id", "string", False),
+        ("config", "config", "object", False),
+    )
+
+    def __init__(self, success=None, session_id=None, config=None):
+        self.success = success
+        self.session_id = session_id
+        self.config = config
+
+    def to_payload(self):
+        p = {}
+        if self.success is not None:
+            p["success"] = self.success
+        if self.session_id is not None:
+            p["session_id"] = self.session_id
+        if self.config is not None:
+            p["config"] = self.config
+        return p
+
+    def to_msg(self):
+        return {"type": 1001, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls(p.get("success"), p.get("session_id"), p.get("config"))
+
+    def validate(self):
+        return _validate(self)
+
+    def __repr__(self):
+        return f"LoginResp(success={self.success!r}, session_id={self.session_id!r}, config={self.config!r})"
+
+
+class ChooseTacticReq:
+    """C2S_CHOOSE_TACTIC_REQ (2006)."""
+    __slots__ = ("tactic",)
+    TYPE = 2006
+    DIRECTION = "C2S"
+    FIELDS = (
+        ("tactic", "tactic", "string", False),
+    )
+
+    def __init__(self, tactic=None):
+        self.tactic = tactic
+
+    def to_payload(self):
+        p = {}
+        if self.tactic is not None:
+            p["tactic"] = self.tactic
+        return p
+
+    def to_msg(self):
+        return {"type": 2006, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls(p.get("tactic"))
+
+    def validate(self):
+        return _validate(self)
+
+    def __repr__(self):
+        return f"ChooseTacticReq(tactic={self.tactic!r})"
+
+
+class GameStartPush:
+    """S2C_GAME_START_PUSH (3001)."""
+    __slots__ = ("map_seed", "map_width", "map_height", "spawn_pos", "inventory", "map_tiles")
+    TYPE = 3001
+    DIRECTION = "S2C"
+    FIELDS = (
+        ("map_seed", "map_seed", "int64", False),
+        ("map_width", "map_width", "int", False),
+        ("map_height", "map_height", "int", False),
+        ("spawn_pos", "spawn_pos", "Vector2", False),
+        ("inventory", "inventory", "Item[]", False),
+        ("map_tiles", "map_tiles", "int[][]", False),
+    )
+
+    def __init__(self, map_seed=None, map_width=None, map_height=None, spawn_pos=None, inventory=None, map_tiles=None):
+        self.map_seed = map_seed
+        self.map_width = map_width
+        self.map_height = map_height
+        self.spawn_pos = spawn_pos
+        self.inventory = inventory
+        self.map_tiles = map_tiles
+
+    def to_payload(self):
+        p = {}
+        if self.map_seed is not None:
+            p["map_seed"] = self.map_seed
+        if self.map_width is not None:
+            p["map_width"] = self.map_width
+        if self.map_height is not None:
+            p["map_height"] = self.map_height
+        if self.spawn_pos is not None:
+            p["spawn_pos"] = _vec2(self.spawn_pos)
+        if self.inventory is not None:
+            p["inventory"] = self.inventory
+        if self.map_tiles is not None:
+            p["map_tiles"] = self.map_tiles
+        return p
+
+    def to_msg(self):
+        return {"type": 3001, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls(p.get("map_seed"), p.get("map_width"), p.get("map_height"), p.get("spawn_pos"), p.get("inventory"), p.get("map_tiles"))
+
+    def validate(self):
+        return _validate(self)
+
+    def __repr__(self):
+        return f"GameStartPush(map_seed={self.map_seed!r}, map_width={self.map_width!r}, map_height={self.map_height!r}, spawn_pos={self.spawn_pos!r}, inventory={self.inventory!r}, map_tiles={self.map_tiles!r})"
+
+
+class MoveReq:
+    """C2S_MOVE_REQ (2001)."""
+    __slots__ = ("dir", "look_dir", "sprint")
+    TYPE = 2001
+    DIRECTION = "C2S"
+    FIELDS = (
+        ("dir", "dir", "Vector2", False),
+        ("look_dir", "look_dir", "Vector2", False),
+        ("sprint", "sprint", "bool", False),
+    )
+
+    def __init__(self, dir=None, look_dir=None, sprint=None):
+        self.dir = dir
+        self.look_dir = look_dir
+        self.sprint = sprint
+
+    def to_payload(self):
+        p = {}
+        if self.dir is not None:
+            p["dir"] = _vec2(self.dir)
+        if self.look_dir is not None:
+            p["look_dir"] = _vec2(self.look_dir)
+        if self.sprint is not None:
+            p["sprint"] = self.sprint
+        return p
+
+    def to_msg(self):
+        return {"type": 2001, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls(p.get("dir"), p.get("look_dir"), p.get("sprint"))
+
+    def validate(self):
+        return _validate(self)
+
+    def __repr__(self):
+        return f"MoveReq(dir={self.dir!r}, look_dir={self.look_dir!r}, sprint={self.sprint!r})"
+
+
+class InteractReq:
+    """C2S_INTERACT_REQ (2003)."""
+    __slots__ = ()
+    TYPE = 2003
+    DIRECTION = "C2S"
+    FIELDS = ()
+
+    def __init__(self):
+        pass
+
+    def to_payload(self):
+        return {}
+
+    def to_msg(self):
+        return {"type": 2003, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls()
+
+    def validate(self):
+        return []
+
+    def __repr__(self):
+        return "InteractReq()"
+
+
+class PickupReq:
+    """C2S_PICKUP_REQ (2004)."""
+    __slots__ = ()
+    TYPE = 2004
+    DIRECTION = "C2S"
+    FIELDS = ()
+
+    def __init__(self):
+        pass
+
+    def to_payload(self):
+        return {}
+
+    def to_msg(self):
+        return {"type": 2004, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls()
+
+    def validate(self):
+        return []
+
+    def __repr__(self):
+        return "PickupReq()"
+
+
+class UseItemReq:
+    """C2S_USE_ITEM_REQ (2002)."""
+    __slots__ = ("slot_index",)
+    TYPE = 2002
+    DIRECTION = "C2S"
+    FIELDS = (
+        ("slot_index", "slot_index", "int", False),
+    )
+
+    def __init__(self, slot_index=None):
+        self.slot_index = slot_index
+
+    def to_payload(self):
+        p = {}
+        if self.slot_index is not None:
+            p["slot_index"] = self.slot_index
+        return p
+
+    def to_msg(self):
+        return {"type": 2002, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls(p.get("slot_index"))
+
+    def validate(self):
+        return _validate(self)
+
+    def __repr__(self):
+        return f"UseItemReq(slot_index={self.slot_index!r})"
+
+
+class DropReq:
+    """C2S_DROP_REQ (2005)."""
+    __slots__ = ("slot_index",)
+    TYPE = 2005
+    DIRECTION = "C2S"
+    FIELDS = (
+        ("slot_index", "slot_index", "int", False),
+    )
+
+    def __init__(self, slot_index=None):
+        self.slot_index = slot_index
+
+    def to_payload(self):
+        p = {}
+        if self.slot_index is not None:
+            p["slot_index"] = self.slot_index
+        return p
+
+    def to_msg(self):
+        return {"type": 2005, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls(p.get("slot_index"))
+
+    def validate(self):
+        return _validate(self)
+
+    def __repr__(self):
+        return f"DropReq(slot_index={self.slot_index!r})"
+
+
+class BuyReq:
+    """C2S_BUY_REQ (2007)."""
+    __slots__ = ("item_id",)
+    TYPE = 2007
+    DIRECTION = "C2S"
+    FIELDS = (
+        ("item_id", "item_id", "string", False),
+    )
+
+    def __init__(self, item_id=None):
+        self.item_id = item_id
+
+    def to_payload(self):
+        p = {}
+        if self.item_id is not None:
+            p["item_id"] = self.item_id
+        return p
+
+    def to_msg(self):
+        return {"type": 2007, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls(p.get("item_id"))
+
+    def validate(self):
+        return _validate(self)
+
+    def __repr__(self):
+        return f"BuyReq(item_id={self.item_id!r})"
+
+
+class SellReq:
+    """C2S_SELL_REQ (2008)."""
+    __slots__ = ("slot_index",)
+    TYPE = 2008
+    DIRECTION = "C2S"
+    FIELDS = (
+        ("slot_index", "slot_index", "int", False),
+    )
+
+    def __init__(self, slot_index=None):
+        self.slot_index = slot_index
+
+    def to_payload(self):
+        p = {}
+        if self.slot_index is not None:
+            p["slot_index"] = self.slot_index
+        return p
+
+    def to_msg(self):
+        return {"type": 2008, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls(p.get("slot_index"))
+
+    def validate(self):
+        return _validate(self)
+
+    def __repr__(self):
+        return f"SellReq(slot_index={self.slot_index!r})"
+
+
+class ShopRefreshReq:
+    """C2S_SHOP_REFRESH_REQ (2009)."""
+    __slots__ = ()
+    TYPE = 2009
+    DIRECTION = "C2S"
+    FIELDS = ()
+
+    def __init__(self):
+        pass
+
+    def to_payload(self):
+        return {}
+
+    def to_msg(self):
+        return {"type": 2009, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls()
+
+    def validate(self):
+        return []
+
+    def __repr__(self):
+        return "ShopRefreshReq()"
+
+
+class DevSkipPhaseReq:
+    """C2S_DEV_SKIP_PHASE_REQ (9001)."""
+    __slots__ = ()
+    TYPE = 9001
+    DIRECTION = "C2S"
+    FIELDS = ()
+
+    def __init__(self):
+        pass
+
+    def to_payload(self):
+        return {}
+
+    def to_msg(self):
+        return {"type": 9001, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls()
+
+    def validate(self):
+        return []
+
+    def __repr__(self):
+        return "DevSkipPhaseReq()"
+
+
+class GameStatePush:
+    """S2C_GAME_STATE_PUSH (3002). The main sync packet. Contains everything the player can SEE or HEAR."""
+    __slots__ = ("timestamp", "seq", "phase", "time_left", "events", "self_", "vision", "sound", "radar_blips")
+    TYPE = 3002
+    DIRECTION = "S2C"
+    FIELDS = (
+        ("timestamp", "timestamp", "int64", False),
+        ("seq", "seq", "int", False),
+        ("phase", "phase", "int", False),
+        ("time_left", "time_left", "float64", False),
+        ("events", "events", "object[]", False),
+        ("self_", "self", "object", False),
+        ("vision", "vision", "object", False),
+        ("sound", "sound", "object", False),
+        ("radar_blips", "radar_blips", "object[]", False),
+    )
+
+    def __init__(self, timestamp=None, seq=None, phase=None, time_left=None, events=None, self_=None, vision=None, sound=None, radar_blips=None):
+        self.timestamp = timestamp
+        self.seq = seq
+        self.phase = phase
+        self.time_left = time_left
+        self.events = events
+        self.self_ = self_
+        self.vision = vision
+        self.sound = sound
+        self.radar_blips = radar_blips
+
+    def to_payload(self):
+        p = {}
+        if self.timestamp is not None:
+            p["timestamp"] = self.timestamp
+        if self.seq is not None:
+            p["seq"] = self.seq
+        if self.phase is not None:
+            p["phase"] = self.phase
+        if self.time_left is not None:
+            p["time_left"] = self.time_left
+        if self.events is not None:
+            p["events"] = self.events
+        if self.self_ is not None:
+            p["self"] = self.self_
+        if self.vision is not None:
+            p["vision"] = self.vision
+        if self.sound is not None:
+            p["sound"] = self.sound
+        if self.radar_blips is not None:
+            p["radar_blips"] = self.radar_blips
+        return p
+
+    def to_msg(self):
+        return {"type": 3002, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls(p.get("timestamp"), p.get("seq"), p.get("phase"), p.get("time_left"), p.get("events"), p.get("self"), p.get("vision"), p.get("sound"), p.get("radar_blips"))
+
+    def validate(self):
+        return _validate(self)
+
+    def __repr__(self):
+        return f"GameStatePush(timestamp={self.timestamp!r}, seq={self.seq!r}, phase={self.phase!r}, time_left={self.time_left!r}, events={self.events!r}, self_={self.self_!r}, vision={self.vision!r}, sound={self.sound!r}, radar_blips={self.radar_blips!r})"
+
+
+class ErrorPush:
+    """S2C_ERROR_PUSH (4001)."""
+    __slots__ = ("msg",)
+    TYPE = 4001
+    DIRECTION = "S2C"
+    FIELDS = (
+        ("msg", "msg", "string", False),
+    )
+
+    def __init__(self, msg=None):
+        self.msg = msg
+
+    def to_payload(self):
+        p = {}
+        if self.msg is not None:
+            p["msg"] = self.msg
+        return p
+
+    def to_msg(self):
+        return {"type": 4001, "payload": self.to_payload()}
+
+    @classmethod
+    def from_payload(cls, p):
+        return cls(p.get("msg"))
+
+    def validate(self):
+        return _validate(self)
+
+    def __repr__(self):
+        return f"ErrorPush(msg={self.msg!r})"
+
+
+C2S_PACKETS = {
+    1001: LoginReq,
+    1010: CreateRoom,
+    1013: ListRooms,
+    1002: HeartbeatReq,
+    1011: JoinRoom,
+    2006: ChooseTacticReq,
+    2001: MoveReq,
+    2003: InteractReq,
+    2004: PickupReq,
+    2002: UseItemReq,
+    2005: DropReq,
+    2007: BuyReq,
+    2008: SellReq,
+    2009: ShopRefreshReq,
+    9001: DevSkipPhaseReq,
+}
+S2C_PACKETS = {
+    1002: HeartbeatResp,
+    1014: RoomsList,
+    1012: RoomJoined,
+    1001: LoginResp,
+    3001: GameStartPush,
+    3002: GameStatePush,
+    4001: ErrorPush,
+}
+C2S_DECODERS = {
+    1001: LoginReq.from_payload,
+    1010: CreateRoom.from_payload,
+    1013: ListRooms.from_payload,
+    1002: HeartbeatReq.from_payload,
+    1011: JoinRoom.from_payload,
+    2006: ChooseTacticReq.from_payload,
+    2001: MoveReq.from_payload,
+    2003: InteractReq.from_payload,
+    2004: PickupReq.from_payload,
+    2002: UseItemReq.from_payload,
+    2005: DropReq.from_payload,
+    2007: BuyReq.from_payload,
+    2008: SellReq.from_payload,
+    2009: ShopRefreshReq.from_payload,
+    9001: DevSkipPhaseReq.from_payload,
+}
+S2C_DECODERS = {
+    1002: HeartbeatResp.from_payload,
+    1014: RoomsList.from_payload,
+    1012: RoomJoined.from_payload,
+    1001: LoginResp.from_payload,
+    3001: _raw,
+    3002: _raw,
+    4001: ErrorPush.from_payload,
+}
+
+
+_TABLES = {"C2S": (C2S_PACKETS, C2S_DECODERS), "S2C": (S2C_PACKETS, S2C_DECODERS)}
+
+
+def decode(msg, validate=False, direction="S2C"):
+    """Decode a parsed frame into (type, packet); unknown types give (type, None).
+
+    Raw-decoded packets (3001, 3002) come back as the payload dict itself.
+    """
+    packets, decoders = _TABLES[direction]
+    mt = msg.get("type")
+    dec = decoders.get(mt)
+    if dec is None:
+        return mt, None
+    pl = msg.get("payload")
+    cls = packets[mt]
+    if cls.FIELDS and not isinstance(pl, dict):
+        raise ProtocolError(f"{mt}: payload is {type(pl).__name__}, expected object")
+    pkt = dec(pl)
+    if validate:
+        errors = (pkt if isinstance(pkt, cls) else cls.from_payload(pkt)).validate()
+        if errors:
+            raise ProtocolError(f"{mt}: " + "; ".join(errors))
+    return mt, pkt
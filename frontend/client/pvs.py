@@ -0,0 +1,299 @@
+import math
+import multiprocessing
+import threading
+
+from client.config import PVS_RAY_SPACING, PVS_ORIGIN_STEPS
+
+# Step of Renderer._has_line_of_sight: it samples the segment every LOS_STEP tiles, so it can
+# slip past walls the segment only clips. The table is built against that test, not exact geometry.
+LOS_STEP = 0.12
+# build_pvs pads the map with rings of wall cells and one outer ring of _OUTSIDE cells.
+_PAD = 2
+_WALL = 1
+_OUTSIDE = 2
+
+
+class PvsTable:
+    """Per-tile potentially-visible sets for one static maze.
+
+    bits[gy * width + gx] is a bitset over the (2 * reach + 1)^2 window of tiles centred on
+    that tile; a set bit means the target tile can be in line of sight from some point of the
+    source tile. Wall tiles hold -1 (every bit set), so a player clipped into a wall is never
+    culled. Only valid for view radii up to `radius`.
+    """
+
+    __slots__ = ("width", "height", "radius", "reach", "side", "bits", "_window")
+
+    def __init__(self, width, height, radius, reach, bits):
+        self.width = width
+        self.height = height
+        self.radius = radius
+        self.reach = reach
+        self.side = 2 * reach + 1
+        self.bits = bits
+        self._window = (None, None, -1, 0, 0)
+
+    def window(self, ox, oy):
+        """(bits, x0, y0) for the viewer at (ox, oy): a target tile (tx, ty) within `radius` is
+        potentially visible iff bit (ty - y0) * side + (tx - x0) is set. Cached per viewer tile."""
+        gx, gy = int(ox), int(oy)
+        w = self._window
+        if w[0] != gx or w[1] != gy:
+            inside = 0 <= gx < self.width and 0 <= gy < self.height
+            w = self._window = (gx, gy, self.bits[gy * self.width + gx] if inside else -1, gx - self.reach, gy - self.reach)
+        return w[2], w[3], w[4]
+
+    def maybe_visible(self, ox, oy, tx, ty):
+        """False only if no point of (tx, ty)'s tile can be seen from anywhere in (ox, oy)'s tile."""
+        gx, gy = int(ox), int(oy)
+        if gx < 0 or gy < 0 or gx >= self.width or gy >= self.height:
+            return True
+        r = self.reach
+        dx = int(tx) - gx + r
+        dy = int(ty) - gy + r
+        side = self.side
+        if dx < 0 or dy < 0 or dx >= side or dy >= side:
+            return True
+        return (self.bits[gy * self.width + gx] >> (dy * side + dx)) & 1 == 1
+
+    def count(self, gx, gy):
+        """Number of potentially-visible tiles from (gx, gy) (-1 for walls)."""
+        b = self.bits[gy * self.width + gx]
+        return -1 if b < 0 else bin(b).count("1")
+
+
+def _sides(grid, stride):
+    # For each wall cell, which sides face a free cell (those get eroded): (left, right, top, bottom).
+    sides = [None] * len(grid)
+    for i, g in enumerate(grid):
+        if g == _WALL:
+            sides[i] = (grid[i - 1] == 0, grid[i + 1] == 0, grid[i - stride] == 0, grid[i + stride] == 0)
+    return sides
+
+
+def _crosses(ox, oy, dx, dy, gx, gy, sides, e):
+    # Does the ray (t >= 0) cross the wall cell's core: the cell minus everything within `e` of a
+    # free cell, covered by two rectangles (sides facing walls are not eroded, so wall runs stay solid).
+    fl, fr, ft, fb = sides
+    for x0, x1, y0, y1 in ((e if fl else 0.0, 1.0 - e if fr else 1.0, e, 1.0 - e),
+                           (e, 1.0 - e, e if ft else 0.0, 1.0 - e if fb else 1.0)):
+        if x0 >= x1 or y0 >= y1:
+            continue
+        lo, hi = 0.0, math.inf
+        if dx:
+            a, b = (gx + x0 - ox) / dx, (gx + x1 - ox) / dx
+            if a > b:
+                a, b = b, a
+            lo, hi = max(lo, a), min(hi, b)
+        elif not gx + x0 <= ox <= gx + x1:
+            continue
+        if dy:
+            a, b = (gy + y0 - oy) / dy, (gy + y1 - oy) / dy
+            if a > b:
+                a, b = b, a
+            lo, hi = max(lo, a), min(hi, b)
+        elif not gy + y0 <= oy <= gy + y1:
+            continue
+        if lo <= hi:
+            return True
+    return False
+
+
+def _cast(grid, sides, stride, ox, oy, reach, rays, erosion, seen):
+    # Grid traversal (DDA) from (ox, oy) along every ray; adds the padded-grid index of each
+    # tile reached within `reach` to `seen`, stopping at the first wall core the ray crosses.
+    # erosion(t) is how far walls are eroded for a cell the ray enters at distance t.
+    for dx, dy, sx, sy, tdx, tdy in rays:
+        # Start in the tile the ray leaves into, which matters for origins on a grid line.
+        gx = math.floor(ox) if dx >= 0 else math.ceil(ox) - 1
+        gy = math.floor(oy) if dy >= 0 else math.ceil(oy) - 1
+        i = (gy + _PAD) * stride + gx + _PAD
+        seen.add(i)
+        if grid[i] and _crosses(ox, oy, dx, dy, gx, gy, sides[i], erosion(0.0)):
+            continue
+        tmx = ((gx + 1 - ox) if dx > 0 else (ox - gx)) * tdx if dx else math.inf
+        tmy = ((gy + 1 - oy) if dy > 0 else (oy - gy)) * tdy if dy else math.inf
+        step_y = sy * stride
+        while True:
+            if tmx < tmy:
+                t = tmx
+                i += sx
+                gx += sx
+                tmx += tdx
+            else:
+                t = tmy
+                i += step_y
+                gy += sy
+                tmy += tdy
+            if t > reach:
+                break
+            g = grid[i]
+            if g == _OUTSIDE:
+                break
+            seen.add(i)
+            # The wall face itself is visible; nothing beyond a core.
+            if g and _crosses(ox, oy, dx, dy, gx, gy, sides[i], erosion(t)):
+                break
+
+
+def build_pvs(tiles, radius, ray_spacing=PVS_RAY_SPACING, origin_steps=PVS_ORIGIN_STEPS):
+    """PvsTable for `tiles` (rows of 0/1) and view radii up to `radius` tiles.
+
+    Conservative with respect to Renderer._has_line_of_sight. Rays are cast from a lattice of
+    origin_steps x origin_steps points per tile, so any viewer is within
+    d = sqrt(2) / (2 * origin_steps) of an origin, and for any viewer-target segment one of
+    those rays stays within d * (1 - t / reach) + ray_spacing / 2 of it at distance t. Walls
+    are eroded by that distance plus LOS_STEP / 2 before they may stop a ray: if the ray is
+    stopped, the segment itself runs more than LOS_STEP inside a wall and the raymarch stops
+    too. A ray that is not stopped ends within one tile of the target, so each set is grown
+    by one ring.
+    """
+    h = len(tiles)
+    w = len(tiles[0]) if h else 0
+    steps = max(1, int(origin_steps))
+    reach_f = radius + math.sqrt(2.0)
+    reach = int(math.ceil(reach_f))
+    side = 2 * reach + 1
+    n = max(16, int(math.ceil(2.0 * math.pi * reach_f / ray_spacing)))
+    rays = []
+    for k in range(n):
+        dx, dy = math.cos(2.0 * math.pi * k / n), math.sin(2.0 * math.pi * k / n)
+        rays.append((dx, dy, 1 if dx > 0 else -1, 1 if dy > 0 else -1,
+                     abs(1.0 / dx) if dx else math.inf, abs(1.0 / dy) if dy else math.inf))
+    stride = w + 2 * _PAD
+    grid = bytearray([_WALL]) * (stride * (h + 2 * _PAD))
+    grid[:stride] = grid[-stride:] = bytes([_OUTSIDE]) * stride
+    for gy in range(h + 2 * _PAD):
+        grid[gy * stride] = grid[gy * stride + stride - 1] = _OUTSIDE
+    for gy, r in enumerate(tiles):
+        base = (gy + _PAD) * stride + _PAD
+        grid[base:base + w] = bytes(_WALL if t == 1 else 0 for t in r)
+    sides = _sides(grid, stride)
+    # The ray from the nearest origin towards the target strays from the real segment by at most
+    # d0 * (1 - t / reach_f) (origin offset, shrinking towards the target) + ray_spacing / 2
+    # (direction sampling); walls are eroded by that plus half a raymarch step.
+    d0 = math.sqrt(2.0) / (2.0 * steps)
+    slack = ray_spacing / 2.0 + LOS_STEP / 2.0 + 0.01
+
+    def erosion(t):
+        return d0 * max(0.0, 1.0 - t / reach_f) + slack
+
+    def free(cx, cy):
+        return 0 <= cx < w and 0 <= cy < h and tiles[cy][cx] != 1
+
+    def lattice_row(j):
+        # Sets for the origins (i / steps, j / steps); origins touching no free tile are skipped.
+        y = j / steps
+        ty = j // steps
+        ty0 = ty - 1 if j % steps == 0 else ty
+        out = []
+        for i in range(w * steps + 1):
+            tx = i // steps
+            tx0 = tx - 1 if i % steps == 0 else tx
+            seen = set()
+            if any(free(cx, cy) for cx in (tx0, tx) for cy in (ty0, ty)):
+                _cast(grid, sides, stride, i / steps, y, reach_f, rays, erosion, seen)
+            out.append(seen)
+        return out
+
+    # Dilation masks: the window without its first / last column, and the whole window.
+    full = (1 << (side * side)) - 1
+    not_first = full & ~sum(1 << (r * side) for r in range(side))
+    not_last = full & ~sum(1 << (r * side + side - 1) for r in range(side))
+
+    bits = [-1] * (w * h)
+    rows = [lattice_row(j) for j in range(steps + 1)]
+    for gy in range(h):
+        if gy:
+            rows = rows[steps:] + [lattice_row(gy * steps + j) for j in range(1, steps + 1)]
+        for gx in range(w):
+            if tiles[gy][gx] == 1:
+                continue
+            seen = set()
+            for row in rows:
+                for s in row[gx * steps:gx * steps + steps + 1]:
+                    seen |= s
+            m = 0
+            ox = reach - gx - _PAD
+            oy = reach - gy - _PAD
+            for idx in seen:
+                cy, cx = divmod(idx, stride)
+                bx = cx + ox
+                by = cy + oy
+                if 0 <= bx < side and 0 <= by < side:
+                    m |= 1 << (by * side + bx)
+            m |= ((m << 1) & not_first) | ((m >> 1) & not_last)
+            m |= ((m << side) | (m >> side)) & full
+            bits[gy * w + gx] = m
+    return PvsTable(w, h, float(radius), reach, bits)
+
+
+def _build_into(conn, tiles, radius):
+    try:
+        conn.send(build_pvs(tiles, radius))
+    except Exception as e:
+        conn.send(e)
+    finally:
+        conn.close()
+
+
+class PvsBuilder:
+    """Runs build_pvs in a worker process (a thread if processes are unavailable).
+
+    The build is pure Python and would otherwise share the GIL with the render loop. ready()
+    polls; result() returns the PvsTable, or None if the build failed. cancel() stops a build
+    whose map has been replaced (thread builds just run out and are discarded).
+    """
+
+    def __init__(self, tiles, radius):
+        self.tiles = tiles
+        self.radius = radius
+        self._proc = self._conn = self._thread = None
+        self._result = None
+        try:
+            ctx = multiprocessing.get_context("spawn")
+            self._conn, child = ctx.Pipe(duplex=False)
+            self._proc = ctx.Process(target=_build_into, args=(child, tiles, radius), name="pvs-build", daemon=True)
+            self._proc.start()
+            child.close()
+        except (OSError, ValueError, NotImplementedError):
+            self._proc = self._conn = None
+            self._thread = threading.Thread(target=self._run, name="pvs-build", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        try:
+            self._result = build_pvs(self.tiles, self.radius)
+        except Exception as e:
+            self._result = e
+
+    def ready(self):
+        if self._thread is not None:
+            return not self._thread.is_alive()
+        return self._conn is None or self._conn.poll() or not self._proc.is_alive()
+
+    def result(self):
+        res = self._result
+        if self._conn is not None:
+            try:
+                res = self._conn.recv() if self._conn.poll() else EOFError("worker exited")
+            except (EOFError, OSError) as e:
+                res = e
+            self._close()
+        if isinstance(res, Exception):
+            print(f"PVS build failed: {res}")
+            return None
+        return res
+
+    def cancel(self):
+        if self._proc is not None and self._proc.is_alive():
+            self._proc.terminate()
+        self._close()
+
+    def _close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._proc is not None:
+            self._proc.join(timeout=1.0)
+            self._proc = None
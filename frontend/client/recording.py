@@ -0,0 +1,326 @@
+import bisect
+import collections
+import json
+import mmap
+import re
+import struct
+import threading
+import time
+import zlib
+
+from client.config import RECORD_BLOCK_BYTES, RECORD_FLUSH_SEC, RECORD_ZLIB_LEVEL, RECORD_KEYFRAME_SEC
+
+# Session recordings (.etrec): every raw WebSocket text frame in both directions.
+#
+#   file     := header block* [index footer]
+#   header   := "ETREC\0" u16 version, f64 wall-clock start (epoch seconds)
+#   block    := u8 kind, u32 compressed_len, u32 raw_len, f64 t_first, u64 first_packet, zlib(record*)
+#   record   := f64 t (seconds since start, monotonic), u8 direction, u32 len, bytes[len]
+#   index    := u32 count, (f64 t_first, u64 first_packet, u64 block_offset, u64 keyframe_offset)*
+#   footer   := u64 index_offset, "ETIDX\0"
+#
+# All integers little-endian. Blocks are independent zlib streams. A KEYFRAME block holds the
+# latest 1012/3001/3002 frames seen before the data block that follows it; since snapshots
+# are full state, replaying a keyframe rebuilds GameState at that point. The index is written
+# on close(); a recording without one (crash) is re-indexed by walking block headers only.
+# Version 1 files (no block metadata, no index) can still be read sequentially.
+
+ENV_VAR = "ECHO_TRACE_RECORD"
+MAGIC = b"ETREC\0"
+INDEX_MAGIC = b"ETIDX\0"
+VERSION = 2
+DIR_IN = 0
+DIR_OUT = 1
+BLOCK_DATA = 0
+BLOCK_KEYFRAME = 1
+NO_KEYFRAME = 0xFFFFFFFFFFFFFFFF
+# Packet types whose latest copy, taken together, reconstructs client GameState.
+STATE_TYPES = (1012, 3001, 3002)
+
+_HEADER = struct.Struct("<6sHd")
+_BLOCK = struct.Struct("<BIIdQ")
+_BLOCK_V1 = struct.Struct("<II")
+_RECORD = struct.Struct("<dBI")
+_INDEX_COUNT = struct.Struct("<I")
+_INDEX_ENTRY = struct.Struct("<dQQQ")
+_FOOTER = struct.Struct("<Q6s")
+
+# Top-level "type" of a frame without parsing it: Go's encoder sorts keys ("type" last),
+# Python clients write it first. Nested "type" fields are strings, never bare integers.
+_TYPE_HEAD = re.compile(rb'^\s*\{\s*"type"\s*:\s*(\d+)')
+_TYPE_TAIL = re.compile(rb'"type"\s*:\s*(\d+)\s*\}\s*$')
+
+Packet = collections.namedtuple("Packet", "t direction data")
+IndexEntry = collections.namedtuple("IndexEntry", "t_first first_packet offset keyframe")
+
+
+def packet_type(data):
+    m = _TYPE_HEAD.match(data[:32]) or _TYPE_TAIL.search(data[-32:])
+    return int(m.group(1)) if m else None
+
+
+class SessionRecorder:
+    """Appends packets to a recording from any thread.
+
+    record() only timestamps the frame and appends it to a deque; a background thread packs,
+    compresses and writes blocks every RECORD_FLUSH_SEC or RECORD_BLOCK_BYTES of raw data, and
+    a keyframe block at least every RECORD_KEYFRAME_SEC of recording time.
+    """
+
+    def __init__(self, path, block_bytes=RECORD_BLOCK_BYTES, flush_sec=RECORD_FLUSH_SEC, level=RECORD_ZLIB_LEVEL,
+                 keyframe_sec=RECORD_KEYFRAME_SEC, clock=time.perf_counter):
+        self.path = str(path)
+        self.block_bytes = int(block_bytes)
+        self.flush_sec = float(flush_sec)
+        self.level = int(level)
+        self.keyframe_sec = float(keyframe_sec)
+        self.clock = clock
+        self.t0 = clock()
+        self.packets = 0
+        self.index = []
+        self._q = collections.deque()
+        self._state = {}
+        self._state_dirty = False
+        self._last_key_t = None
+        self._last_key_off = NO_KEYFRAME
+        self._f = open(self.path, "wb")
+        self._f.write(_HEADER.pack(MAGIC, VERSION, time.time()))
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="recorder", daemon=True)
+        self._thread.start()
+
+    def record(self, direction, data):
+        self._q.append((self.clock() - self.t0, direction, data))
+
+    def record_in(self, data):
+        self.record(DIR_IN, data)
+
+    def record_out(self, data):
+        self.record(DIR_OUT, data)
+
+    def _run(self):
+        while not self._stop.wait(self.flush_sec):
+            self.flush()
+        self.flush()
+
+    def flush(self):
+        with self._lock:
+            if self._f is None:
+                return
+            q = self._q
+            while q:
+                t_first = q[0][0]
+                if self._state_dirty and (self._last_key_t is None or t_first - self._last_key_t >= self.keyframe_sec):
+                    self._write_keyframe(t_first)
+                parts = []
+                raw = 0
+                first_packet = self.packets
+                while q and raw < self.block_bytes:
+                    t, d, data = q.popleft()
+                    b = data.encode("utf-8") if isinstance(data, str) else bytes(data)
+                    parts.append(_RECORD.pack(t, d, len(b)))
+                    parts.append(b)
+                    raw += _RECORD.size + len(b)
+                    self.packets += 1
+                    if d == DIR_IN:
+                        mt = packet_type(b)
+                        if mt in STATE_TYPES:
+                            self._state[mt] = (t, b)
+                            self._state_dirty = True
+                off = self._write_block(BLOCK_DATA, b"".join(parts), t_first, first_packet)
+                self.index.append(IndexEntry(t_first, first_packet, off, self._last_key_off))
+            self._f.flush()
+
+    def _write_keyframe(self, t):
+        recs = sorted(self._state.values())
+        raw = b"".join(_RECORD.pack(rt, DIR_IN, len(b)) + b for rt, b in recs)
+        self._last_key_off = self._write_block(BLOCK_KEYFRAME, raw, t, self.packets)
+        self._last_key_t = t
+        self._state_dirty = False
+
+    def _write_block(self, kind, raw, t_first, first_packet):
+        off = self._f.tell()
+        comp = zlib.compress(raw, self.level)
+        self._f.write(_BLOCK.pack(kind, len(comp), len(raw), t_first, first_packet))
+        self._f.write(comp)
+        return off
+
+    def close(self):
+        self._stop.set()
+        self._thread.join()
+        with self._lock:
+            if self._f is not None:
+                off = self._f.tell()
+                self._f.write(_INDEX_COUNT.pack(len(self.index)))
+                self._f.write(b"".join(_INDEX_ENTRY.pack(*e) for e in self.index))
+                self._f.write(_FOOTER.pack(off, INDEX_MAGIC))
+                self._f.close()
+                self._f = None
+
+
+class RecordingReader:
+    """Random-access reader over an mmap of the recording.
+
+    Iterating yields every Packet(t, direction, data: bytes) in order. seek()/packets_from()
+    find the data block containing a time or packet number by bisecting the index, and
+    restore_packets() returns the frames that rebuild GameState at that point: the nearest
+    keyframe plus the packets after it, so only a few blocks are ever decompressed.
+    """
+
+    def __init__(self, path):
+        self.path = str(path)
+        self._file = open(self.path, "rb")
+        self.buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.version, self.start_time = _HEADER.unpack_from(self.buf, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path}: not a session recording")
+        if self.version not in (1, VERSION):
+            self.close()
+            raise ValueError(f"{self.path}: unsupported recording version {self.version}")
+        self.index = self._load_index() if self.version >= 2 else []
+        self._times = [e.t_first for e in self.index]
+        self._firsts = [e.first_packet for e in self.index]
+        self._offsets = [e.offset for e in self.index]
+
+    def close(self):
+        if self.buf is not None:
+            self.buf.close()
+            self.buf = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def _load_index(self):
+        buf = self.buf
+        n = len(buf)
+        if n >= _HEADER.size + _FOOTER.size:
+            off, magic = _FOOTER.unpack_from(buf, n - _FOOTER.size)
+            if magic == INDEX_MAGIC and _HEADER.size <= off < n:
+                (count,) = _INDEX_COUNT.unpack_from(buf, off)
+                base = off + _INDEX_COUNT.size
+                return [IndexEntry(*_INDEX_ENTRY.unpack_from(buf, base + i * _INDEX_ENTRY.size)) for i in range(count)]
+        # No footer (the client died mid-session): walk the block headers, skipping payloads.
+        entries, key = [], NO_KEYFRAME
+        off = _HEADER.size
+        while off + _BLOCK.size <= n:
+            kind, clen, _, t_first, first = _BLOCK.unpack_from(buf, off)
+            if off + _BLOCK.size + clen > n:
+                break
+            if kind == BLOCK_KEYFRAME:
+                key = off
+            else:
+                entries.append(IndexEntry(t_first, first, off, key))
+            off += _BLOCK.size + clen
+        return entries
+
+    def _block(self, off):
+        kind, clen, rlen, _, _ = _BLOCK.unpack_from(self.buf, off)
+        start = off + _BLOCK.size
+        return kind, zlib.decompress(self.buf[start:start + clen], bufsize=max(1, rlen))
+
+    def blocks(self):
+        """Yield (kind, decompressed payload) for every block in file order."""
+        buf = self.buf
+        if self.version == 1:
+            off, n = _HEADER.size, len(buf)
+            while off + _BLOCK_V1.size <= n:
+                clen, rlen = _BLOCK_V1.unpack_from(buf, off)
+                start = off + _BLOCK_V1.size
+                if start + clen > n:
+                    return
+                yield BLOCK_DATA, zlib.decompress(buf[start:start + clen], bufsize=max(1, rlen))
+                off = start + clen
+            return
+        for e in self.index:
+            yield self._block(e.offset)
+
+    def __iter__(self):
+        for kind, raw in self.blocks():
+            if kind == BLOCK_DATA:
+                yield from iter_records(raw)
+
+    @property
+    def duration(self):
+        return self.index[-1].t_first if self.index else 0.0
+
+    def seek(self, t=None, packet=None):
+        """Index position of the data block holding time `t` (or packet number `packet`)."""
+        if not self.index:
+            return 0
+        if packet is not None:
+            i = bisect.bisect_right(self._firsts, int(packet)) - 1
+        else:
+            i = bisect.bisect_right(self._times, float(t or 0.0)) - 1
+        return max(0, i)
+
+    def packets_from(self, t=None, packet=None):
+        """Packets at or after time `t` / packet number `packet`, decompressing from that block on."""
+        i = self.seek(t, packet)
+        for e in self.index[i:]:
+            n = e.first_packet
+            for p in iter_records(self._block(e.offset)[1]):
+                if (packet is not None and n >= packet) or (packet is None and p.t >= (t or 0.0)):
+                    yield p
+                n += 1
+
+    def restore_packets(self, t=None, packet=None):
+        """Inbound state frames (1012/3001/3002) that rebuild GameState just before time `t` /
+        packet number `packet`: the latest of each type, in recorded order."""
+        if not self.index:
+            return []
+        i = self.seek(t, packet)
+        key = self.index[i].keyframe
+        latest = {}
+        if key != NO_KEYFRAME:
+            for p in iter_records(self._block(key)[1]):
+                latest[packet_type(p.data)] = p
+            # Data blocks from the one right after the keyframe up to the target.
+            j = bisect.bisect_right(self._offsets, key)
+        else:
+            j = 0
+        for e in self.index[j:i + 1]:
+            n = e.first_packet
+            for p in iter_records(self._block(e.offset)[1]):
+                if (packet is not None and n >= packet) or (packet is None and p.t >= (t or 0.0)):
+                    break
+                n += 1
+                if p.direction == DIR_IN:
+                    mt = packet_type(p.data)
+                    if mt in STATE_TYPES:
+                        latest[mt] = p
+        return sorted((p for mt, p in latest.items() if mt in STATE_TYPES), key=lambda p: p.t)
+
+    def state_at(self, t=None, packet=None):
+        """GameState as the client had it just before time `t` / packet number `packet`."""
+        from client.gamestate import GameState
+        st = GameState()
+        for p in self.restore_packets(t, packet):
+            mt = packet_type(p.data)
+            pl = json.loads(p.data).get("payload")
+            if not isinstance(pl, dict):
+                continue
+            if mt == 3001:
+                st.load_map(pl)
+            elif mt == 3002:
+                st.update_from_server(pl)
+            elif mt == 1012:
+                st.config = pl.get("config")
+        return st
+
+
+def iter_records(raw):
+    mv = memoryview(raw)
+    off, n, size = 0, len(raw), _RECORD.size
+    unpack = _RECORD.unpack_from
+    while off + size <= n:
+        t, d, ln = unpack(raw, off)
+        off += size
+        yield Packet(t, d, bytes(mv[off:off + ln]))
+        off += ln
@@ -2,8 +2,18 @@ import pygame
 import math, time, os, json
 from datetime import datetime
 from client.config import *
-from client.i18n import i18n
+from client.i18n import i18n, PHASE_KEYS, K_PHASE_INIT, K_HUD_CONTROLS
 from client.item_manual import CATEGORY_ORDER, get_item_abbr, get_item_name, get_item_use
+from client.surface_pool import SurfacePool
+from client.minimap import Minimap
+from client.sprites import IconLoader, SpriteBank, SpriteBatch
+from client.atlas import SpriteAtlas
+from client.font_cache import get_font_cache
+from client.pvs import PvsBuilder
+from client.map_cache import MapChunkCache
+from client.spectator import SpectatorDashboard
+from client.ripples import RipplePool
+from client.room_index import RoomIndex
 
 class Renderer:
     def __init__(self, screen):
@@ -11,40 +21,63 @@ class Renderer:
         self.assets = {}
         icon_path = os.path.join("frontend", "assets", "icos")
         if not os.path.exists(icon_path): icon_path = "assets/icos"
-        def load_icon(name, key):
-            try:
-                p = os.path.join(icon_path, name)
-                if os.path.exists(p):
-                    img = pygame.image.load(p).convert_alpha()
-                    self.assets[key] = pygame.transform.scale(img, (GRID_SIZE, GRID_SIZE))
-            except Exception as e: print(f"Icon error {name}: {e}")
-        load_icon("Treasure_Box.png", "ITEM_DROP")
-        load_icon("High_value_materials.png", "SUPPLY_DROP")
-        load_icon("NPC_Merchant.png", "MERCHANT")
+        # Icons decode in the background; draw_game() collects them before the first world frame.
+        self.icon_loader = IconLoader(icon_path, {"ITEM_DROP": "Treasure_Box.png", "SUPPLY_DROP": "High_value_materials.png", "MERCHANT": "NPC_Merchant.png"}, GRID_SIZE)
 
+        # Font discovery goes through a persistent on-disk cache (match_font can trigger a full
+        # fontconfig scan per call); a miss falls back to pygame's default font like SysFont does.
+        fonts = get_font_cache()
         def get_cjk_font(size):
-            for name in ["simhei", "microsoftyahei", "simsun", "wqy-microhei", "arial"]:
-                fp = pygame.font.match_font(name)
-                if fp: return pygame.font.Font(fp, size)
-            return pygame.font.SysFont("arial", size)
-        self.font = get_cjk_font(FONT_SIZE); self.hud_font = get_cjk_font(16); self.time_font = pygame.font.SysFont("consolas", 24)
-        self.fog_surf = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+            fp = fonts.match(("simhei", "microsoftyahei", "simsun", "wqy-microhei", "arial"))
+            return pygame.font.Font(fp, size)
+        self.font = get_cjk_font(FONT_SIZE); self.hud_font = get_cjk_font(16); self.time_font = pygame.font.Font(fonts.match(("consolas",)), 24)
+        self.mono_font = pygame.font.Font(fonts.match(("consolas", "dejavusansmono", "couriernew")), 14)
+        fonts.refresh_in_background()
+        # World entities/players are submitted as one Surface.blits per layer from pre-baked sprites.
+        self.sprites = SpriteBank(self.assets, self.font)
+        self.atlas = SpriteAtlas(self.sprites)
+        self.entity_batch = SpriteBatch(self.atlas)
+        self.player_batch = SpriteBatch(self.atlas)
+        # The maze is pre-rendered in chunks and shared by the player camera and every spectator panel.
+        self.map_cache = MapChunkCache()
+        # Camera zoom (spectator only); self.cell is the on-screen tile size for the current frame.
+        self.zoom = 1.0
+        self.cell = GRID_SIZE
+        # Internal render scale: world + fog draw into a smaller pooled buffer (self.canvas) that is
+        # upscaled to the window once per frame; HUD/menus stay at native resolution on self.screen.
+        self.render_scale = RENDER_SCALE
+        self.canvas = screen
+        self.view_w, self.view_h = screen.get_size()
+        # Optional client.profiling.StageTimer; draw_game marks its passes on it when attached.
+        self.stage_timer = None
+        # Full-window scratch surfaces (fog mask, tint overlays) are pooled and reused across frames.
+        self.surface_pool = SurfacePool()
+        self.fog_mask_scale = FOG_MASK_SCALE
         self.state = "CONNECT"; self.server_input = "ws://localhost:8080/ws"; self.name_input = "Agent_07"
         # CONNECT inputs
         self.connect_focus = "server"  # server | resume_id
         self.resume_id_input = ""  # optional session_id for cold-start resume
         self.menu_message = ""
-        # Room list state
-        self.rooms = []
-        self.room_list_selected = 0
+        # Room list state: a keyed index merged on every LIST_ROOMS reply; selection follows the
+        # room_id across refreshes, and only the visible rows are drawn (from cached row surfaces).
+        self.room_index = RoomIndex()
+        self.room_list_selected_id = None
         self.room_list_scroll = 0
+        self.room_list_visible = 11
         self.room_list_row_rects = []
+        self.room_list_header_rects = []
+        self._room_rows = {}  # room_id -> (summary dict, row surface)
         self.room_list_refresh_rect = None
         self.room_list_back_rect = None
 
         # Create-room config editor state
         self.room_name_input = ""
         self.config_data = None
+
+        # Static label surfaces and text layouts; dropped once when the language changes.
+        self._text_cache = {}
+        self._manual_layout = None
+        i18n.subscribe(self._on_lang_changed)
         self.config_rows = []
         self.config_selected = 0
         self.config_scroll = 0
@@ -55,6 +88,12 @@ class Renderer:
         self.config_create_rect = None
         self.config_back_rect = None
         self.show_shop = self.dev_mode = self.spectator_mode = False
+        # Footstep ripples; fed from state.sound_events whenever a new snapshot replaces the list.
+        self.ripples = RipplePool()
+        self._sound_events = None
+        # Spectator dashboard (follow-cam grid + overview) instead of the free camera; Tab toggles it.
+        self.spectator_dashboard = False
+        self.dashboard = SpectatorDashboard(self)
         # Pause UI routing stack: ["root" -> "settings"/"help"/"item_manual"].
         self.pause_route = []
         # Item manual scroll state
@@ -71,7 +110,14 @@ class Renderer:
         # - World entities are visible ONLY if inside wedge AND not blocked by walls.
         self.fov_blocked_by_walls = False
         self.hide_world_entities = False
+        # Potentially-visible sets for the current maze, built in the background per map
+        # when PVS_ENABLED (benchmarks turn pvs_enabled off so the build doesn't compete for the CPU).
+        self.pvs_enabled = PVS_ENABLED
+        self.pvs = None
+        self.pvs_builder = None
+        self._pvs_tiles = None
         self.cam_offset = [0, 0]
+        self.cam_prev = None  # cam_offset at the start of the current fixed update
         self.settings_rect = pygame.Rect(WINDOW_WIDTH//2 - 150, WINDOW_HEIGHT//2 - 150, 300, 300)
         self.help_rect = pygame.Rect(WINDOW_WIDTH//2 - 300, WINDOW_HEIGHT//2 - 250, 600, 500)
         self.shop_rect = pygame.Rect(WINDOW_WIDTH//2 - 200, WINDOW_HEIGHT//2 - 200, 400, 400)
@@ -81,7 +127,12 @@ class Renderer:
         self.sens_plus_rect = pygame.Rect(WINDOW_WIDTH//2 + 80, WINDOW_HEIGHT//2 + 130, 40, 30)
         self.sens_value_rect = pygame.Rect(WINDOW_WIDTH//2 - 70, WINDOW_HEIGHT//2 + 130, 140, 30)
         self.back_btn_rect = pygame.Rect(WINDOW_WIDTH//2 - 60, WINDOW_HEIGHT//2 + 200, 120, 40)
+        self.fps_cap_rect = pygame.Rect(WINDOW_WIDTH//2 - 120, WINDOW_HEIGHT//2 + 10, 240, 30)
+        self.render_scale_rect = pygame.Rect(WINDOW_WIDTH//2 - 120, WINDOW_HEIGHT//2 - 30, 240, 30)
+        # Assigned by main(); drives the FPS cap setting and dev-mode frame stats.
+        self.frame_pacer = None
         self.radar_rect = pygame.Rect(WINDOW_WIDTH - 160, WINDOW_HEIGHT - 160, 150, 150)
+        self.minimap = Minimap(self.radar_rect)
         self.pause_rects = {
             "resume": pygame.Rect(WINDOW_WIDTH//2 - 100, 200, 200, 50),
             "settings": pygame.Rect(WINDOW_WIDTH//2 - 100, 270, 200, 50),
@@ -221,24 +272,64 @@ class Renderer:
             self.item_manual_scroll = 0
 
     def t(self, key): return i18n.t(key)
+
+    def _on_lang_changed(self, lang):
+        self._text_cache.clear()
+        self._room_rows.clear()
+        self._manual_layout = None
+
+    def text(self, font, s, color):
+        key = (id(font), s, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= 256:
+                self._text_cache.clear()
+            surf = self._text_cache[key] = font.render(s, True, color)
+        return surf
     def world_to_screen(self, wx, wy, cam_x, cam_y):
-        return int((wx * GRID_SIZE) - cam_x + (WINDOW_WIDTH // 2)), int((wy * GRID_SIZE) - cam_y + (WINDOW_HEIGHT // 2))
+        return int((wx * self.cell) - cam_x + (self.view_w // 2)), int((wy * self.cell) - cam_y + (self.view_h // 2))
+
+    def cycle_render_scale(self):
+        levels = list(RENDER_SCALE_CHOICES)
+        i = levels.index(self.render_scale) if self.render_scale in levels else -1
+        self.render_scale = levels[(i + 1) % len(levels)]
+        return self.render_scale
+
+    def _begin_world(self):
+        scale = max(0.25, min(1.0, float(self.render_scale)))
+        if scale >= 1.0:
+            self.canvas = self.screen
+        else:
+            sw, sh = self.screen.get_size()
+            self.canvas = self.surface_pool.get("world", (sw * scale, sh * scale), 0)
+            self.canvas.fill(COLOR_BG)
+        self.view_w, self.view_h = self.canvas.get_size()
+        return scale
+
+    def _end_world(self):
+        if self.canvas is not self.screen:
+            upscale = pygame.transform.smoothscale if RENDER_SCALE_SMOOTH else pygame.transform.scale
+            upscale(self.canvas, self.screen.get_size(), self.screen)
+        self.canvas = self.screen
+        self.view_w, self.view_h = self.screen.get_size()
+
+    def set_zoom(self, zoom):
+        # Snap to the nearest pre-scaled level so the atlas never scales on demand per frame.
+        self.zoom = min(ZOOM_LEVELS, key=lambda z: abs(z - float(zoom)))
+
+    def zoom_step(self, steps):
+        levels = list(ZOOM_LEVELS)
+        i = levels.index(self.zoom) if self.zoom in levels else levels.index(1.0)
+        self.zoom = levels[max(0, min(len(levels) - 1, i + int(steps)))]
+        return self.zoom
 
     def _phase_label(self, phase: int):
         try:
             phase = int(phase)
         except Exception:
             return "?"
-        if phase == 0:
-            return self.t("PHASE_INIT")
-        if phase == 1:
-            return self.t("PHASE_SEARCH")
-        if phase == 2:
-            return self.t("PHASE_CONFLICT")
-        if phase == 3:
-            return self.t("PHASE_ESCAPE")
-        if phase == 4:
-            return self.t("PHASE_ENDED")
+        if 0 <= phase < len(PHASE_KEYS):
+            return i18n.t(PHASE_KEYS[phase])
         return str(phase)
 
     def _clamp_int(self, v, min_v, max_v):
@@ -588,6 +679,11 @@ class Renderer:
         rr = float(state.view_radius)
         if dx*dx + dy*dy > rr*rr:
             return False
+        pvs = self.pvs
+        if pvs is not None and PVS_MIN_RADIUS <= rr <= pvs.radius:
+            bits, x0, y0 = pvs.window(ox, oy)
+            if not (bits >> ((int(wy) - y0) * pvs.side + int(wx) - x0)) & 1:
+                return False
         # Cone check
         half = math.radians(self.fov_degrees) / 2.0
         cos_half = math.cos(half)
@@ -605,7 +701,7 @@ class Renderer:
 
     def _compute_fov_polygon_screen(self, state):
         # Returns a list of screen points forming a polygon fan (center + ray endpoints)
-        cx, cy = WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2
+        cx, cy = self.view_w // 2, self.view_h // 2
         half = math.radians(self.fov_degrees) / 2.0
         rays = max(12, int(self.fov_ray_count))
         pts = [(cx, cy)]
@@ -623,13 +719,18 @@ class Renderer:
                 dist = math.sqrt((ex-origin_w[0])**2 + (ey-origin_w[1])**2)
             else:
                 dist = max_dist
-            sx = int(cx + dir_w[0] * dist * GRID_SIZE)
-            sy = int(cy + dir_w[1] * dist * GRID_SIZE)
+            sx = int(cx + dir_w[0] * dist * self.cell)
+            sy = int(cy + dir_w[1] * dist * self.cell)
             pts.append((sx, sy))
 
         return pts
 
-    def draw_game(self, state):
+    def begin_tick(self):
+        self.cam_prev = (self.cam_offset[0], self.cam_offset[1])
+
+    def draw_game(self, state, alpha=1.0):
+        # alpha: fraction of the fixed update step elapsed since the last update; positions are
+        # interpolated between the previous and current update states (1.0 = no interpolation).
         if self.state == "CONNECT": self.draw_connect(); return
         if self.state == "LOGIN": self.draw_login(); return
         if self.state == "MENU": self.draw_menu(); return
@@ -637,68 +738,46 @@ class Renderer:
         if self.state == "ROOM_LIST": self.draw_room_list(); return
         self.screen.fill(COLOR_BG)
         if state.phase == 0 and self.state != "PAUSE": self.draw_lobby(state); return
-        if getattr(state, "is_extracted", False) and self.spectator_mode:
-            cam_x, cam_y = self.cam_offset[0] * GRID_SIZE, self.cam_offset[1] * GRID_SIZE
+        if self.icon_loader is not None: self._collect_icons()
+        if self.pvs_enabled and (state.map_tiles is not self._pvs_tiles or self.pvs_builder is not None): self._poll_pvs(state)
+        spectating = getattr(state, "is_extracted", False) and self.spectator_mode
+        render_scale = self._begin_world()
+        canvas = self.canvas
+        sprite_scale = (self.zoom if spectating else 1.0) * render_scale
+        self.cell = max(2, int(round(GRID_SIZE * sprite_scale)))
+        cell = self.cell
+        if spectating:
+            cx, cy = self.cam_offset
+            if self.cam_prev is not None and alpha < 1.0:
+                cx = self.cam_prev[0] + (cx - self.cam_prev[0]) * alpha
+                cy = self.cam_prev[1] + (cy - self.cam_prev[1]) * alpha
+            cam_x, cam_y = cx * cell, cy * cell
         else:
-            cam_x, cam_y = state.my_pos[0] * GRID_SIZE, state.my_pos[1] * GRID_SIZE
-            self.cam_offset = [state.my_pos[0], state.my_pos[1]]
-        if state.map_tiles:
-            s_c = max(0, int(self.cam_offset[0] - 22)); e_c = int(self.cam_offset[0] + 22)
-            s_r = max(0, int(self.cam_offset[1] - 17)); e_r = int(self.cam_offset[1] + 17)
-            for y in range(s_r, min(len(state.map_tiles), e_r)):
-                for x in range(s_c, min(len(state.map_tiles[0]), e_c)):
-                    sx, sy = self.world_to_screen(x, y, cam_x, cam_y)
-                    rect = (sx, sy, GRID_SIZE, GRID_SIZE)
-                    pygame.draw.rect(self.screen, COLOR_GRID, rect, 1)
-                    if state.map_tiles[y][x] == 1:
-                        pygame.draw.rect(self.screen, COLOR_WALL, rect); pygame.draw.rect(self.screen, COLOR_WALL_EDGE, rect, 1)
-        half = GRID_SIZE // 2
-        for ent in state.entities:
-            if self.hide_world_entities:
-                continue
-            if not self._is_world_pos_visible(state, ent["pos"]["x"], ent["pos"]["y"]):
-                continue
-            sx, sy = self.world_to_screen(ent["pos"]["x"], ent["pos"]["y"], cam_x, cam_y)
-            tl = (sx - half, sy - half)
-            if ent["type"] == "ITEM_DROP":
-                if "ITEM_DROP" in self.assets: self.screen.blit(self.assets["ITEM_DROP"], tl)
-                else: self.draw_text_centered("📦", sx, sy, (255, 255, 0))
-            elif ent["type"] == "SUPPLY_DROP":
-                pygame.draw.circle(self.screen, COLOR_SUPPLY_DROP, (sx, sy), GRID_SIZE, 1)
-                if "SUPPLY_DROP" in self.assets: self.screen.blit(self.assets["SUPPLY_DROP"], tl)
-                else: self.draw_text_centered("🎁", sx, sy, COLOR_SUPPLY_DROP)
-            elif ent["type"] == "MERCHANT":
-                if "MERCHANT" in self.assets: self.screen.blit(self.assets["MERCHANT"], tl)
-                else: self.draw_text_centered("💰", sx, sy, (255, 215, 0))
-            elif ent["type"] == "MOTOR":
-                color = COLOR_MOTOR_DONE if ent["state"] == 2 else COLOR_MOTOR_ACTIVE
-                pygame.draw.circle(self.screen, color, (sx, sy), half, 0); self.draw_text_centered("M", sx, sy, (0, 0, 0))
-                if ent["state"] != 2:
-                    ex = ent.get("extra", {})
-                    if ex: self.draw_bar(tl[0], tl[1]-10, ex.get("progress", 0), ex.get("max_progress", 100), (0, 255, 255))
-            elif ent["type"] == "EXIT":
-                pygame.draw.rect(self.screen, COLOR_EXIT, (tl[0], tl[1], GRID_SIZE, GRID_SIZE), 0); self.draw_text_centered("E", sx, sy, (0, 0, 0))
-        rd = GRID_SIZE // 4 
-        for pid, p in state.players.items():
-            if self.hide_world_entities:
-                continue
-            if not self._is_world_pos_visible(state, p["pos"]["x"], p["pos"]["y"]):
-                continue
-            sx, sy = self.world_to_screen(p["pos"]["x"], p["pos"]["y"], cam_x, cam_y)
-            pygame.draw.circle(self.screen, COLOR_ENEMY, (sx, sy), rd); self.draw_hp_bar(sx-half, sy-half-5, p["hp"], p["max_hp"])
-        if not getattr(state, "is_extracted", False):
-            sx, sy = self.world_to_screen(state.my_pos[0], state.my_pos[1], cam_x, cam_y)
-            pygame.draw.circle(self.screen, COLOR_SELF, (sx, sy), rd); self.draw_text_centered("ME", sx, sy-10); self.draw_hp_bar(sx-half, sy-half-5, state.my_hp, 100)
+            mx, my = state.lerp_my_pos(alpha)
+            cam_x, cam_y = mx * cell, my * cell
+            self.cam_offset = [mx, my]
+        self._stage("clear")
+        dashboard = spectating and self.spectator_dashboard
+        if dashboard:
+            self.dashboard.draw(canvas, state, alpha, sprite_scale)
+            self._stage("dashboard")
+        else:
+            self._draw_world(state, alpha, cam_x, cam_y, sprite_scale, spectating)
         if not self.dev_mode and not self.spectator_mode:
-            # Keep outside-FOV fully black; inside FOV wedge fully visible.
-            self.fog_surf.fill((0, 0, 0, 255))
-            poly = self._compute_fov_polygon_screen(state)
-            if len(poly) >= 3:
-                pygame.draw.polygon(self.fog_surf, (0, 0, 0, 0), poly)
-            else:
-                pygame.draw.circle(self.fog_surf, (0,0,0,0), (WINDOW_WIDTH//2, WINDOW_HEIGHT//2), int(state.view_radius * GRID_SIZE))
-            self.screen.blit(self.fog_surf, (0,0))
-        self.draw_hud(state); self.draw_inventory(state); self.draw_events(state); self.draw_minimap(state)
+            self.draw_fog(state)
+            self._stage("fog")
+        if not dashboard:
+            # Over the fog: footsteps are heard, not seen.
+            self.draw_ripples(state, cam_x, cam_y)
+            self._stage("ripples")
+        self._end_world()
+        self._stage("upscale")
+        self.draw_hud(state)
+        if not dashboard: self.draw_inventory(state)
+        self.draw_events(state)
+        self._stage("hud")
+        if not dashboard: self.draw_minimap(state)
+        self._stage("minimap")
         if state.my_hp <= 0: self.draw_death_overlay()
         if getattr(state, "is_extracted", False) and not self.spectator_mode: self.draw_spectator_overlay()
         if self.show_shop: self.draw_shop_menu(state)
@@ -711,6 +790,131 @@ class Renderer:
                 self.draw_help_menu()
             elif view == "item_manual":
                 self.draw_item_manual_menu()
+        self._stage("overlays")
+
+    def _draw_world(self, state, alpha, cam_x, cam_y, sprite_scale, spectating=False):
+        canvas, cell = self.canvas, self.cell
+        self.map_cache.draw(canvas, state.map_tiles, cell, self.view_w // 2 - cam_x, self.view_h // 2 - cam_y)
+        self._stage("tiles")
+        half = cell // 2
+        # Spectators get the unfiltered snapshot and aren't bound to their own view cone:
+        # only cull to the viewport (with room for the widest sprite, the supply-drop ring).
+        visible = None if spectating else self._is_world_pos_visible
+        m = 2 * cell
+        vw, vh = self.view_w + m, self.view_h + m
+        self.entity_batch.zoom = self.player_batch.zoom = sprite_scale
+        if not self.hide_world_entities:
+            batch = self.entity_batch
+            motor_bars = []
+            for ent in state.entities:
+                ex, ey = ent["pos"]["x"], ent["pos"]["y"]
+                if visible is not None and not visible(state, ex, ey):
+                    continue
+                sx, sy = self.world_to_screen(ex, ey, cam_x, cam_y)
+                if not (-m <= sx < vw and -m <= sy < vh):
+                    continue
+                etype = ent["type"]
+                if etype == "MOTOR":
+                    done = ent["state"] == 2
+                    batch.add("MOTOR_DONE" if done else "MOTOR", sx, sy)
+                    extra = ent.get("extra", {})
+                    if not done and extra:
+                        motor_bars.append((sx - half, sy - half - 10, extra.get("progress", 0), extra.get("max_progress", 100)))
+                else:
+                    batch.add(etype, sx, sy)
+            batch.flush(canvas)
+            # Small overlay pass: progress bars change every tick so they aren't baked.
+            for bx, by, prog, max_prog in motor_bars:
+                self.draw_bar(bx, by, prog, max_prog, (0, 255, 255))
+            self._stage("entities")
+
+            batch = self.player_batch
+            hp_bars = []
+            for pid, p in state.players.items():
+                if visible is not None and not visible(state, p["pos"]["x"], p["pos"]["y"]):
+                    continue
+                px, py = state.lerp_player_pos(pid, p, alpha)
+                sx, sy = self.world_to_screen(px, py, cam_x, cam_y)
+                if not (-m <= sx < vw and -m <= sy < vh):
+                    continue
+                batch.add("ENEMY", sx, sy)
+                hp_bars.append((sx - half, sy - half - 5, p["hp"], p["max_hp"]))
+            batch.flush(canvas)
+            for bx, by, hp, max_hp in hp_bars:
+                self.draw_hp_bar(bx, by, hp, max_hp)
+        if not getattr(state, "is_extracted", False):
+            # The player camera is centred on self.
+            sx, sy = self.view_w // 2, self.view_h // 2
+            self.player_batch.add("SELF", sx, sy); self.player_batch.flush(canvas)
+            self.draw_hp_bar(sx-half, sy-half-5, state.my_hp, 100)
+        self._stage("players")
+
+    def draw_ripples(self, state, cam_x, cam_y):
+        now = time.perf_counter()
+        if state.sound_events is not self._sound_events:
+            self._sound_events = state.sound_events
+            if state.sound_events:
+                self.ripples.ingest(state.sound_events, state.my_pos[0], state.my_pos[1], state.hear_radius, now)
+        self.ripples.draw(self.canvas, self.cell, self.view_w // 2 - cam_x, self.view_h // 2 - cam_y, now)
+
+    def _collect_icons(self):
+        self.assets.update(self.icon_loader.result())
+        self.icon_loader = None
+        # Anything baked before the icons arrived used the text fallback.
+        self.sprites.clear(); self.atlas.clear()
+
+    def _poll_pvs(self, state):
+        tiles = state.map_tiles
+        if tiles is not self._pvs_tiles:
+            self._pvs_tiles = tiles
+            self.pvs = None
+            if self.pvs_builder is not None:
+                self.pvs_builder.cancel()
+            radius = self._pvs_radius(state) if tiles else None
+            self.pvs_builder = PvsBuilder(tiles, radius) if radius else None
+        elif self.pvs_builder.ready():
+            self.pvs = self.pvs_builder.result()
+            self.pvs_builder = None
+
+    def _pvs_radius(self, state):
+        # Largest view radius this room's config can produce (tactic multiplier), plus headroom
+        # for view buffs; larger radii bypass the table. None if that stays under PVS_MIN_RADIUS.
+        gp = (state.config or {}).get("gameplay") or {}
+        base = float(gp.get("base_view_radius") or state.view_radius)
+        tactics = (state.config or {}).get("tactics") or {}
+        mult = max([float(t.get("view_radius_mult") or 1.0) for t in tactics.values() if isinstance(t, dict)] or [1.0])
+        top = max(float(state.view_radius), base * mult)
+        if top < PVS_MIN_RADIUS:
+            return None
+        return min(PVS_MAX_RADIUS, top + PVS_RADIUS_MARGIN)
+
+    def _stage(self, name):
+        if self.stage_timer is not None:
+            self.stage_timer.mark(name)
+
+    def draw_fog(self, state):
+        # Keep outside-FOV fully black; inside FOV wedge fully visible.
+        sw, sh = self.canvas.get_size()
+        scale = max(0.1, min(1.0, float(self.fog_mask_scale)))
+        if scale >= 1.0:
+            mask = self.surface_pool.get("fog", (sw, sh))
+        else:
+            # Build the mask at reduced resolution; the smoothscale below softens the wedge edge.
+            mask = self.surface_pool.get("fog_lowres", (sw * scale, sh * scale))
+        mask.fill((0, 0, 0, 255))
+        poly = self._compute_fov_polygon_screen(state)
+        if len(poly) >= 3:
+            if scale < 1.0:
+                poly = [(x * scale, y * scale) for x, y in poly]
+            pygame.draw.polygon(mask, (0, 0, 0, 0), poly)
+        else:
+            r = int(state.view_radius * self.cell * scale)
+            pygame.draw.circle(mask, (0, 0, 0, 0), (int(sw // 2 * scale), int(sh // 2 * scale)), r)
+        if scale < 1.0:
+            full = self.surface_pool.get("fog", (sw, sh))
+            pygame.transform.smoothscale(mask, (sw, sh), full)
+            mask = full
+        self.canvas.blit(mask, (0, 0))
 
     def draw_connect(self):
         self.screen.fill(COLOR_BG); t = self.font.render(self.t("CONNECT_TITLE"), True, (0, 255, 255))
@@ -841,6 +1045,64 @@ class Renderer:
                     rng_s = self.hud_font.render(rng, True, (150, 150, 150))
                     self.screen.blit(rng_s, (60, 612))
 
+    def room_list_merge(self, rooms):
+        self.room_index.merge(rooms)
+        self.room_list_clamp()
+
+    def room_list_selected_room(self):
+        rid = self.room_list_selected_id
+        return self.room_index.rooms.get(rid) if rid is not None else None
+
+    def room_list_move(self, delta):
+        view = self.room_index.view()
+        if not view:
+            return
+        i = self.room_index.position(self.room_list_selected_id)
+        i = 0 if i < 0 else max(0, min(len(view) - 1, i + delta))
+        self.room_list_selected_id = view[i]
+        if i < self.room_list_scroll:
+            self.room_list_scroll = i
+        elif i >= self.room_list_scroll + self.room_list_visible:
+            self.room_list_scroll = i - self.room_list_visible + 1
+
+    def room_list_scroll_by(self, delta):
+        self.room_list_scroll += delta
+        self.room_list_clamp()
+
+    def room_list_clamp(self):
+        n = len(self.room_index.view())
+        self.room_list_scroll = max(0, min(int(self.room_list_scroll), n - self.room_list_visible))
+        # A room that left the list or is filtered out of the view can't stay selected.
+        if self.room_list_selected_id is not None and self.room_index.position(self.room_list_selected_id) < 0:
+            self.room_list_selected_id = None
+
+    def room_list_click_header(self, pos):
+        for key, rect in self.room_list_header_rects:
+            if rect.collidepoint(pos):
+                self.room_index.set_sort(key)
+                self.room_list_clamp()
+                return True
+        return False
+
+    def _room_row(self, rid, room, w):
+        cached = self._room_rows.get(rid)
+        if cached is not None and cached[0] is room:
+            return cached[1]
+        if len(self._room_rows) > 512:
+            self._room_rows.clear()
+        name = str(room.get("room_name", ""))
+        players = int(room.get("players", 0) or 0)
+        maxp = int(room.get("max_players", 0) or 0)
+        map_w = int(room.get("map_width", 0) or 0)
+        map_h = int(room.get("map_height", 0) or 0)
+        row = pygame.Surface((w, 28), pygame.SRCALPHA)
+        row.blit(self.hud_font.render(name or rid, True, (255, 255, 255)), (6, 5))
+        row.blit(self.hud_font.render(self._phase_label(room.get("phase", -1)), True, (200, 200, 200)), (int(w * 0.52), 5))
+        row.blit(self.hud_font.render(f"{players}/{maxp}" if maxp else f"{players}", True, (200, 200, 200)), (int(w * 0.72), 5))
+        row.blit(self.hud_font.render(f"{map_w}x{map_h}" if map_w and map_h else "-", True, (200, 200, 200)), (int(w * 0.87), 5))
+        self._room_rows[rid] = (room, row)
+        return row
+
     def draw_room_list(self):
         self.screen.fill(COLOR_BG)
         t = self.font.render(self.t("ROOM_LIST_TITLE"), True, (0, 255, 255))
@@ -849,54 +1111,39 @@ class Renderer:
             msg = self.hud_font.render(self.menu_message, True, (255, 120, 120))
             self.screen.blit(msg, msg.get_rect(center=(WINDOW_WIDTH//2, 100)))
 
+        index = self.room_index
+        view = index.view()
         table = pygame.Rect(60, 130, WINDOW_WIDTH - 120, 370)
         pygame.draw.rect(self.screen, (35, 35, 45), table)
         pygame.draw.rect(self.screen, (0, 255, 255), table, 1)
-        # Columns: name | phase | players | map
-        self.screen.blit(self.hud_font.render(self.t("COL_ROOM"), True, (0, 255, 255)), (table.x + 10, table.y + 8))
-        self.screen.blit(self.hud_font.render(self.t("COL_PHASE"), True, (0, 255, 255)), (table.x + int(table.w * 0.52), table.y + 8))
-        self.screen.blit(self.hud_font.render(self.t("COL_PLAYERS"), True, (0, 255, 255)), (table.x + int(table.w * 0.72), table.y + 8))
-        self.screen.blit(self.hud_font.render(self.t("COL_MAP"), True, (0, 255, 255)), (table.x + int(table.w * 0.87), table.y + 8))
+        # Columns: name | phase | players | map; clicking a header sorts by it.
+        self.room_list_header_rects = []
+        for key, label, fx in (("name", "COL_ROOM", 0.0), ("phase", "COL_PHASE", 0.52), ("players", "COL_PLAYERS", 0.72), ("map", "COL_MAP", 0.87)):
+            text = self.t(label) + ((" v" if index.descending else " ^") if index.sort == key else "")
+            s = self.hud_font.render(text, True, (0, 255, 255))
+            x = table.x + (10 if fx == 0.0 else int(table.w * fx))
+            self.screen.blit(s, (x, table.y + 8))
+            self.room_list_header_rects.append((key, pygame.Rect(x, table.y + 4, s.get_width(), 24)))
 
         row_h = 28
-        visible = max(1, (table.h - 40) // row_h)
-        start = max(0, int(self.room_list_scroll))
-        end = min(len(self.rooms), start + visible)
+        self.room_list_visible = visible = max(1, (table.h - 40) // row_h)
+        start = max(0, min(int(self.room_list_scroll), len(view) - visible))
+        end = min(len(view), start + visible)
         self.room_list_row_rects = []
         y = table.y + 34
         for idx in range(start, end):
+            rid = view[idx]
             r = pygame.Rect(table.x + 6, y, table.w - 12, row_h)
-            self.room_list_row_rects.append((idx, r))
-            if idx == self.room_list_selected:
+            self.room_list_row_rects.append((rid, r))
+            if rid == self.room_list_selected_id:
                 pygame.draw.rect(self.screen, (70, 70, 95), r)
-            room = self.rooms[idx] if idx < len(self.rooms) else {}
-            name = str(room.get("room_name", ""))
-            rid = str(room.get("room_id", ""))
-            players = int(room.get("players", 0) or 0)
-            maxp = int(room.get("max_players", 0) or 0)
-            phase = room.get("phase", -1)
-            map_w = int(room.get("map_width", 0) or 0)
-            map_h = int(room.get("map_height", 0) or 0)
-
-            col1_x = r.x + 6
-            col2_x = r.x + int(r.w * 0.52)
-            col3_x = r.x + int(r.w * 0.72)
-            col4_x = r.x + int(r.w * 0.87)
-
-            left = f"{name}" if name else f"{rid}"
-            phase_s = self._phase_label(phase)
-            players_s = f"{players}/{maxp}" if maxp else f"{players}"
-            map_s = f"{map_w}x{map_h}" if map_w and map_h else "-"
-
-            self.screen.blit(self.hud_font.render(left, True, (255, 255, 255)), (col1_x, r.y + 5))
-            self.screen.blit(self.hud_font.render(phase_s, True, (200, 200, 200)), (col2_x, r.y + 5))
-            self.screen.blit(self.hud_font.render(players_s, True, (200, 200, 200)), (col3_x, r.y + 5))
-            self.screen.blit(self.hud_font.render(map_s, True, (200, 200, 200)), (col4_x, r.y + 5))
-            # show id small if name empty
-            if not name and rid:
-                pass
+            self.screen.blit(self._room_row(rid, index.rooms[rid], r.w), r.topleft)
             y += row_h
 
+        phase_s = self._phase_label(index.phase_filter) if index.phase_filter is not None else self.t("ROOM_FILTER_ALL")
+        status = f"{self.t('ROOM_FILTER_PHASE')}: {phase_s}  |  {self.t('ROOM_FILTER_OPEN')}: {'ON' if index.open_only else 'OFF'}  |  {len(view)}/{len(index)}"
+        self.screen.blit(self.hud_font.render(status, True, (150, 200, 200)), (table.x, table.bottom + 4))
+
         rr = pygame.Rect(WINDOW_WIDTH//2 - 180, 525, 160, 44)
         br = pygame.Rect(WINDOW_WIDTH//2 - 10, 525, 160, 44)
         pygame.draw.rect(self.screen, COLOR_BTN, rr, border_radius=6)
@@ -912,7 +1159,7 @@ class Renderer:
         self.screen.blit(hint, (60, 585))
 
     def draw_pause_menu(self):
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA); overlay.fill((0, 0, 0, 180)); self.screen.blit(overlay, (0,0))
+        overlay = self.surface_pool.get_filled("pause_overlay", self.screen.get_size(), (0, 0, 0, 180)); self.screen.blit(overlay, (0,0))
         pygame.draw.rect(self.screen, COLOR_MENU_BG, (WINDOW_WIDTH//2 - 150, 100, 300, 500), border_radius=10)
         t = self.font.render(self.t("PAUSE_TITLE"), True, (0, 255, 255)); self.screen.blit(t, t.get_rect(center=(WINDOW_WIDTH//2, 150)))
         lbls = {
@@ -935,31 +1182,23 @@ class Renderer:
         y = 10;
         for t in [f"HP: {state.my_hp:.0f}%", f"CASH: ${state.funds}", f"POS: {int(state.my_pos[0])},{int(state.my_pos[1])}"]:
             self.screen.blit(self.hud_font.render(t, True, COLOR_HUD_TEXT), (10, y)); y += 20
-        phase_map = {1: self.t("PHASE_SEARCH"), 2: self.t("PHASE_CONFLICT"), 3: self.t("PHASE_ESCAPE"), 4: self.t("PHASE_ENDED")}
-        p_txt = phase_map.get(state.phase, self.t("PHASE_INIT"))
-        s = self.font.render(f"{p_txt} | {int(state.time_left)}s", True, (255, 255, 0)); self.screen.blit(s, s.get_rect(center=(WINDOW_WIDTH//2, 30)))
-        self.screen.blit(self.hud_font.render(self.t("HUD_CONTROLS"), True, (150, 150, 150)), (WINDOW_WIDTH - 300, WINDOW_HEIGHT - 30))
+        p_txt = i18n.t(PHASE_KEYS[state.phase] if 1 <= state.phase < len(PHASE_KEYS) else K_PHASE_INIT)
+        s = self.text(self.font, f"{p_txt} | {int(state.time_left)}s", (255, 255, 0)); self.screen.blit(s, s.get_rect(center=(WINDOW_WIDTH//2, 30)))
+        self.screen.blit(self.text(self.hud_font, i18n.t(K_HUD_CONTROLS), (150, 150, 150)), (WINDOW_WIDTH - 300, WINDOW_HEIGHT - 30))
+        if self.dev_mode and self.frame_pacer:
+            fs = self.frame_pacer.stats()
+            ft = f"FPS {fs['fps']:.0f} | {fs['avg_ms']:.1f}ms avg | p99 {fs['p99_ms']:.1f}ms | max {fs['max_ms']:.1f}ms"
+            self.screen.blit(self.hud_font.render(ft, True, (150, 255, 150)), (10, 70))
 
     def draw_minimap(self, state):
-        pygame.draw.rect(self.screen, COLOR_RADAR_BG, self.radar_rect, border_radius=10); pygame.draw.rect(self.screen, COLOR_RADAR_BORDER, self.radar_rect, 2, border_radius=10)
-        scale = 140.0 / 32.0; ox, oy = self.radar_rect.x + 5, self.radar_rect.y + 5
-        if not getattr(self, "hide_world_entities", False):
-            for blip in state.radar_blips:
-                bxw, byw = blip["pos"]["x"], blip["pos"]["y"]
-                if not self._is_world_pos_visible(state, bxw, byw):
-                    continue
-                bx, by = bxw * scale, byw * scale
-                if blip["type"] == "MOTOR": pygame.draw.circle(self.screen, (255,255,0), (int(ox+bx), int(oy+by)), 3)
-                elif blip["type"] == "EXIT": pygame.draw.circle(self.screen, (0,255,0), (int(ox+bx), int(oy+by)), 4)
-                elif blip["type"] == "SUPPLY_DROP": pygame.draw.rect(self.screen, (255,0,255), (ox+bx-3, oy+by-3, 6, 6))
-                elif blip["type"] == "MERCHANT": pygame.draw.rect(self.screen, (255,215,0), (ox+bx-3, oy+by-3, 6, 6))
-        sx, sy = state.my_pos[0] * scale, state.my_pos[1] * scale; pygame.draw.circle(self.screen, COLOR_SELF, (int(ox+sx), int(oy+sy)), 3)
+        self.minimap.draw(self.screen, state, self._is_world_pos_visible, show_blips=not getattr(self, "hide_world_entities", False))
 
+    # World-space bars: drawn on the world canvas and sized to the current tile.
     def draw_bar(self, x, y, val, max_val, color):
-        pygame.draw.rect(self.screen, (50,50,50), (x, y, GRID_SIZE, 4)); pygame.draw.rect(self.screen, color, (x, y, GRID_SIZE * (val/max_val), 4))
+        pygame.draw.rect(self.canvas, (50,50,50), (x, y, self.cell, 4)); pygame.draw.rect(self.canvas, color, (x, y, self.cell * (val/max_val), 4))
 
     def draw_hp_bar(self, x, y, hp, max_hp):
-        pct = max(0, min(1, hp/max_hp)); pygame.draw.rect(self.screen, (100,0,0), (x, y, GRID_SIZE, 4)); pygame.draw.rect(self.screen, (0,255,0), (x, y, GRID_SIZE * pct, 4))
+        pct = max(0, min(1, hp/max_hp)); pygame.draw.rect(self.canvas, (100,0,0), (x, y, self.cell, 4)); pygame.draw.rect(self.canvas, (0,255,0), (x, y, self.cell * pct, 4))
 
     def draw_text_centered(self, text, x, y, color=(255,255,255)):
         try: s = self.font.render(text, True, color); self.screen.blit(s, s.get_rect(center=(x, y)))
@@ -987,11 +1226,11 @@ class Renderer:
             s = self.hud_font.render(f"> {msg}", True, (255,100,255)); self.screen.blit(s, (WINDOW_WIDTH - s.get_width() - 10, y)); y += 20
 
     def draw_death_overlay(self):
-        s = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA); s.fill((150, 0, 0, 120)); self.screen.blit(s, (0,0))
+        s = self.surface_pool.get_filled("death_overlay", self.screen.get_size(), (150, 0, 0, 120)); self.screen.blit(s, (0,0))
         t = self.font.render(self.t("DEATH_TITLE"), True, (255,255,255)); self.screen.blit(t, t.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2)))
 
     def draw_spectator_overlay(self):
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA); overlay.fill((0, 0, 0, 150)); self.screen.blit(overlay, (0,0))
+        overlay = self.surface_pool.get_filled("spectator_overlay", self.screen.get_size(), (0, 0, 0, 150)); self.screen.blit(overlay, (0,0))
         pygame.draw.rect(self.screen, COLOR_MENU_BG, (WINDOW_WIDTH//2 - 250, WINDOW_HEIGHT//2 - 150, 500, 300), border_radius=10)
         t = self.font.render("EXTRACTION SUCCESSFUL", True, (0, 255, 0)); self.screen.blit(t, t.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 80)))
         lbls = {"spectate": "FREE SPECTATE", "quit": "QUIT TO MENU"}
@@ -1016,6 +1255,15 @@ class Renderer:
         sens_txt = f"{self.t('LBL_MOUSE_SENS')}: {self.mouse_sensitivity:.1f}"
         self.screen.blit(self.hud_font.render(sens_txt, True, (255,255,255)), (self.sens_value_rect.x+10, self.sens_value_rect.y+5))
 
+        pygame.draw.rect(self.screen, (0,255,255), self.render_scale_rect, 2)
+        self.screen.blit(self.hud_font.render(f"{self.t('LBL_RENDER_SCALE')}: {int(round(self.render_scale * 100))}%", True, (255,255,255)), (self.render_scale_rect.x+10, self.render_scale_rect.y+5))
+
+        if self.frame_pacer:
+            cap = self.frame_pacer.fps_cap
+            pygame.draw.rect(self.screen, (0,255,255), self.fps_cap_rect, 2)
+            cap_txt = f"{self.t('LBL_FPS_CAP')}: {cap if cap else self.t('LBL_FPS_UNLIMITED')}{' (VSYNC)' if self.frame_pacer.vsync else ''}"
+            self.screen.blit(self.hud_font.render(cap_txt, True, (255,255,255)), (self.fps_cap_rect.x+10, self.fps_cap_rect.y+5))
+
         pygame.draw.rect(self.screen, (200, 50, 50), self.back_btn_rect, border_radius=5); pygame.draw.rect(self.screen, (255, 255, 255), self.back_btn_rect, 2, border_radius=5)
         self.screen.blit(self.hud_font.render("BACK", True, (255,255,255)), (self.back_btn_rect.x+40, self.back_btn_rect.y+10))
 
@@ -1036,6 +1284,30 @@ class Renderer:
         x0 = content_rect.x
         max_w = content_rect.width
 
+        # Wrapping measures every character, so the rendered lines are laid out once per width/language.
+        if self._manual_layout is None or self._manual_layout[0] != max_w:
+            self._manual_layout = (max_w,) + self._layout_item_manual(max_w)
+        _, lines, self.item_manual_content_height = self._manual_layout
+        max_scroll = max(0, self.item_manual_content_height - content_rect.height)
+        if self.item_manual_scroll < 0:
+            self.item_manual_scroll = 0
+        if self.item_manual_scroll > max_scroll:
+            self.item_manual_scroll = max_scroll
+
+        prev_clip = self.screen.get_clip()
+        self.screen.set_clip(content_rect)
+        y0 = content_rect.y - int(self.item_manual_scroll)
+        for surf, dy in lines:
+            y = y0 + dy
+            if y + 22 > content_rect.y and y < content_rect.bottom:
+                self.screen.blit(surf, (x0, y))
+        self.screen.set_clip(prev_clip)
+
+        br = pygame.Rect(self.help_rect.centerx - 60, self.help_rect.bottom - 60, 120, 40)
+        pygame.draw.rect(self.screen, (200, 50, 50), br, border_radius=5); pygame.draw.rect(self.screen, (255, 255, 255), br, 2, border_radius=5)
+        self.screen.blit(self.hud_font.render("BACK", True, (255,255,255)), (br.x+40, br.y+10)); self.item_manual_back_rect = br
+
+    def _layout_item_manual(self, max_w):
         def wrap_lines(text: str):
             # CJK-friendly wrapping: wrap by character width.
             lines = []
@@ -1055,55 +1327,22 @@ class Renderer:
                     lines.append(cur)
             return lines
 
-        def measure_content_height():
-            yy = content_rect.y
-            for cat, ids in CATEGORY_ORDER:
-                yy += 22
-                for iid in ids:
-                    ab = get_item_abbr(iid)
-                    nm = get_item_name(iid)
-                    use = get_item_use(iid)
-                    for _ in wrap_lines(f"{ab}  {nm} ({iid})"):
-                        yy += 22
-                    if use:
-                        for _ in wrap_lines(f"- {use}"):
-                            yy += 22
-                    yy += 6
-                yy += 8
-            return max(0, yy - content_rect.y)
-
-        self.item_manual_content_height = measure_content_height()
-        max_scroll = max(0, self.item_manual_content_height - content_rect.height)
-        if self.item_manual_scroll < 0:
-            self.item_manual_scroll = 0
-        if self.item_manual_scroll > max_scroll:
-            self.item_manual_scroll = max_scroll
-
-        prev_clip = self.screen.get_clip()
-        self.screen.set_clip(content_rect)
-
-        y = content_rect.y - int(self.item_manual_scroll)
+        out = []
+        y = 0
         for cat, ids in CATEGORY_ORDER:
-            self.screen.blit(self.hud_font.render(f"[{cat}]", True, (255,215,0)), (x0, y)); y += 22
+            out.append((self.hud_font.render(f"[{cat}]", True, (255,215,0)), y)); y += 22
             for iid in ids:
-                ab = get_item_abbr(iid)
-                nm = get_item_name(iid)
                 use = get_item_use(iid)
-                for ln in wrap_lines(f"{ab}  {nm} ({iid})"):
-                    self.screen.blit(self.hud_font.render(ln, True, (255,255,255)), (x0, y))
+                for ln in wrap_lines(f"{get_item_abbr(iid)}  {get_item_name(iid)} ({iid})"):
+                    out.append((self.hud_font.render(ln, True, (255,255,255)), y))
                     y += 22
                 if use:
                     for ln in wrap_lines(f"- {use}"):
-                        self.screen.blit(self.hud_font.render(ln, True, (180,180,180)), (x0, y))
+                        out.append((self.hud_font.render(ln, True, (180,180,180)), y))
                         y += 22
                 y += 6
             y += 8
-
-        self.screen.set_clip(prev_clip)
-
-        br = pygame.Rect(self.help_rect.centerx - 60, self.help_rect.bottom - 60, 120, 40)
-        pygame.draw.rect(self.screen, (200, 50, 50), br, border_radius=5); pygame.draw.rect(self.screen, (255, 255, 255), br, 2, border_radius=5)
-        self.screen.blit(self.hud_font.render("BACK", True, (255,255,255)), (br.x+40, br.y+10)); self.item_manual_back_rect = br
+        return out, y
 
     def scroll_item_manual(self, delta_px: int):
         if self.pause_view() != "item_manual":
@@ -1128,6 +1367,16 @@ class Renderer:
         self.screen.blit(self.hud_font.render("BACK [B]", True, (255,255,255)), (br.x+25, br.y+10)); self.shop_back_rect = br
 
     def draw_ui_buttons(self): pass
+    def dashboard_click(self, pos):
+        # Clicking a follow-cam drops back to the free camera, centred on that player.
+        hit = self.dashboard.hit(pos)
+        if hit is None:
+            return False
+        self.cam_offset = [hit[1][0], hit[1][1]]
+        self.cam_prev = None
+        self.spectator_dashboard = False
+        return True
+
     def handle_click(self, pos):
         if self.state == "LOGIN":
             if hasattr(self, 'login_back_rect') and self.login_back_rect.collidepoint(pos): self.state = "CONNECT"; return True
@@ -1155,6 +1404,8 @@ class Renderer:
                     self.mouse_sensitivity = max(0.1, round(self.mouse_sensitivity - 0.1, 1)); return True
                 if self.sens_plus_rect.collidepoint(pos):
                     self.mouse_sensitivity = min(5.0, round(self.mouse_sensitivity + 0.1, 1)); return True
+                if self.frame_pacer and self.fps_cap_rect.collidepoint(pos): self.frame_pacer.cycle_fps_cap(); return True
+                if self.render_scale_rect.collidepoint(pos): self.cycle_render_scale(); return True
                 if self.back_btn_rect.collidepoint(pos): self.pause_pop(); return True
             elif view == "help":
                 if hasattr(self, 'help_back_rect') and self.help_back_rect.collidepoint(pos): self.pause_pop(); return True
@@ -0,0 +1,126 @@
+import math
+import pygame
+from client.config import (
+    COLOR_RIPPLE, RIPPLE_POOL_SIZE, RIPPLE_DIR_BINS, RIPPLE_EMIT_SEC, RIPPLE_LIFE_SEC, RIPPLE_FRAMES,
+)
+
+# Intensities are quantized to this many ring styles (size + opacity).
+_LEVELS = 4
+
+
+class RipplePool:
+    """Footstep ripples in a preallocated, fixed-size pool.
+
+    Slots are parallel lists plus a free list, so spawning and expiring allocate nothing;
+    when the pool is full the oldest ripple is recycled. ingest() turns a snapshot's sound
+    events into ripples at their estimated world position (FOOTSTEP intensity is
+    1 - distance / hear_radius). Events whose direction falls into the same bin are one
+    emitter, which starts a new ring at most every `emit_sec` however many footsteps arrive
+    per tick. draw() expires old slots and submits every live ring as one Surface.blits
+    from pre-rendered frames.
+    """
+
+    def __init__(self, size=RIPPLE_POOL_SIZE, bins=RIPPLE_DIR_BINS, emit_sec=RIPPLE_EMIT_SEC,
+                 life_sec=RIPPLE_LIFE_SEC, frames=RIPPLE_FRAMES):
+        self.size = int(size)
+        self.bins = int(bins)
+        self.emit_sec = float(emit_sec)
+        self.life_sec = float(life_sec)
+        self.frames = int(frames)
+        self.x = [0.0] * self.size
+        self.y = [0.0] * self.size
+        self.born = [0.0] * self.size
+        self.level = [0] * self.size
+        self.active = [False] * self.size
+        self.free = list(range(self.size - 1, -1, -1))
+        self.emitters = {}  # direction bin -> time of its last ring
+        self._sprites = None
+        self._sprites_cell = None
+        self._items = []
+
+    def live(self):
+        return self.size - len(self.free)
+
+    def _spawn(self, wx, wy, level, now):
+        if self.free:
+            i = self.free.pop()
+        else:
+            # Hard cap: recycle the oldest ring.
+            born = self.born
+            i = min(range(self.size), key=born.__getitem__)
+        self.x[i] = wx
+        self.y[i] = wy
+        self.born[i] = now
+        self.level[i] = level
+        self.active[i] = True
+
+    def ingest(self, events, ox, oy, hear_radius, now):
+        merged = {}
+        for ev in events:
+            if ev.get("type") != "FOOTSTEP":
+                continue
+            d = ev.get("dir") or {}
+            dx, dy = d.get("x", 0.0), d.get("y", 0.0)
+            inten = float(ev.get("intensity") or 0.0)
+            b = int((math.atan2(dy, dx) / (2.0 * math.pi)) % 1.0 * self.bins) % self.bins
+            cur = merged.get(b)
+            if cur is None or inten > cur[2]:
+                merged[b] = (dx, dy, inten)
+        emitters = self.emitters
+        for b in [b for b, t in emitters.items() if now - t >= self.emit_sec]:
+            del emitters[b]
+        for b, (dx, dy, inten) in merged.items():
+            if b in emitters:
+                continue
+            dist = max(1.0, (1.0 - inten) * float(hear_radius))
+            level = min(_LEVELS - 1, max(0, int(inten * _LEVELS)))
+            self._spawn(ox + dx * dist, oy + dy * dist, level, now)
+            emitters[b] = now
+
+    def _frames_for(self, cell):
+        # [level][frame] -> (ring surface, half size); rebuilt only when the tile size changes.
+        if self._sprites_cell != cell:
+            levels = []
+            for lv in range(_LEVELS):
+                inten = (lv + 1) / float(_LEVELS)
+                rmax = max(3, int(cell * (0.6 + 1.4 * inten)))
+                half = rmax + 2
+                frames = []
+                for f in range(self.frames):
+                    p = (f + 0.5) / self.frames
+                    s = pygame.Surface((half * 2 + 1, half * 2 + 1), pygame.SRCALPHA)
+                    alpha = int(230 * (0.4 + 0.6 * inten) * (1.0 - p))
+                    pygame.draw.circle(s, COLOR_RIPPLE + (alpha,), (half, half), max(2, int(rmax * p)), 2)
+                    frames.append((s, half))
+                levels.append(frames)
+            self._sprites = levels
+            self._sprites_cell = cell
+        return self._sprites
+
+    def draw(self, target, cell, ox, oy, now):
+        """Blit live rings; world (wx, wy) maps to (wx * cell + ox, wy * cell + oy)."""
+        if len(self.free) == self.size:
+            return
+        sprites = self._frames_for(cell)
+        items = self._items
+        life, nf = self.life_sec, self.frames
+        x, y, born, level, active = self.x, self.y, self.born, self.level, self.active
+        for i in range(self.size):
+            if not active[i]:
+                continue
+            t = (now - born[i]) / life
+            if t >= 1.0 or t < 0.0:
+                active[i] = False
+                self.free.append(i)
+                continue
+            surf, half = sprites[level[i]][int(t * nf)]
+            items.append((surf, (int(x[i] * cell + ox) - half, int(y[i] * cell + oy) - half)))
+        if items:
+            target.blits(items, doreturn=False)
+            items.clear()
+
+    def clear(self):
+        for i in range(self.size):
+            self.active[i] = False
+        self.free = list(range(self.size - 1, -1, -1))
+        self.emitters.clear()
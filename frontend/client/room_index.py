@@ -0,0 +1,165 @@
+def _int(v):
+    try:
+        return int(v or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+# Sort keys over the per-room record; each maps to the record field it orders by.
+SORT_KEYS = ("name", "players", "free", "map", "phase")
+_FIELD = {"name": 1, "players": 3, "free": 4, "map": 5, "phase": 2}
+# Phase filter cycle: None = all phases.
+PHASE_FILTERS = (None, 0, 1, 2, 3, 4)
+
+
+class RoomIndex:
+    """Keyed room browser index built from LIST_ROOMS (1014) summaries.
+
+    merge() diffs a full server list against the index by room_id: unchanged rooms are
+    untouched, changed ones re-indexed, missing ones dropped, so a refresh keeps identities
+    (and the browser its selection). Each room is reduced to a record
+    (room_id, name_key, phase, players, free_slots, map_area) plus a phase bucket; sorted
+    orders are cached per key and only rebuilt when a merge changed that key's field. view()
+    is the filtered, sorted list of room_ids, recomputed only after a merge or a
+    filter / sort change, never per frame.
+    """
+
+    def __init__(self):
+        self.rooms = {}     # room_id -> summary dict as received
+        self.records = {}   # room_id -> record tuple
+        self.by_phase = {}  # phase -> set(room_id)
+        self._orders = {}   # sort key -> [room_id] ascending
+        self.sort = "name"
+        self.descending = False
+        self.phase_filter = None
+        self.open_only = False
+        self._view = None
+        self._pos = {}
+        # Bumped on every merge that changed something; renderers key row caches on it.
+        self.version = 0
+
+    def __len__(self):
+        return len(self.rooms)
+
+    def _record(self, rid, room):
+        players = _int(room.get("players"))
+        maxp = _int(room.get("max_players"))
+        free = max(0, maxp - players) if maxp else 0
+        name = str(room.get("room_name") or rid)
+        phase = room.get("phase")
+        phase = _int(phase) if phase is not None else -1
+        return (rid, name.lower(), phase, players, free, _int(room.get("map_width")) * _int(room.get("map_height")))
+
+    def _unbucket(self, rid, rec):
+        bucket = self.by_phase.get(rec[2])
+        if bucket is not None:
+            bucket.discard(rid)
+            if not bucket:
+                del self.by_phase[rec[2]]
+
+    def merge(self, rooms):
+        """Apply a full room list; returns the number of added, changed or removed rooms."""
+        changed_fields = set()
+        membership = False
+        seen = set()
+        changes = 0
+        for room in rooms or ():
+            if not isinstance(room, dict):
+                continue
+            rid = str(room.get("room_id") or "")
+            if not rid or rid in seen:
+                continue
+            seen.add(rid)
+            if self.rooms.get(rid) == room:
+                continue
+            rec = self._record(rid, room)
+            old = self.records.get(rid)
+            if old is None:
+                membership = True
+            else:
+                changed_fields.update(i for i in range(1, len(rec)) if rec[i] != old[i])
+                self._unbucket(rid, old)
+            self.rooms[rid] = room
+            self.records[rid] = rec
+            self.by_phase.setdefault(rec[2], set()).add(rid)
+            changes += 1
+        if len(seen) != len(self.rooms):
+            for rid in [r for r in self.rooms if r not in seen]:
+                self._unbucket(rid, self.records.pop(rid))
+                del self.rooms[rid]
+                changes += 1
+            membership = True
+        if changes:
+            if membership:
+                self._orders.clear()
+            else:
+                for key in [k for k in self._orders if _FIELD[k] in changed_fields]:
+                    del self._orders[key]
+            self._view = None
+            self.version += 1
+        return changes
+
+    def _order(self, key):
+        order = self._orders.get(key)
+        if order is None:
+            f = _FIELD[key]
+            recs = self.records
+            # Ties fall back to the name, then the id, so the order is stable across refreshes.
+            order = sorted(recs, key=lambda rid: (recs[rid][f], recs[rid][1], rid))
+            self._orders[key] = order
+        return order
+
+    def set_sort(self, key, descending=None):
+        if key not in _FIELD:
+            return
+        if descending is None:
+            # Picking the current key again flips the direction.
+            descending = (not self.descending) if key == self.sort else key != "name"
+        self.sort, self.descending = key, bool(descending)
+        self._view = None
+
+    def cycle_sort(self):
+        nxt = SORT_KEYS[(SORT_KEYS.index(self.sort) + 1) % len(SORT_KEYS)]
+        self.set_sort(nxt, nxt != "name")
+
+    def cycle_phase_filter(self):
+        i = PHASE_FILTERS.index(self.phase_filter) if self.phase_filter in PHASE_FILTERS else 0
+        self.phase_filter = PHASE_FILTERS[(i + 1) % len(PHASE_FILTERS)]
+        self._view = None
+
+    def toggle_open_only(self):
+        self.open_only = not self.open_only
+        self._view = None
+
+    def view(self):
+        if self._view is None:
+            recs = self.records
+            bucket = None if self.phase_filter is None else self.by_phase.get(self.phase_filter, ())
+            if bucket is not None and len(bucket) * 8 < len(recs):
+                # Small phase bucket: sort just the bucket instead of walking the whole order.
+                f = _FIELD[self.sort]
+                order = sorted(bucket, key=lambda rid: (recs[rid][f], recs[rid][1], rid), reverse=self.descending)
+            else:
+                order = self._order(self.sort)
+                if self.descending:
+                    order = order[::-1]
+                if bucket is not None:
+                    order = [rid for rid in order if rid in bucket]
+            if self.open_only:
+                order = [rid for rid in order if recs[rid][4] > 0]
+            self._view = order
+            self._pos = {rid: i for i, rid in enumerate(order)}
+        return self._view
+
+    def position(self, rid):
+        self.view()
+        return self._pos.get(rid, -1)
+
+    def clear(self):
+        self.rooms.clear()
+        self.records.clear()
+        self.by_phase.clear()
+        self._orders.clear()
+        self._view = None
+        self._pos = {}
+        self.version += 1
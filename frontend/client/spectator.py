@@ -0,0 +1,159 @@
+import math
+import pygame
+from client.config import COLOR_RADAR_BORDER, COLOR_SELF, COLOR_ENEMY, COLOR_HUD_TEXT, SPECTATOR_MAX_POVS, ZOOM_LEVELS
+
+_LABEL_CACHE_MAX = 256
+# Entities are bucketed once per frame into squares of this many tiles; panels only walk the
+# buckets they overlap.
+_BUCKET_TILES = 8
+
+
+class SpectatorDashboard:
+    """Caster view: a grid of follow-cams, one per live player, plus a whole-map overview.
+
+    Extracted players receive every player and entity unfiltered, so panels skip the
+    visibility/LOS tests entirely: each panel is a viewport cull plus blits from the
+    renderer's shared MapChunkCache and SpriteAtlas. Follow-cams use the spectator zoom.
+    """
+
+    def __init__(self, renderer):
+        self.r = renderer
+        self.max_povs = SPECTATOR_MAX_POVS
+        self._layout_key = None
+        self._rects = []
+        self._labels = {}
+        # Panels of the last frame, in canvas coordinates: [(rect, session_id, (wx, wy)), ...]
+        self.panels = []
+        self.scale = 1.0
+
+    def povs(self, state):
+        live = [(pid, p) for pid, p in state.players.items() if p.get("is_alive", True) and not p.get("is_extracted")]
+        live.sort(key=lambda it: (it[1].get("name") or "", it[0]))
+        return live[:self.max_povs]
+
+    def layout(self, n, size):
+        # Overview first, then one cell per POV; cells are as square as the window allows.
+        key = (n, size)
+        if key != self._layout_key:
+            w, h = size
+            total = n + 1
+            cols = max(1, int(math.ceil(math.sqrt(total * w / float(h)))))
+            rows = int(math.ceil(total / float(cols)))
+            cw, ch = w // cols, h // rows
+            self._rects = [pygame.Rect((i % cols) * cw, (i // cols) * ch, cw, ch) for i in range(total)]
+            self._layout_key = key
+        return self._rects
+
+    def label(self, text, color=COLOR_HUD_TEXT):
+        key = (text, color)
+        s = self._labels.get(key)
+        if s is None:
+            if len(self._labels) >= _LABEL_CACHE_MAX:
+                self._labels.clear()
+            s = self._labels[key] = self.r.hud_font.render(text, True, color)
+        return s
+
+    def draw(self, canvas, state, alpha, sprite_scale):
+        r = self.r
+        povs = self.povs(state)
+        rects = self.layout(len(povs), canvas.get_size())
+        self.scale = canvas.get_width() / float(r.screen.get_width() or 1)
+        self.panels = []
+        positions = {pid: state.lerp_player_pos(pid, p, alpha) for pid, p in state.players.items()}
+        self._draw_overview(canvas, state, rects[0], positions)
+        cell = r.cell
+        buckets = self._bucket(state.entities, cell) if povs else None
+        for rect, (pid, p) in zip(rects[1:], povs):
+            wx, wy = positions[pid]
+            self._draw_pov(canvas, state, rect, cell, sprite_scale, pid, p, wx, wy, positions, buckets)
+            self.panels.append((rect, pid, (wx, wy)))
+        canvas.set_clip(None)
+
+    def _bucket(self, entities, cell):
+        # {(bx, by): [(world_px_x, world_px_y, sprite_key), ...]} for this frame's tile size.
+        buckets = {}
+        for ent in entities:
+            ex, ey = ent["pos"]["x"], ent["pos"]["y"]
+            etype = ent["type"]
+            key = "MOTOR_DONE" if etype == "MOTOR" and ent["state"] == 2 else etype
+            b = (int(ex) // _BUCKET_TILES, int(ey) // _BUCKET_TILES)
+            lst = buckets.get(b)
+            if lst is None:
+                lst = buckets[b] = []
+            lst.append((ex * cell, ey * cell, key))
+        return buckets
+
+    def _draw_pov(self, canvas, state, rect, cell, sprite_scale, pid, p, wx, wy, positions, buckets):
+        r = self.r
+        canvas.set_clip(rect)
+        ox = rect.centerx - wx * cell
+        oy = rect.centery - wy * cell
+        r.map_cache.draw(canvas, state.map_tiles, cell, ox, oy, rect)
+        # Cull against the panel grown by two tiles so sprites straddling the edge still show.
+        m = 2 * cell
+        left, top = rect.left - m, rect.top - m
+        right, bottom = rect.right + m, rect.bottom + m
+        batch = r.entity_batch
+        batch.zoom = sprite_scale
+        span = _BUCKET_TILES * cell
+        for by in range(int((top - oy) // span), int((bottom - oy) // span) + 1):
+            for bx in range(int((left - ox) // span), int((right - ox) // span) + 1):
+                for px, py, key in buckets.get((bx, by), ()):
+                    sx = int(px + ox); sy = int(py + oy)
+                    if left <= sx < right and top <= sy < bottom:
+                        batch.add(key, sx, sy)
+        batch.flush(canvas)
+        batch = r.player_batch
+        batch.zoom = sprite_scale
+        half = cell // 2
+        hp_bars = []
+        for qid, q in state.players.items():
+            px, py = positions[qid]
+            sx = int(px * cell + ox); sy = int(py * cell + oy)
+            if left <= sx < right and top <= sy < bottom and q.get("is_alive", True):
+                batch.add("ENEMY", sx, sy)
+                hp_bars.append((sx - half, sy - half - 5, q.get("hp", 0), q.get("max_hp") or 100))
+        batch.flush(canvas)
+        for bx, by, hp, max_hp in hp_bars:
+            r.draw_hp_bar(bx, by, hp, max_hp)
+        pygame.draw.circle(canvas, COLOR_SELF, rect.center, max(3, cell // 2), 1)
+        look = p.get("look_dir") or {}
+        lx, ly = look.get("x", 0.0), look.get("y", 0.0)
+        if lx or ly:
+            reach = float(p.get("view_radius") or 5.0) * cell
+            pygame.draw.line(canvas, COLOR_SELF, rect.center, (rect.centerx + lx * reach, rect.centery + ly * reach), 1)
+        canvas.blit(self.label(p.get("name") or pid), (rect.x + 4, rect.y + 2))
+        pygame.draw.rect(canvas, COLOR_RADAR_BORDER, rect, 1)
+
+    def _draw_overview(self, canvas, state, rect, positions):
+        r = self.r
+        tiles = state.map_tiles
+        canvas.set_clip(rect)
+        mh = len(tiles)
+        mw = len(tiles[0]) if mh else 0
+        if mw and mh:
+            cell = max(1, min(rect.w // mw, rect.h // mh))
+            ox = rect.x + (rect.w - mw * cell) // 2
+            oy = rect.y + (rect.h - mh * cell) // 2
+            r.map_cache.draw(canvas, tiles, cell, ox, oy, rect)
+            batch = r.entity_batch
+            batch.zoom = ZOOM_LEVELS[0]
+            for ent in state.entities:
+                if ent["type"] in ("MOTOR", "EXIT", "SUPPLY_DROP"):
+                    batch.add(ent["type"], int(ent["pos"]["x"] * cell + ox), int(ent["pos"]["y"] * cell + oy))
+            batch.flush(canvas)
+            rd = max(2, cell // 2)
+            for qid, q in state.players.items():
+                if not q.get("is_alive", True) or q.get("is_extracted"):
+                    continue
+                px, py = positions[qid]
+                pygame.draw.circle(canvas, COLOR_ENEMY, (int(px * cell + ox), int(py * cell + oy)), rd)
+        pygame.draw.rect(canvas, COLOR_RADAR_BORDER, rect, 1)
+
+    def hit(self, pos):
+        """(session_id, (wx, wy)) of the follow-cam under screen position `pos`, or None."""
+        x, y = pos[0] * self.scale, pos[1] * self.scale
+        for rect, pid, wpos in self.panels:
+            if rect.collidepoint(x, y):
+                return pid, wpos
+        return None
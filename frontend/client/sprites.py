@@ -0,0 +1,164 @@
+import os
+import threading
+import pygame
+from client.config import (
+    GRID_SIZE, COLOR_SUPPLY_DROP, COLOR_MOTOR_ACTIVE, COLOR_MOTOR_DONE, COLOR_EXIT, COLOR_ENEMY, COLOR_SELF,
+)
+
+
+class IconLoader:
+    """Decodes and scales the world icon PNGs on a background thread.
+
+    The source files are large, so decoding them in Renderer.__init__ delayed the first
+    window frame. result() joins the thread and does the display-dependent convert_alpha()
+    on the calling (main) thread; call it before the SpriteBank first needs an icon.
+    """
+
+    def __init__(self, icon_dir, files, size):
+        self.icon_dir = icon_dir
+        self.files = dict(files)
+        self.size = size
+        self._raw = {}
+        self._done = None
+        self.thread = threading.Thread(target=self._run, name="icon-loader", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        for key, name in self.files.items():
+            try:
+                p = os.path.join(self.icon_dir, name)
+                if os.path.exists(p):
+                    self._raw[key] = pygame.transform.scale(pygame.image.load(p), (self.size, self.size))
+            except Exception as e: print(f"Icon error {name}: {e}")
+
+    def ready(self):
+        return not self.thread.is_alive()
+
+    def result(self):
+        if self._done is None:
+            self.thread.join()
+            self._done = {}
+            for key, img in self._raw.items():
+                try:
+                    self._done[key] = img.convert_alpha()
+                except pygame.error:
+                    self._done[key] = img
+            self._raw = {}
+        return self._done
+
+
+class SpriteBank:
+    """Pre-baked world sprites keyed by entity type (plus a few state variants).
+
+    Each entry is (surface, anchor_x, anchor_y): blitting at (sx - ax, sy - ay) puts the
+    sprite's logical center on the entity's screen position. Built lazily so icon/font
+    loading isn't duplicated and unknown types cost nothing.
+    """
+
+    def __init__(self, assets, font, grid=GRID_SIZE):
+        self.assets = assets
+        self.font = font
+        self.grid = grid
+        self._cache = {}
+
+    def _canvas(self, w, h):
+        s = pygame.Surface((max(1, w), max(1, h)), pygame.SRCALPHA)
+        return s, w // 2, h // 2
+
+    def _text(self, text, color):
+        try:
+            return self.font.render(text, True, color)
+        except Exception:
+            return None
+
+    def _with_label(self, base_w, base_h, draw_base, label, label_color):
+        # Shape centered in a canvas large enough for both the shape and its centered label.
+        t = self._text(label, label_color) if label else None
+        w = max(base_w, t.get_width() if t else 0)
+        h = max(base_h, t.get_height() if t else 0)
+        s, cx, cy = self._canvas(w, h)
+        draw_base(s, cx, cy)
+        if t:
+            s.blit(t, t.get_rect(center=(cx, cy)))
+        return s, cx, cy
+
+    def _icon_or_text(self, key, fallback, color):
+        half = self.grid // 2
+        if key in self.assets:
+            return self.assets[key], half, half
+        t = self._text(fallback, color)
+        if t is None:
+            return None
+        return t, t.get_width() // 2, t.get_height() // 2
+
+    def _build(self, key):
+        g = self.grid
+        half = g // 2
+        if key == "ITEM_DROP":
+            return self._icon_or_text("ITEM_DROP", "📦", (255, 255, 0))
+        if key == "MERCHANT":
+            return self._icon_or_text("MERCHANT", "💰", (255, 215, 0))
+        if key == "SUPPLY_DROP":
+            s, cx, cy = self._canvas(g * 2 + 2, g * 2 + 2)
+            pygame.draw.circle(s, COLOR_SUPPLY_DROP, (cx, cy), g, 1)
+            inner = self._icon_or_text("SUPPLY_DROP", "🎁", COLOR_SUPPLY_DROP)
+            if inner:
+                s.blit(inner[0], (cx - inner[1], cy - inner[2]))
+            return s, cx, cy
+        if key in ("MOTOR", "MOTOR_DONE"):
+            color = COLOR_MOTOR_DONE if key == "MOTOR_DONE" else COLOR_MOTOR_ACTIVE
+            return self._with_label(half * 2 + 1, half * 2 + 1, lambda s, cx, cy: pygame.draw.circle(s, color, (cx, cy), half, 0), "M", (0, 0, 0))
+        if key == "EXIT":
+            return self._with_label(g, g, lambda s, cx, cy: pygame.draw.rect(s, COLOR_EXIT, (cx - half, cy - half, g, g), 0), "E", (0, 0, 0))
+        if key == "ENEMY":
+            rd = g // 4
+            s, cx, cy = self._canvas(rd * 2 + 1, rd * 2 + 1)
+            pygame.draw.circle(s, COLOR_ENEMY, (cx, cy), rd)
+            return s, cx, cy
+        if key == "SELF":
+            # Dot plus the "ME" tag 10px above it, anchored on the dot.
+            rd = g // 4
+            t = self._text("ME", (255, 255, 255))
+            tw, th = (t.get_width(), t.get_height()) if t else (0, 0)
+            w = max(rd * 2 + 1, tw)
+            top = max(rd, 10 + th // 2)
+            s = pygame.Surface((max(1, w), top + rd + 1), pygame.SRCALPHA)
+            cx, cy = w // 2, top
+            pygame.draw.circle(s, COLOR_SELF, (cx, cy), rd)
+            if t:
+                s.blit(t, t.get_rect(center=(cx, cy - 10)))
+            return s, cx, cy
+        return None
+
+    def get(self, key):
+        if key not in self._cache:
+            self._cache[key] = self._build(key)
+        return self._cache[key]
+
+    def clear(self):
+        self._cache.clear()
+
+
+class SpriteBatch:
+    """Collects (surface, dest) pairs for one layer and submits them with a single Surface.blits call.
+
+    `source` is anything with get(key, zoom) -> (surface, ax, ay) | None (a SpriteAtlas).
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.zoom = 1.0
+        self.items = []
+
+    def add(self, key, sx, sy):
+        spr = self.source.get(key, self.zoom)
+        if spr is None:
+            return False
+        surf, ax, ay = spr
+        self.items.append((surf, (sx - ax, sy - ay)))
+        return True
+
+    def flush(self, target):
+        if self.items:
+            target.blits(self.items, doreturn=False)
+            self.items.clear()
@@ -0,0 +1,40 @@
+import pygame
+
+
+class SurfacePool:
+    """Reusable scratch surfaces keyed by name.
+
+    Each surface is allocated once per requested size and handed back on every
+    later call, so full-window overlays don't allocate per frame. Asking for a
+    different size (window resize / render scale change) replaces the entry.
+    """
+
+    def __init__(self):
+        self._surfs = {}
+        self._fills = {}
+
+    def get(self, key, size, flags=pygame.SRCALPHA):
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+        s = self._surfs.get(key)
+        if s is None or s.get_size() != size or (s.get_flags() & flags) != flags:
+            s = pygame.Surface(size, flags)
+            self._surfs[key] = s
+            self._fills.pop(key, None)
+        return s
+
+    def get_filled(self, key, size, color, flags=pygame.SRCALPHA):
+        # Static tint overlays only need to be filled when first created or when the color changes.
+        s = self.get(key, size, flags)
+        color = tuple(color)
+        if self._fills.get(key) != color:
+            s.fill(color)
+            self._fills[key] = color
+        return s
+
+    def mark_dirty(self, key):
+        # Callers that draw into a pooled surface must drop its cached fill color.
+        self._fills.pop(key, None)
+
+    def clear(self):
+        self._surfs.clear()
+        self._fills.clear()
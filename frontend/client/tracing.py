@@ -0,0 +1,121 @@
+import contextlib
+import itertools
+import json
+import os
+import threading
+import time
+
+from client.config import TRACE_BUFFER_EVENTS
+
+# Opt-in span tracing exported as Chrome trace-event JSON (chrome://tracing, ui.perfetto.dev).
+# Disabled by default: span() then returns a shared null context, so instrumented call sites
+# cost one global lookup. Enable with enable() (main.py does so for --trace / ECHO_TRACE_TRACE).
+
+ENV_VAR = "ECHO_TRACE_TRACE"
+
+_NULL = contextlib.nullcontext()
+_tracer = None
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "t0")
+
+    def __init__(self, tracer, name, cat):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.complete(self.name, self.t0, time.perf_counter(), self.cat)
+        return False
+
+
+class Tracer:
+    """Fixed-size ring buffer of complete ("X") events from any thread.
+
+    Slots are preallocated parallel lists; a writer claims one with next() on an
+    itertools.count (atomic under the GIL), so recording never allocates a buffer or takes
+    a lock. Once full, the oldest events are overwritten. Each slot also keeps the sequence
+    number it was written with, so readers never advance the counter.
+    """
+
+    def __init__(self, capacity=TRACE_BUFFER_EVENTS, clock=time.perf_counter):
+        self.capacity = max(1, int(capacity))
+        self.clock = clock
+        self.origin = clock()
+        self._seq = itertools.count()
+        self._name = [None] * self.capacity
+        self._cat = [None] * self.capacity
+        self._t0 = [0.0] * self.capacity
+        self._t1 = [0.0] * self.capacity
+        self._tid = [0] * self.capacity
+        self._seqno = [-1] * self.capacity
+        self._threads = {}
+
+    def span(self, name, cat="client"):
+        return _Span(self, name, cat)
+
+    def complete(self, name, t0, t1, cat="client"):
+        tid = threading.get_ident()
+        if tid not in self._threads:
+            self._threads[tid] = threading.current_thread().name
+        n = next(self._seq)
+        i = n % self.capacity
+        self._name[i] = name
+        self._cat[i] = cat
+        self._t0[i] = t0
+        self._t1[i] = t1
+        self._tid[i] = tid
+        # Written last: marks the slot as holding event n.
+        self._seqno[i] = n
+
+    def events(self):
+        """Recorded events oldest-first as Chrome trace-event dicts (timestamps in µs)."""
+        total = max(self._seqno) + 1
+        start = max(0, total - self.capacity)
+        pid = os.getpid()
+        out = [{"ph": "M", "name": "thread_name", "pid": pid, "tid": tid, "args": {"name": nm}} for tid, nm in list(self._threads.items())]
+        for n in range(start, total):
+            i = n % self.capacity
+            if self._seqno[i] != n:
+                continue
+            name = self._name[i]
+            t0 = self._t0[i]
+            out.append({
+                "ph": "X", "name": name, "cat": self._cat[i], "pid": pid, "tid": self._tid[i],
+                "ts": round((t0 - self.origin) * 1e6, 1), "dur": round((self._t1[i] - t0) * 1e6, 1),
+            })
+        return out
+
+    def export(self, path):
+        tmp = f"{path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.events(), "displayTimeUnit": "ms"}, f)
+        os.replace(tmp, path)
+        return str(path)
+
+
+def enable(capacity=TRACE_BUFFER_EVENTS):
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(capacity)
+    return _tracer
+
+
+def disable():
+    global _tracer
+    t, _tracer = _tracer, None
+    return t
+
+
+def get_tracer():
+    return _tracer
+
+
+def span(name, cat="client"):
+    t = _tracer
+    return _NULL if t is None else _Span(t, name, cat)
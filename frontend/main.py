@@ -1,4 +1,7 @@
+import atexit
+import os
 import sys
+import time
 import queue
 import json
 from pathlib import Path
@@ -6,7 +9,12 @@ import pygame
 from client.network import NetworkClient
 from client.gamestate import GameState
 from client.renderer import Renderer
-from client.config import WINDOW_WIDTH, WINDOW_HEIGHT
+from client.frame_pacer import FramePacer, FixedTimestep
+from client.profiling import ProfilerOverlay
+from client.persistence import JsonStateWriter
+from client import protocol, recording, tracing
+from client.protocol import S2C
+from client.config import WINDOW_WIDTH, WINDOW_HEIGHT, FPS_CAP, RENDER_SCALE, ROOM_LIST_REFRESH_SEC
 
 # Default Server
 DEFAULT_SERVER_URL = "ws://localhost:8080/ws"
@@ -23,31 +31,72 @@ def _load_client_state():
         return {}
 
 
+# Writes are debounced and done atomically off the main thread; main() flushes on exit.
+_state_writer = JsonStateWriter(CLIENT_STATE_PATH)
+atexit.register(_state_writer.close)
+
+
 def _save_client_state(data: dict):
-    try:
-        with open(CLIENT_STATE_PATH, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    except Exception:
-        pass
+    _state_writer.save(data)
+
+def _opt_in_path(flag, env_var, suffix):
+    # Opt-in capture: `--flag[=path]` on the command line or ENV_VAR=<path|1>; "1" picks a
+    # timestamped file in the home directory.
+    val = None
+    for arg in sys.argv[1:]:
+        if arg == flag or arg.startswith(flag + "="):
+            val = arg.partition("=")[2] or "1"
+    if val is None:
+        val = os.environ.get(env_var, "")
+    if not val or val == "0":
+        return None
+    if val == "1":
+        return Path.home() / f"echo_trace_{time.strftime('%Y%m%d_%H%M%S')}{suffix}"
+    return Path(val)
+
+def _create_display(vsync: bool):
+    # vsync needs a renderer-backed window (SCALED); fall back to a plain window if the driver refuses.
+    if vsync:
+        try:
+            return pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SCALED, vsync=1), True
+        except Exception as e:
+            print(f"VSync unavailable: {e}")
+    return pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT)), False
+
 
 def main():
-    pygame.init()
+    # Only the subsystems the client uses; pygame.init() would also open audio/joystick devices.
+    pygame.display.init()
+    pygame.font.init()
     # Enable IME-friendly text input (TEXTINPUT) so Chinese/Japanese input works.
     pygame.key.start_text_input()
-    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+    persisted = _load_client_state()
+    fps_cap = persisted.get("fps_cap", FPS_CAP)
+    screen, vsync = _create_display(bool(persisted.get("vsync", False)))
     pygame.display.set_caption("Echo Trace Client [Alpha 0.5]")
-    clock = pygame.time.Clock()
+    pacer = FramePacer(fps_cap=fps_cap if isinstance(fps_cap, int) else FPS_CAP, vsync=vsync)
+    stepper = FixedTimestep()
 
     recv_q = queue.Queue()
     net = None
 
-    persisted = _load_client_state()
     persisted_session_id = str(persisted.get("session_id") or "")
     persisted_name = str(persisted.get("name") or "")
     persisted_last_room_id = str(persisted.get("last_room_id") or "")
 
     state = GameState()
     renderer = Renderer(screen)
+    renderer.frame_pacer = pacer
+    profiler = ProfilerOverlay()
+    trace_path = _opt_in_path("--trace", tracing.ENV_VAR, ".trace.json")
+    record_path = _opt_in_path("--record", recording.ENV_VAR, ".etrec")
+    recorder = recording.SessionRecorder(record_path) if record_path else None
+    if trace_path:
+        profiler.timer.tracer = tracing.enable()
+        renderer.stage_timer = profiler.timer
+    if isinstance(persisted.get("render_scale"), (int, float)):
+        renderer.render_scale = float(persisted["render_scale"])
     if str(persisted.get("server_url") or ""):
         renderer.server_input = str(persisted.get("server_url") or renderer.server_input)
     if persisted_name:
@@ -55,6 +104,7 @@ def main():
     # Cold-start resume is gated: user must provide Resume ID (session_id) on CONNECT.
     renderer.resume_id_input = ""
     input_dir = [0, 0]
+    room_list_refresh_t = 0.0
 
     def _append_text(dst: str, text: str, max_len: int = 120) -> str:
         if not text:
@@ -69,11 +119,27 @@ def main():
         return out
 
     running = True
+    dt = pacer.dt
     while running:
-        dt = 1.0 / 60.0
+        profiler.begin_frame()
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            pacer.handle_event(event)
+
+            # Debug profiler overlay, available in any screen once dev mode is on.
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3 and renderer.dev_mode:
+                profiler.set_visible(not profiler.visible)
+                renderer.stage_timer = profiler.timer if profiler.recording else None
+                continue
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F4 and profiler.visible:
+                try:
+                    path = profiler.dump_csv()
+                    print(f"Profile written to {path}")
+                    profiler.notify(f"CSV: {path}")
+                except Exception as e:
+                    profiler.notify(f"CSV failed: {e}")
+                continue
             
             # --- State: CONNECT ---
             if renderer.state == "CONNECT":
@@ -86,7 +152,7 @@ def main():
                         print(f"Connecting to {url}...")
                         try:
                             # Only resume when Resume ID is explicitly provided.
-                            net = NetworkClient(url, recv_q, session_id=(resume_id or ""), player_name=persisted_name)
+                            net = NetworkClient(url, recv_q, session_id=(resume_id or ""), player_name=persisted_name, recorder=recorder)
                             if resume_id and persisted_last_room_id:
                                 net.set_auto_join(persisted_last_room_id)
                             net.start()
@@ -134,7 +200,7 @@ def main():
                     elif renderer.menu_rects.get("join").collidepoint(event.pos):
                         renderer.menu_message = ""
                         if net:
-                            net.send({"type": 1013, "payload": {}})
+                            net.send(protocol.ListRooms())
                             renderer.state = "ROOM_LIST"
                 continue
 
@@ -144,52 +210,50 @@ def main():
                     if event.key == pygame.K_ESCAPE:
                         renderer.state = "MENU"
                     elif event.key == pygame.K_r:
-                        if net: net.send({"type": 1013, "payload": {}})
+                        if net: net.send(protocol.ListRooms())
+                    elif event.key == pygame.K_f:
+                        renderer.room_index.cycle_phase_filter()
+                        renderer.room_list_scroll = 0
+                        renderer.room_list_clamp()
+                    elif event.key == pygame.K_o:
+                        renderer.room_index.toggle_open_only()
+                        renderer.room_list_scroll = 0
+                        renderer.room_list_clamp()
+                    elif event.key == pygame.K_s:
+                        renderer.room_index.cycle_sort()
+                        renderer.room_list_scroll = 0
+                        renderer.room_list_clamp()
                     elif event.key == pygame.K_UP:
-                        renderer.room_list_selected = max(0, renderer.room_list_selected - 1)
-                        if renderer.room_list_selected < renderer.room_list_scroll:
-                            renderer.room_list_scroll = max(0, renderer.room_list_selected)
+                        renderer.room_list_move(-1)
                     elif event.key == pygame.K_DOWN:
-                        renderer.room_list_selected = min(max(0, len(renderer.rooms) - 1), renderer.room_list_selected + 1)
-                        visible = 10
-                        if renderer.room_list_selected >= renderer.room_list_scroll + visible:
-                            renderer.room_list_scroll = max(0, renderer.room_list_selected - visible + 1)
+                        renderer.room_list_move(1)
                     elif event.key == pygame.K_RETURN:
-                        if renderer.rooms and renderer.room_list_selected < len(renderer.rooms):
-                            rid = renderer.rooms[renderer.room_list_selected].get("room_id")
-                            if rid and net:
-                                payload = {"room_id": rid}
-                                if persisted_session_id:
-                                    payload["session_id"] = persisted_session_id
-                                if persisted_name:
-                                    payload["name"] = persisted_name
-                                net.send({"type": 1011, "payload": payload})
+                        rid = renderer.room_list_selected_id
+                        if rid and renderer.room_list_selected_room() and net:
+                            net.send(protocol.JoinRoom(room_id=rid, session_id=persisted_session_id or None,
+                                                          name=persisted_name or None))
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if renderer.room_list_refresh_rect and renderer.room_list_refresh_rect.collidepoint(event.pos):
-                        if net: net.send({"type": 1013, "payload": {}})
+                        if net: net.send(protocol.ListRooms())
                         continue
                     if renderer.room_list_back_rect and renderer.room_list_back_rect.collidepoint(event.pos):
                         renderer.state = "MENU"
                         continue
-                    for idx, rect in getattr(renderer, "room_list_row_rects", []):
-                        if rect.collidepoint(event.pos):
-                            renderer.room_list_selected = idx
+                    if event.button == 1 and renderer.room_list_click_header(event.pos):
+                        continue
+                    for rid, rect in renderer.room_list_row_rects:
+                        if event.button == 1 and rect.collidepoint(event.pos):
+                            renderer.room_list_selected_id = rid
                             # double click / click-to-join convenience
-                            if net and idx < len(renderer.rooms):
-                                rid = renderer.rooms[idx].get("room_id")
-                                if rid:
-                                    payload = {"room_id": rid}
-                                    if persisted_session_id:
-                                        payload["session_id"] = persisted_session_id
-                                    if persisted_name:
-                                        payload["name"] = persisted_name
-                                    net.send({"type": 1011, "payload": payload})
+                            if net:
+                                net.send(protocol.JoinRoom(room_id=rid, session_id=persisted_session_id or None,
+                                                              name=persisted_name or None))
                             break
                     # Mouse wheel (older pygame)
                     if event.button in (4, 5):
-                        renderer.room_list_scroll = max(0, renderer.room_list_scroll + (-1 if event.button == 4 else 1))
+                        renderer.room_list_scroll_by(-1 if event.button == 4 else 1)
                 elif event.type == pygame.MOUSEWHEEL:
-                    renderer.room_list_scroll = max(0, renderer.room_list_scroll - event.y)
+                    renderer.room_list_scroll_by(-event.y)
                 continue
 
             # --- State: CONFIG ---
@@ -202,12 +266,8 @@ def main():
                         else:
                             renderer.menu_message = ""
                             if net:
-                                payload = {"room_name": rn, "config": renderer.config_data}
-                                if persisted_session_id:
-                                    payload["session_id"] = persisted_session_id
-                                if persisted_name:
-                                    payload["name"] = persisted_name
-                                net.send({"type": 1010, "payload": payload})
+                                net.send(protocol.CreateRoom(room_name=rn, config=renderer.config_data,
+                                                                session_id=persisted_session_id or None, name=persisted_name or None))
                         continue
                     if renderer.config_back_rect and renderer.config_back_rect.collidepoint(event.pos):
                         renderer.state = "MENU"
@@ -284,12 +344,8 @@ def main():
                                 else:
                                     renderer.menu_message = ""
                                     if net:
-                                        payload = {"room_name": rn, "config": renderer.config_data}
-                                        if persisted_session_id:
-                                            payload["session_id"] = persisted_session_id
-                                        if persisted_name:
-                                            payload["name"] = persisted_name
-                                        net.send({"type": 1010, "payload": payload})
+                                        net.send(protocol.CreateRoom(room_name=rn, config=renderer.config_data,
+                                                                        session_id=persisted_session_id or None, name=persisted_name or None))
                             else:
                                 # Start/commit row editing
                                 if not renderer.config_rows or renderer.config_selected >= len(renderer.config_rows):
@@ -349,17 +405,30 @@ def main():
                             persisted.pop("last_room_id", None)
                             _save_client_state(persisted)
                             continue
+                        if getattr(state, "is_extracted", False) and renderer.spectator_mode and renderer.spectator_dashboard:
+                            renderer.dashboard_click(event.pos)
+                            continue
                             
                         renderer.handle_click(event.pos)
 
+                spectating = getattr(state, "is_extracted", False) and renderer.spectator_mode
+                if event.type == pygame.MOUSEWHEEL and spectating:
+                    renderer.zoom_step(1 if event.y > 0 else -1)
+
                 if event.type == pygame.KEYDOWN:
+                    if spectating and event.key in (pygame.K_EQUALS, pygame.K_PLUS, pygame.K_KP_PLUS, pygame.K_MINUS, pygame.K_KP_MINUS):
+                        renderer.zoom_step(-1 if event.key in (pygame.K_MINUS, pygame.K_KP_MINUS) else 1)
+                        continue
+                    if spectating and event.key == pygame.K_TAB:
+                        renderer.spectator_dashboard = not renderer.spectator_dashboard
+                        continue
                     if event.key == pygame.K_ESCAPE:
                         renderer.state = "PAUSE"
                         renderer.pause_open()
                         continue
                     
                     if event.key == pygame.K_F9 and renderer.dev_mode:
-                        if net: net.send({"type": 9001, "payload": {}})
+                        if net: net.send(protocol.DevSkipPhaseReq())
 
                     # Gameplay Inputs
                     if not renderer.show_shop:
@@ -368,7 +437,7 @@ def main():
                         elif event.key == pygame.K_a: input_dir[0] = -1
                         elif event.key == pygame.K_d: input_dir[0] = 1
                         elif event.key == pygame.K_e:
-                            if net: net.send({"type": 2004, "payload": {}}) # Pickup
+                            if net: net.send(protocol.PickupReq())
                         elif event.key == pygame.K_f:
                             # Merchant Check
                             near_merchant = False
@@ -377,7 +446,7 @@ def main():
                                     d = ((state.my_pos[0]-ent["pos"]["x"])**2 + (state.my_pos[1]-ent["pos"]["y"])**2)**0.5
                                     if d <= 2.0: near_merchant = True; break
                             if near_merchant: renderer.show_shop = True
-                            elif net: net.send({"type": 2003, "payload": {}}) # Interact
+                            elif net: net.send(protocol.InteractReq())
                         
                         # Number Keys
                         elif event.key >= pygame.K_1 and event.key <= pygame.K_6:
@@ -386,29 +455,29 @@ def main():
                             if state.phase == 0 and not state.tactic_chosen:
                                 if event.key <= pygame.K_3:
                                     t = {pygame.K_1: "RECON", pygame.K_2: "DEFENSE", pygame.K_3: "TRAP"}.get(event.key)
-                                    if net: net.send({"type": 2006, "payload": {"tactic": t}})
+                                    if net: net.send(protocol.ChooseTacticReq(tactic=t))
                                     state.tactic_chosen = True
                             else:
                                 if mods & pygame.KMOD_SHIFT:
-                                    if net: net.send({"type": 2005, "payload": {"slot_index": slot}})
+                                    if net: net.send(protocol.DropReq(slot_index=slot))
                                 elif mods & pygame.KMOD_CTRL or mods & pygame.KMOD_LCTRL:
-                                    if net: net.send({"type": 2008, "payload": {"slot_index": slot}})
+                                    if net: net.send(protocol.SellReq(slot_index=slot))
                                 else:
-                                    if net: net.send({"type": 2002, "payload": {"slot_index": slot}})
+                                    if net: net.send(protocol.UseItemReq(slot_index=slot))
                     else:
                         # Shop is open
                         if event.key == pygame.K_f or event.key == pygame.K_ESCAPE: renderer.show_shop = False
                         elif event.key == pygame.K_r:
-                            if net: net.send({"type": 2009, "payload": {}})
+                            if net: net.send(protocol.ShopRefreshReq())
                         elif event.key >= pygame.K_1 and event.key <= pygame.K_6:
                             idx = event.key - pygame.K_1
                             mods = pygame.key.get_mods()
                             if mods & pygame.KMOD_CTRL or mods & pygame.KMOD_LCTRL:
-                                if net: net.send({"type": 2008, "payload": {"slot_index": idx}})
+                                if net: net.send(protocol.SellReq(slot_index=idx))
                             else:
                                 stock = getattr(state, "shop_stock", []) or []
                                 if idx < len(stock):
-                                    net.send({"type": 2007, "payload": {"item_id": stock[idx]}})
+                                    net.send(protocol.BuyReq(item_id=stock[idx]))
 
                 if event.type == pygame.KEYUP:
                     if event.key in (pygame.K_w, pygame.K_s): input_dir[1] = 0
@@ -456,63 +525,109 @@ def main():
                         renderer.scroll_item_manual(-event.y * 40)
 
                 continue
+        if profiler.visible and not renderer.dev_mode:
+            profiler.set_visible(False)
+            renderer.stage_timer = profiler.timer if profiler.recording else None
+        profiler.mark("events")
+
+        # Fixed-rate update: network apply, input sampling/sending and look/camera smoothing run at
+        # SIM_HZ regardless of how long drawing takes; rendering interpolates with stepper.alpha.
+        step_dt = stepper.step
+        for _ in range(stepper.advance(dt)):
+            state.begin_tick()
+            renderer.begin_tick()
+            # Network
+            if net:
+                while not recv_q.empty():
+                    msg = recv_q.get()
+                    try:
+                        mt, pkt = protocol.decode(msg)
+                    except protocol.ProtocolError as e:
+                        print(f"Protocol error: {e}")
+                        if msg.get("type") == S2C.ERROR_PUSH:
+                            # Errors whose payload is not an object are still shown, as text.
+                            renderer.menu_message = str(msg.get("payload"))
+                        continue
+                    if mt == S2C.LOGIN_RESP:
+                        sid = str(pkt.session_id or "")
+                        if sid:
+                            persisted_session_id = sid
+                            persisted["session_id"] = sid
+                            _save_client_state(persisted)
+                            net.set_identity(session_id=sid)
+                    elif mt == S2C.ROOM_JOINED:
+                        renderer.state = "GAME"
+                        state.config = pkt.config
+                        renderer.menu_message = ""
 
-        # Network
-        if net:
-            while not recv_q.empty():
-                msg = recv_q.get()
-                mt, pl = msg.get("type"), msg.get("payload")
-                if mt == 1001 and isinstance(pl, dict):
-                    sid = str(pl.get("session_id") or "")
-                    if sid:
-                        persisted_session_id = sid
-                        persisted["session_id"] = sid
-                        _save_client_state(persisted)
-                        net.set_identity(session_id=sid)
-                if mt == 1012:
-                    renderer.state = "GAME"
-                    state.config = pl.get("config")
-                    renderer.menu_message = ""
-
-                    # Remember the room_id for reconnect auto-join.
-                    rid = str(pl.get("room_id") or "")
-                    if rid:
-                        persisted_last_room_id = rid
-                        persisted["last_room_id"] = rid
-                        _save_client_state(persisted)
-                        net.set_auto_join(rid)
-
-                    # Ensure server sees our display name after joining.
-                    if persisted_name:
-                        net.send({"type": 1001, "payload": {"name": persisted_name}})
-                elif mt == 3001:
-                    state.map_tiles = pl["map_tiles"]
-                    state.my_pos = [pl["spawn_pos"]["x"], pl["spawn_pos"]["y"]]
-                elif mt == 3002:
-                    state.update_from_server(pl)
-                elif mt == 1014:
-                    renderer.rooms = pl.get("rooms", []) or []
-                    renderer.room_list_selected = 0
-                    renderer.room_list_scroll = 0
-                elif mt == 4001:
-                    renderer.menu_message = (pl.get("msg") if isinstance(pl, dict) else str(pl))
-
-        # Logic
-        if renderer.state == "GAME" and net:
-            renderer.update_look_from_mouse(pygame.mouse.get_pos(), dt, state)
-            if getattr(state, "is_extracted", False) and renderer.spectator_mode:
-                # Free Spectate Camera Movement
-                speed = 10.0 * (1.0/60.0) # approx dt
-                renderer.cam_offset[0] += input_dir[0] * speed
-                renderer.cam_offset[1] += input_dir[1] * speed
-            elif state.phase > 0 and not renderer.show_shop:
-                lx, ly = renderer.get_look_dir()
-                net.send({"type": 2001, "payload": {"dir": {"x": float(input_dir[0]), "y": float(input_dir[1])}, "look_dir": {"x": float(lx), "y": float(ly)}}})
-
-        renderer.draw_game(state)
+                        # Remember the room_id for reconnect auto-join.
+                        rid = str(pkt.room_id or "")
+                        if rid:
+                            persisted_last_room_id = rid
+                            persisted["last_room_id"] = rid
+                            _save_client_state(persisted)
+                            net.set_auto_join(rid)
+
+                        # Ensure server sees our display name after joining.
+                        if persisted_name:
+                            net.send(protocol.LoginReq(name=persisted_name))
+                    elif mt == S2C.GAME_START_PUSH:
+                        state.load_map(pkt)
+                        renderer.minimap.rebuild(state)
+                    elif mt == S2C.GAME_STATE_PUSH:
+                        profiler.mark("net")
+                        state.update_from_server(pkt)
+                        profiler.mark("snapshot")
+                    elif mt == S2C.ROOMS_LIST:
+                        renderer.room_list_merge(pkt.rooms or [])
+                    elif mt == S2C.ERROR_PUSH:
+                        renderer.menu_message = pkt.msg or ""
+                profiler.mark("net")
+
+            # Logic
+            if renderer.state == "GAME" and net:
+                renderer.update_look_from_mouse(pygame.mouse.get_pos(), step_dt, state)
+                if getattr(state, "is_extracted", False) and renderer.spectator_mode:
+                    # Free Spectate Camera Movement
+                    # Tiles/sec in screen terms, so zoomed-out casters pan across big maps faster.
+                    speed = 10.0 * step_dt / renderer.zoom
+                    renderer.cam_offset[0] += input_dir[0] * speed
+                    renderer.cam_offset[1] += input_dir[1] * speed
+                elif state.phase > 0 and not renderer.show_shop:
+                    lx, ly = renderer.get_look_dir()
+                    net.send(protocol.MoveReq(dir=input_dir, look_dir=(lx, ly)))
+            elif renderer.state == "ROOM_LIST" and net and ROOM_LIST_REFRESH_SEC > 0:
+                # The browser stays live: re-request the list periodically and merge it in place.
+                room_list_refresh_t += step_dt
+                if room_list_refresh_t >= ROOM_LIST_REFRESH_SEC:
+                    room_list_refresh_t = 0.0
+                    net.send(protocol.ListRooms())
+            profiler.mark("logic")
+
+        renderer.draw_game(state, alpha=stepper.alpha)
+        profiler.mark("draw")
+        profiler.draw(screen, renderer.mono_font, pacer)
+        profiler.mark("profiler")
         pygame.display.flip()
-        clock.tick(60)
-
+        profiler.mark("flip")
+        profiler.end_frame()
+        # Menus/PAUSE don't need the full frame rate; the measured dt feeds the fixed-step accumulator.
+        with tracing.span("pacer.tick"):
+            dt = pacer.tick(idle=(renderer.state != "GAME"))
+
+    if persisted.get("fps_cap", FPS_CAP) != pacer.fps_cap or persisted.get("render_scale", RENDER_SCALE) != renderer.render_scale:
+        persisted["fps_cap"] = pacer.fps_cap
+        persisted["render_scale"] = renderer.render_scale
+        _save_client_state(persisted)
+    _state_writer.close()
+    if recorder:
+        recorder.close()
+        print(f"Recording written to {recorder.path} ({recorder.packets} packets)")
+    if trace_path:
+        try:
+            print(f"Trace written to {tracing.get_tracer().export(trace_path)}")
+        except Exception as e:
+            print(f"Trace export failed: {e}")
     pygame.quit()
     sys.exit()
 
@@ -0,0 +1,310 @@
+"""Generate client/protocol.py from the repo-root protocol.json.
+
+Every entry under "packets" becomes a slotted class with to_payload / to_msg encoders, a
+from_payload decoder and validate(); "packet_types" becomes the C2S / S2C code namespaces,
+and the decoders are collected into per-direction dispatch tables. Field types are the
+leading token of each spec string ("Vector2 (normalized)" -> Vector2); a field is required
+only when its spec says so. Packets listed in RAW_DECODE skip the packet object on the
+decode side and hand back the parsed JSON payload as-is (validated only on request).
+
+    cd frontend
+    python -m tools.gen_protocol            # rewrite client/protocol.py
+    python -m tools.gen_protocol --check    # exit 1 if client/protocol.py is stale
+"""
+import argparse
+import json
+import keyword
+import re
+import sys
+from pathlib import Path
+
+FRONTEND_DIR = Path(__file__).resolve().parents[1]
+SPEC_PATH = FRONTEND_DIR.parent / "protocol.json"
+OUT_PATH = FRONTEND_DIR / "client" / "protocol.py"
+
+# GameState.load_map / update_from_server consume these payload dicts directly; 3002 arrives
+# every tick, so a packet object per snapshot would be pure garbage.
+RAW_DECODE = ("S2C_GAME_START_PUSH", "S2C_GAME_STATE_PUSH")
+
+_TYPE_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*(\[\])*")
+
+_RUNTIME = '''
+class ProtocolError(ValueError):
+    pass
+
+
+_SCALARS = {"string": str, "int": int, "int64": int, "float64": (int, float), "bool": bool, "object": dict}
+
+
+def _vec2(v):
+    if isinstance(v, dict):
+        return {"x": float(v["x"]), "y": float(v["y"])}
+    return {"x": float(v[0]), "y": float(v[1])}
+
+
+def _check(errors, path, value, ftype):
+    if ftype.endswith("[]"):
+        if not isinstance(value, list):
+            errors.append(f"{path}: expected {ftype}, got {type(value).__name__}")
+            return
+        inner = ftype[:-2]
+        for i, v in enumerate(value):
+            _check(errors, f"{path}[{i}]", v, inner)
+        return
+    model = MODELS.get(ftype)
+    if model is not None:
+        if isinstance(value, (tuple, list)) and ftype == "Vector2" and len(value) == 2:
+            value = {"x": value[0], "y": value[1]}
+        if not isinstance(value, dict):
+            errors.append(f"{path}: expected {ftype}, got {type(value).__name__}")
+            return
+        for key, sub in model:
+            if key in value:
+                _check(errors, f"{path}.{key}", value[key], sub)
+        return
+    py = _SCALARS.get(ftype)
+    if py is None:
+        return
+    if not isinstance(value, py) or (isinstance(value, bool) and ftype != "bool"):
+        errors.append(f"{path}: expected {ftype}, got {type(value).__name__}")
+
+
+def _raw(p):
+    return p
+
+
+def _validate(pkt):
+    errors = []
+    for attr, key, ftype, required in pkt.FIELDS:
+        value = getattr(pkt, attr)
+        if value is None:
+            if required:
+                errors.append(f"{key}: required")
+        else:
+            _check(errors, key, value, ftype)
+    return errors
+'''
+
+_DECODE = '''
+
+_TABLES = {"C2S": (C2S_PACKETS, C2S_DECODERS), "S2C": (S2C_PACKETS, S2C_DECODERS)}
+
+
+def decode(msg, validate=False, direction="S2C"):
+    """Decode a parsed frame into (type, packet); unknown types give (type, None).
+
+    Raw-decoded packets (3001, 3002) come back as the payload dict itself.
+    """
+    packets, decoders = _TABLES[direction]
+    mt = msg.get("type")
+    dec = decoders.get(mt)
+    if dec is None:
+        return mt, None
+    pl = msg.get("payload")
+    cls = packets[mt]
+    if cls.FIELDS and not isinstance(pl, dict):
+        raise ProtocolError(f"{mt}: payload is {type(pl).__name__}, expected object")
+    pkt = dec(pl)
+    if validate:
+        errors = (pkt if isinstance(pkt, cls) else cls.from_payload(pkt)).validate()
+        if errors:
+            raise ProtocolError(f"{mt}: " + "; ".join(errors))
+    return mt, pkt
+'''
+
+
+def field_type(spec):
+    if isinstance(spec, dict):
+        return "object"
+    if isinstance(spec, list):
+        return (field_type(spec[0]) if spec else "object") + "[]"
+    m = _TYPE_RE.match(spec.strip())
+    return m.group(0) if m else "object"
+
+
+def is_required(spec):
+    return isinstance(spec, str) and "required" in spec
+
+
+def class_name(packet):
+    return "".join(part.capitalize() for part in packet.split("_")[1:])
+
+
+def attr_name(key):
+    return key + "_" if keyword.iskeyword(key) or key == "self" else key
+
+
+def _tuple(items):
+    items = list(items)
+    return "(" + ", ".join(items) + ("," if len(items) == 1 else "") + ")"
+
+
+def _encode_expr(attr, ftype):
+    if ftype == "Vector2":
+        return f"_vec2(self.{attr})"
+    return f"self.{attr}"
+
+
+def gen_packet(name, body, out):
+    code = body["type"]
+    direction = name.split("_", 1)[0]
+    cls = class_name(name)
+    payload = body.get("payload", {})
+    desc = body.get("desc")
+    out.append("")
+    out.append("")
+    out.append(f"class {cls}:")
+    out.append(f'    """{name} ({code}).{" " + desc if desc else ""}"""')
+    if not isinstance(payload, dict):
+        # Opaque payload: carried through untouched.
+        out += [
+            '    __slots__ = ("payload",)',
+            f"    TYPE = {code}",
+            f'    DIRECTION = "{direction}"',
+            "    FIELDS = ()",
+            "",
+            "    def __init__(self, payload=None):",
+            "        self.payload = payload",
+            "",
+            "    def to_payload(self):",
+            "        return self.payload if self.payload is not None else {}",
+            "",
+            "    def to_msg(self):",
+            f'        return {{"type": {code}, "payload": self.to_payload()}}',
+            "",
+            "    @classmethod",
+            "    def from_payload(cls, p):",
+            "        return cls(p)",
+            "",
+            "    def validate(self):",
+            "        return []",
+            "",
+            "    def __repr__(self):",
+            f'        return f"{cls}({{self.payload!r}})"',
+        ]
+        return cls, direction, code
+    fields = [(attr_name(k), k, field_type(v), is_required(v)) for k, v in payload.items()]
+    slots = _tuple(f'"{a}"' for a, _, _, _ in fields)
+    out.append(f"    __slots__ = {slots}")
+    out.append(f"    TYPE = {code}")
+    out.append(f'    DIRECTION = "{direction}"')
+    if fields:
+        out.append("    FIELDS = (")
+        for a, k, t, r in fields:
+            out.append(f'        ("{a}", "{k}", "{t}", {r}),')
+        out.append("    )")
+    else:
+        out.append("    FIELDS = ()")
+    out.append("")
+    args = "".join(f", {a}=None" for a, _, _, _ in fields)
+    out.append(f"    def __init__(self{args}):")
+    for a, _, _, _ in fields:
+        out.append(f"        self.{a} = {a}")
+    if not fields:
+        out.append("        pass")
+    out.append("")
+    out.append("    def to_payload(self):")
+    if fields:
+        out.append("        p = {}")
+        for a, k, t, _ in fields:
+            out.append(f"        if self.{a} is not None:")
+            out.append(f'            p["{k}"] = {_encode_expr(a, t)}')
+        out.append("        return p")
+    else:
+        out.append("        return {}")
+    out.append("")
+    out.append("    def to_msg(self):")
+    out.append(f'        return {{"type": {code}, "payload": self.to_payload()}}')
+    out.append("")
+    out.append("    @classmethod")
+    out.append("    def from_payload(cls, p):")
+    if fields:
+        gets = ", ".join(f'p.get("{k}")' for _, k, _, _ in fields)
+        out.append(f"        return cls({gets})")
+    else:
+        out.append("        return cls()")
+    out.append("")
+    out.append("    def validate(self):")
+    out.append("        return _validate(self)" if fields else "        return []")
+    out.append("")
+    out.append("    def __repr__(self):")
+    if fields:
+        parts = ", ".join(f"{a}={{self.{a}!r}}" for a, _, _, _ in fields)
+        out.append(f'        return f"{cls}({parts})"')
+    else:
+        out.append(f'        return "{cls}()"')
+    return cls, direction, code
+
+
+def generate(spec):
+    out = [
+        "# Generated by tools/gen_protocol.py from protocol.json; do not edit by hand.",
+        "# Regenerate with:  cd frontend && python -m tools.gen_protocol",
+        f"# Protocol version {spec.get('meta', {}).get('version', '?')}",
+    ]
+    for direction in ("C2S", "S2C"):
+        out += ["", ""]
+        out.append(f"class {direction}:")
+        for name, code in spec["packet_types"][direction].items():
+            out.append(f"    {name} = {code}")
+    out += ["", ""]
+    out.append("MODELS = {")
+    for name, fields in spec.get("models", {}).items():
+        pairs = _tuple(f'("{k}", "{field_type(v)}")' for k, v in fields.items())
+        out.append(f'    "{name}": {pairs},')
+    out.append("}")
+    out.append(_RUNTIME.rstrip("\n"))
+
+    classes = []
+    seen = set()
+    for name, body in spec["packets"].items():
+        cls = class_name(name)
+        if cls in seen:
+            raise SystemExit(f"duplicate packet class name {cls} ({name})")
+        seen.add(cls)
+        classes.append((name,) + gen_packet(name, body, out))
+
+    out += ["", ""]
+    for direction in ("C2S", "S2C"):
+        out.append(f"{direction}_PACKETS = {{")
+        for name, cls, d, code in classes:
+            if d == direction:
+                out.append(f"    {code}: {cls},")
+        out.append("}")
+    for direction in ("C2S", "S2C"):
+        out.append(f"{direction}_DECODERS = {{")
+        for name, cls, d, code in classes:
+            if d != direction:
+                continue
+            dec = "_raw" if name in RAW_DECODE else f"{cls}.from_payload"
+            out.append(f"    {code}: {dec},")
+        out.append("}")
+    out.append(_DECODE.rstrip("\n"))
+    return "\n".join(out) + "\n"
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--spec", default=str(SPEC_PATH))
+    ap.add_argument("--out", default=str(OUT_PATH))
+    ap.add_argument("--check", action="store_true", help="do not write; exit 1 if the output is stale")
+    args = ap.parse_args(argv)
+
+    with open(args.spec, "r", encoding="utf-8") as f:
+        spec = json.load(f)
+    code = generate(spec)
+    out = Path(args.out)
+    current = out.read_text(encoding="utf-8") if out.exists() else None
+    if args.check:
+        if current != code:
+            print(f"{out} is out of date; run python -m tools.gen_protocol", file=sys.stderr)
+            return 1
+        return 0
+    if current != code:
+        out.write_text(code, encoding="utf-8")
+        print(f"wrote {out}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())